@@ -0,0 +1,58 @@
+"""
+Compares the installed JSON decoders on response bodies
+
+    python benchmarks/decode_bench.py [recorded.json ...]
+
+Recorded bodies can be saved from any endpoint, for example `/v1/mods/search` or
+`/v1/minecraft/modloader?includeAll=true`. Without any, synthetic search pages are used.
+"""
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from curse_api.decoders import DECODERS  # noqa: E402
+from payloads import make_mod  # noqa: E402
+
+
+def synthetic_payloads():
+    page = {
+        "data": [make_mod(i + 1) for i in range(50)],
+        "pagination": {"index": 0, "pageSize": 50, "resultCount": 50, "totalCount": 50},
+    }
+    return {"search page (50 mods)": json.dumps(page).encode()}
+
+
+def main(paths):
+    payloads = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            payloads[os.path.basename(path)] = f.read()
+    payloads = payloads or synthetic_payloads()
+
+    for name, body in payloads.items():
+        print(f"{name}: {len(body) / 1024:.1f} KiB")
+        timings = {}
+        for decoder, load in DECODERS.items():
+            try:
+                decode = load()
+            except ImportError:
+                print(f"  {decoder:>8}: not installed")
+                continue
+            best = min(timeit.repeat(lambda: decode(body), number=100, repeat=5))
+            timings[decoder] = best / 100
+
+        for decoder, per_call in timings.items():
+            speedup = timings["json"] / per_call
+            print(
+                f"  {decoder:>8}: {per_call * 1e6:9.1f} us"
+                f"  {len(body) / per_call / 1e6:7.1f} MB/s  x{speedup:.2f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+"""
+Checks the installed fingerprint hashers against each other and measures their throughput
+
+    python benchmarks/fingerprint_bench.py [mod.jar ...]
+
+Without any files a synthetic 32 MiB file is used. `pip install curse-api[murmurhash2]` adds a native hasher.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, ROOT)
+
+from curse_api.fingerprint import HASHERS, fingerprint_file  # noqa: E402
+
+
+def synthetic_file(size: int) -> str:
+    rng = random.Random(0)
+    # jars are zip archives, roughly 3% of their bytes are whitespace values
+    data = bytearray(rng.getrandbits(8) for _ in range(1 << 16))
+    data = bytes(data) * (size // len(data))
+    fd, path = tempfile.mkstemp(suffix=".jar")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
+
+def main(paths):
+    temporary = not paths
+    paths = paths or [synthetic_file(32 << 20)]
+    try:
+        for path in paths:
+            size = os.path.getsize(path)
+            print(f"{os.path.basename(path)}: {size / 2 ** 20:.1f} MiB")
+            results = {}
+            hashers = {"default": None}
+            for name, load in HASHERS.items():
+                try:
+                    hashers[name] = load()
+                except ImportError:
+                    print(f"  {name:>12}: not installed")
+            for name, hasher in hashers.items():
+                start = time.perf_counter()
+                results[name] = fingerprint_file(path, hasher=hasher)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"  {name:>12}: {results[name]:>10}"
+                    f"  {elapsed:7.3f} s  {size / elapsed / 1e6:7.1f} MB/s"
+                )
+            if len(set(results.values())) > 1:
+                raise SystemExit(f"hashers disagree on {path}: {results}")
+            print()
+    finally:
+        if temporary:
+            os.remove(paths[0])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
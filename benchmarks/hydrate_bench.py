@@ -0,0 +1,62 @@
+"""
+Compares the hydration modes of models by time and peak memory
+
+    python benchmarks/hydrate_bench.py [recorded.json ...]
+
+Recorded bodies should be search pages or `/v1/mods` responses, with a `data` list of mods.
+Without any, a synthetic search page is used.
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+from curse_api.models import Hydration, Mod  # noqa: E402
+from payloads import make_mod  # noqa: E402
+
+
+def main(paths):
+    payloads = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            payloads[os.path.basename(path)] = json.load(f)["data"]
+    payloads = payloads or {
+        "search page (50 mods)": [make_mod(i + 1) for i in range(50)]
+    }
+
+    for name, mods in payloads.items():
+        print(f"{name}: {len(mods)} mods")
+        timings = {}
+        peaks = {}
+        for hydration in Hydration:
+            tracemalloc.start()
+            hydrated = [Mod.hydrate(i, hydration) for i in mods]
+            peaks[hydration] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del hydrated
+
+            best = min(
+                timeit.repeat(
+                    lambda: [Mod.hydrate(i, hydration) for i in mods],
+                    number=20,
+                    repeat=5,
+                )
+            )
+            timings[hydration] = best / 20
+
+        for hydration, per_call in timings.items():
+            speedup = timings[Hydration.validate] / per_call
+            print(
+                f"  {hydration.value:>8}: {per_call * 1e3:8.2f} ms"
+                f"  {len(mods) / per_call:9.0f} mods/s  x{speedup:.2f}"
+                f"  peak {peaks[hydration] / 1024:8.1f} KiB"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,9 +1,13 @@
-from .api import CurseAPI, SimpleCurseAPI
-from .enums import Games, ModLoaderType, ModsSearchSortField
-from .models import File, MinecraftGameVersion, Mod, Pagination
-from .categories import (
-    Minecraft_Categories,
-)  # Open to suggestions on what categories to import
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .api import CurseAPI, SimpleCurseAPI
+    from .enums import Games, ModLoaderType, ModsSearchSortField
+    from .models import File, MinecraftGameVersion, Mod, Pagination
+    from .categories import (
+        Minecraft_Categories,
+    )  # Open to suggestions on what categories to import
 
 __all__ = [
     "CurseAPI",
@@ -14,3 +18,30 @@ __all__ = [
     "ModLoaderType",
     "Minecraft_Categories",
 ]
+
+# submodules are imported on first access, keeping `import curse_api` cheap
+_LAZY: Dict[str, str] = {
+    "CurseAPI": ".api",
+    "SimpleCurseAPI": ".api",
+    "Games": ".enums",
+    "ModLoaderType": ".enums",
+    "ModsSearchSortField": ".enums",
+    "File": ".models",
+    "MinecraftGameVersion": ".models",
+    "Mod": ".models",
+    "Pagination": ".models",
+    "Minecraft_Categories": ".categories",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY))
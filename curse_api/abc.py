@@ -23,3 +23,16 @@ class APIFactory(metaclass=ABCMeta):
     @abstractmethod
     async def download(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
         ...
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Yields the raw body of an API response as it is received.
+        GET params are sent as the query, POST params as the JSON body.
+        Optional, factories without support raise NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
@@ -1,26 +1,43 @@
+import asyncio
+import warnings
+from collections import deque
 from typing import (
     Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
     Dict,
     List,
     Optional,
     Tuple,
     Type,
+    TYPE_CHECKING,
     TypeVar,
+    Union,
 )
 from enum import Enum
-from .categories import BaseCategory
 
 from .abc import APIFactory
+from .streaming import iter_array
+from .tables import FileTable, ModTable, Row, Table
+from .transport import TransportConfig
+from .errors import MissingResourcesException
 from .enums import (
     Games,
     ModLoaderType,
     ModsSearchSortField,
     SortOrder,
 )
+
 from .models import (
     BaseCurseModel,
+    Category,
     File,
+    FingerprintFuzzyMatchResult,
     FingerprintsMatchesResult,
+    FolderFingerprint,
+    Hydration,
     MinecraftGameVersion,
     MinecraftModLoaderIndex,
     MinecraftModLoaderVersion,
@@ -28,12 +45,46 @@ from .models import (
     Pagination,
 )
 
+if TYPE_CHECKING:
+    from .categories import BaseCategory
+    from .diskcache import DiskCache
+
 """
 TODO: write more doc strings
 """
 
+T = TypeVar("T")
 U = TypeVar("U", bound=BaseCurseModel)
 
+# CurseForge rejects any page where `index + pageSize` is greater than this
+INDEX_CAP = 10_000
+# The default number of ids sent per bulk request
+BULK_CHUNK_SIZE = 500
+
+
+def _merge_fingerprint_matches(chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """joins the raw `FingerprintsMatchesResult` of each chunk of a request"""
+    merged: Dict[str, Any] = {
+        "isCacheBuilt": all(i["isCacheBuilt"] for i in chunks),
+        "partialMatchFingerprints": {},
+        "unmatchedFingerprints": None,
+    }
+    for key in (
+        "exactMatches",
+        "exactFingerprints",
+        "partialMatches",
+        "installedFingerprints",
+    ):
+        merged[key] = [j for i in chunks for j in i[key]]
+    for i in chunks:
+        if isinstance(i.get("partialMatchFingerprints"), dict):
+            merged["partialMatchFingerprints"].update(i["partialMatchFingerprints"])
+        if i.get("unmatchedFingerprints") is not None:
+            merged["unmatchedFingerprints"] = (
+                merged["unmatchedFingerprints"] or []
+            ) + i["unmatchedFingerprints"]
+    return merged
+
 
 # TODO: fix passing in enums
 class CurseAPI:
@@ -45,17 +96,27 @@ class CurseAPI:
     def __init__(
         self,
         client: "APIFactory",
+        store: Optional["DiskCache"] = None,
+        hydration: Hydration = Hydration.validate,
     ) -> None:
         """The main factory for handling requests
         accepts additional kwargs passing to the creation of the factory
 
         Args:
             client: An instance of an client wrapper. Use `SimpleCurseAPI` to skip manual client instantiation.
+            store: A persistent cache consulted for immutable data such as files and changelogs. Defaults to None.
+            hydration: How responses are turned into models. `Hydration.trusted` skips validation. Defaults to `Hydration.validate`.
 
         """
         if not issubclass(type(client), APIFactory):
             raise TypeError("factory or session must be provided")
         self._api: "APIFactory" = client
+        self._store = store
+        self.hydration = hydration
+
+    @property
+    def store(self) -> Optional["DiskCache"]:
+        return self._store
 
     @property
     def api(self):
@@ -66,38 +127,54 @@ class CurseAPI:
         Use `get_specific_minecraft_version` with the game version string to get more detailed data.
         """
         res = await self._api.get("/v1/minecraft/version")
-        return self.hydrate_list(res["data"], MinecraftGameVersion)
+        return self.hydrate_list(res["data"], MinecraftGameVersion, self.hydration)
 
     async def get_specific_minecraft_version(
         self, gameVersionString: str
     ) -> MinecraftGameVersion:
-        res = await self._api.get(f"/v1/minecraft/version/{gameVersionString}")
-
-        return self.hydrate(res["data"], MinecraftGameVersion)
+        data = await self._stored(
+            "minecraft_version",
+            gameVersionString,
+            f"/v1/minecraft/version/{gameVersionString}",
+        )
+        return self.hydrate(data, MinecraftGameVersion, self.hydration)
 
     async def modloader_versions(self) -> List[MinecraftModLoaderIndex]:
         """
         Returns all minecraft modloader data from curseforge.
         Use `get_specific_minecraft_modloader` with the slug to get more detailed data.
         """
+        # aiohttp does not accept booleans in params
         res = await self._api.get(
-            "/v1/minecraft/modloader", params={"includeAll": True}
+            "/v1/minecraft/modloader", params={"includeAll": "true"}
         )
 
-        return self.hydrate_list(res["data"], MinecraftModLoaderIndex)
+        return self.hydrate_list(res["data"], MinecraftModLoaderIndex, self.hydration)
+
+    async def stream_modloader_versions(self) -> AsyncIterator[MinecraftModLoaderIndex]:
+        """Like `modloader_versions` but yields each modloader as soon as it is received,
+        without buffering the whole response. Requires a factory supporting `APIFactory.stream`.
+        """
+        async for i in self._stream(
+            "GET",
+            "/v1/minecraft/modloader",
+            {"includeAll": "true"},
+            MinecraftModLoaderIndex,
+        ):
+            yield i
 
     async def get_specific_minecraft_modloader(
         self, modLoaderName: str
     ) -> MinecraftModLoaderVersion:
         res = await self._api.get(f"/v1/minecraft/modloader/{modLoaderName}")
 
-        return self.hydrate(res["data"], MinecraftModLoaderVersion)
+        return self.hydrate(res["data"], MinecraftModLoaderVersion, self.hydration)
 
     async def search_mods(
         self,
         gameId: Games = Games.minecraft,
         classId: Optional[int] = None,
-        categoryId: Optional[BaseCategory] = None,
+        categoryId: Optional["BaseCategory"] = None,
         gameVersion: Optional[str] = None,
         searchFilter: Optional[str] = None,
         sortField: Optional[ModsSearchSortField] = None,
@@ -107,7 +184,8 @@ class CurseAPI:
         slug: Optional[str] = None,
         index: Optional[int] = 0,
         pageSize: Optional[int] = 50,
-    ) -> Tuple[List[Mod], Pagination]:
+        table: bool = False,
+    ) -> Tuple[Union[List[Mod], ModTable], Pagination]:
         """https://docs.curseforge.com/#search-mods
 
 
@@ -124,9 +202,10 @@ class CurseAPI:
             slug (str, optional): Filter by slug (coupled with classId will result in a unique result). Defaults to None.
             index (int, optional): A zero based index of the first item to include in the response. Defaults to 0.
             pageSize (int, optional): The number of items to include in the response. Defaults to 50.
+            table (bool, optional): Return the mods as a compact `ModTable`. Defaults to False.
 
         Returns:
-            tuple[List[Mod], Pagination]: A List of mods and pagination data
+            tuple[List[Mod] | ModTable, Pagination]: A List of mods and pagination data
         """
         build = {
             "gameId": gameId.value,
@@ -149,35 +228,229 @@ class CurseAPI:
         )
 
         d = res
-        return self.hydrate_list(d["data"], Mod), self.hydrate(
-            d["pagination"], Pagination
+        mods = (
+            ModTable(d["data"])
+            if table
+            else self.hydrate_list(d["data"], Mod, self.hydration)
         )
+        return mods, self.hydrate(d["pagination"], Pagination, self.hydration)
+
+    async def iter_search_mods(
+        self,
+        gameId: Games = Games.minecraft,
+        classId: Optional[int] = None,
+        categoryId: Optional["BaseCategory"] = None,
+        gameVersion: Optional[str] = None,
+        searchFilter: Optional[str] = None,
+        sortField: Optional[ModsSearchSortField] = None,
+        sortOrder: Optional[SortOrder] = None,
+        modLoaderType: Optional[ModLoaderType] = None,
+        gameVersionTypeId: Optional[int] = None,
+        slug: Optional[str] = None,
+        index: int = 0,
+        pageSize: int = 50,
+        concurrency: int = 4,
+        table: bool = False,
+    ) -> AsyncIterator[Union[Mod, Row[Mod]]]:
+        """Iterates over every mod matching a search, see `search_mods` for the filters.
+        The first page is used to read `totalCount`, the remaining pages are then fetched
+        `concurrency` at a time and yielded in order. Stops at the API index cap.
+
+        Args:
+            index (int, optional): A zero based index of the first item to yield. Defaults to 0.
+            pageSize (int, optional): The number of items fetched per request. Defaults to 50.
+            concurrency (int, optional): The number of pages fetched ahead at once. Defaults to 4.
+            table (bool, optional): Yield rows of compact `ModTable` pages instead of mods. Defaults to False.
+        """
+
+        async def fetch(index: int, pageSize: int):
+            return await self.search_mods(
+                gameId=gameId,
+                classId=classId,
+                categoryId=categoryId,
+                gameVersion=gameVersion,
+                searchFilter=searchFilter,
+                sortField=sortField,
+                sortOrder=sortOrder,
+                modLoaderType=modLoaderType,
+                gameVersionTypeId=gameVersionTypeId,
+                slug=slug,
+                index=index,
+                pageSize=pageSize,
+                table=table,
+            )
+
+        async for mod in self._paginate(fetch, index, pageSize, concurrency):
+            yield mod
 
     async def get_mod(self, modId: int) -> Mod:
         res = await self._api.get(f"/v1/mods/{modId}")
-        return self.hydrate(res["data"], Mod)
+        return self.hydrate(res["data"], Mod, self.hydration)
+
+    async def get_mods(
+        self,
+        modIdList: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        strict: bool = False,
+        table: bool = False,
+    ) -> Union[List[Mod], ModTable]:
+        """Returns the mods of `modIdList` in the same order, duplicate ids are only returned once.
+        Large lists are split into chunks which are requested concurrently.
+
+        Args:
+            modIdList (List[int]): The mod ids to fetch
+            chunk_size (int, optional): The max number of ids per request. Defaults to `BULK_CHUNK_SIZE`.
+            concurrency (int, optional): The max number of requests in flight. Defaults to 4.
+            strict (bool, optional): Raise `MissingResourcesException` instead of warning when ids are missing. Defaults to False.
+            table (bool, optional): Return the mods as a compact `ModTable`. Defaults to False.
+        """
+        return await self._bulk(
+            "/v1/mods",
+            "modIds",
+            modIdList,
+            Mod,
+            chunk_size,
+            concurrency,
+            strict,
+            table=ModTable if table else None,
+        )
+
+    async def stream_mods(
+        self, modIdList: List[int], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> AsyncIterator[Mod]:
+        """Yields the mods of `modIdList` as soon as each is received, in the order the API returns them.
+        Chunks are requested one after another so only one response is in memory.
+        Missing ids are warned about once every chunk was received.
+        Requires a factory supporting `APIFactory.stream`.
 
-    async def get_mods(self, modIdList: List[int]) -> List[Mod]:
-        res = await self._api.post("/v1/mods", params={"modIds": modIdList})
-        return self.hydrate_list(res["data"], Mod)
+        Args:
+            modIdList (List[int]): The mod ids to fetch
+            chunk_size (int, optional): The max number of ids per request. Defaults to `BULK_CHUNK_SIZE`.
+        """
+        async for i in self._stream_bulk(
+            "/v1/mods", "modIds", modIdList, Mod, chunk_size
+        ):
+            yield i
 
     async def get_mod_description(self, modId: int) -> str:
         res = await self._api.get(f"/v1/mods/{modId}/description")
         return res["data"]
 
-    async def get_fingerprints(self, fingerprints: List[int]):
+    async def get_fingerprints(
+        self,
+        fingerprints: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+    ) -> FingerprintsMatchesResult:
         """Only supports addons.
         Minecraft modpacks do not function
-        I dont really know a use for this, but I can easily support it."""
-        res = await self._api.post(
-            "/v1/fingerprints", params={"fingerprints": fingerprints}
+        I dont really know a use for this, but I can easily support it.
+        Fingerprints of local files are computed by `curse_api.fingerprint.fingerprint_file`.
+        Large lists are split into chunks which are requested concurrently, then merged into one result.
+
+        Args:
+            fingerprints (List[int]): The fingerprints to match
+            chunk_size (int, optional): The max number of fingerprints per request. Defaults to `BULK_CHUNK_SIZE`.
+            concurrency (int, optional): The max number of requests in flight. Defaults to 4.
+        """
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("chunk_size and concurrency must be at least 1")
+        unique = list(dict.fromkeys(fingerprints))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: List[int]) -> Dict[str, Any]:
+            async with semaphore:
+                res = await self._api.post(
+                    "/v1/fingerprints", params={"fingerprints": chunk}
+                )
+            return res["data"]
+
+        chunks = await asyncio.gather(
+            *(
+                fetch(unique[i : i + chunk_size])
+                for i in range(0, len(unique), chunk_size)
+            )
         )
+        if len(chunks) == 1:
+            data = chunks[0]
+        else:
+            data = _merge_fingerprint_matches(chunks)
+        return self.hydrate(data, FingerprintsMatchesResult, self.hydration)
 
-        return self.hydrate(res["data"], FingerprintsMatchesResult)
+    async def get_fingerprints_fuzzy(
+        self,
+        gameId: Games,
+        folders: List[FolderFingerprint],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+    ) -> FingerprintFuzzyMatchResult:
+        """https://docs.curseforge.com/#get-fingerprints-fuzzy-matches
+        Matches addon folders by the fingerprints of their files, for games installing folders
+        rather than single files. Folders are packed into as few requests as fit `chunk_size`
+        fingerprints each, which are requested concurrently and merged into one result.
+        Folder fingerprints are computed by `curse_api.ext.DirectoryScanner.scan_folders`.
 
-    async def get_files(self, fileList: List[int]) -> List[File]:
-        res = await self._api.post("/v1/mods/files", params={"fileIds": fileList})
-        return self.hydrate_list(res["data"], File)
+        Args:
+            gameId (Games): The game of the addons
+            folders (List[FolderFingerprint]): The folders to match
+            chunk_size (int, optional): The max number of fingerprints per request, a larger folder is sent alone. Defaults to `BULK_CHUNK_SIZE`.
+            concurrency (int, optional): The max number of requests in flight. Defaults to 4.
+        """
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("chunk_size and concurrency must be at least 1")
+        batches: List[List[Dict[str, Any]]] = []
+        size = 0
+        for folder in folders:
+            count = len(folder.fingerprints)
+            if not batches or size + count > chunk_size:
+                batches.append([])
+                size = 0
+            batches[-1].append(folder.dict())
+            size += count
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                res = await self._api.post(
+                    "/v1/fingerprints/fuzzy",
+                    params={"gameId": gameId.value, "fingerprints": batch},
+                )
+            return res["data"]["fuzzyMatches"]
+
+        chunks = await asyncio.gather(*(fetch(i) for i in batches))
+        data = {"fuzzyMatches": [j for i in chunks for j in i]}
+        return self.hydrate(data, FingerprintFuzzyMatchResult, self.hydration)
+
+    async def get_files(
+        self,
+        fileList: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        strict: bool = False,
+        table: bool = False,
+    ) -> Union[List[File], FileTable]:
+        """Returns the files of `fileList` in the same order, see `get_mods` for the arguments"""
+        return await self._bulk(
+            "/v1/mods/files",
+            "fileIds",
+            fileList,
+            File,
+            chunk_size,
+            concurrency,
+            strict,
+            stored_as="file",
+            table=FileTable if table else None,
+        )
+
+    async def stream_files(
+        self, fileList: List[int], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> AsyncIterator[File]:
+        """Yields the files of `fileList` as soon as each is received, see `stream_mods`"""
+        async for i in self._stream_bulk(
+            "/v1/mods/files", "fileIds", fileList, File, chunk_size
+        ):
+            yield i
 
     async def get_mod_files(
         self,
@@ -187,7 +460,13 @@ class CurseAPI:
         gameVersionTypeId: Optional[int] = None,
         index: int = 0,
         pageSize: int = 50,
-    ) -> Tuple[List[File], Pagination]:
+        table: bool = False,
+    ) -> Tuple[Union[List[File], FileTable], Pagination]:
+        """https://docs.curseforge.com/#get-mod-files
+
+        Args:
+            table (bool, optional): Return the files as a compact `FileTable`. Defaults to False.
+        """
         build = {
             "gameVersion": gameVersion,
             "modLoaderType": modLoaderType,
@@ -200,22 +479,89 @@ class CurseAPI:
             params={k: v for k, v in build.items() if v is not None},
         )
 
-        return self.hydrate_list(res["data"], File), self.hydrate(
-            res["pagination"], Pagination
+        files = (
+            FileTable(res["data"])
+            if table
+            else self.hydrate_list(res["data"], File, self.hydration)
         )
+        return files, self.hydrate(res["pagination"], Pagination, self.hydration)
+
+    async def iter_mod_files(
+        self,
+        modId: int,
+        gameVersion: Optional[str] = None,
+        modLoaderType: Optional[ModLoaderType] = None,
+        gameVersionTypeId: Optional[int] = None,
+        index: int = 0,
+        pageSize: int = 50,
+        concurrency: int = 4,
+        table: bool = False,
+    ) -> AsyncIterator[Union[File, Row[File]]]:
+        """Iterates over every file of a mod, see `get_mod_files` for the filters.
+        Pages after the first are fetched `concurrency` at a time and yielded in order.
+        With `table` rows of compact `FileTable` pages are yielded instead of files.
+        """
+
+        async def fetch(index: int, pageSize: int):
+            return await self.get_mod_files(
+                modId,
+                gameVersion=gameVersion,
+                modLoaderType=modLoaderType,
+                gameVersionTypeId=gameVersionTypeId,
+                index=index,
+                pageSize=pageSize,
+                table=table,
+            )
+
+        async for file in self._paginate(fetch, index, pageSize, concurrency):
+            yield file
 
     async def get_mod_file(self, modId: int, fileId: int) -> File:
+        if self._store is not None:
+            data = await self._in_store(self._store.get, "file", fileId)
+            # a stored file of another mod is left for the API to report
+            if data is not None and data["modId"] == modId:
+                return self.hydrate(data, File, self.hydration)
+
         res = await self._api.get(f"/v1/mods/{modId}/files/{fileId}")
-        return self.hydrate(res["data"], File)
+        if self._store is not None:
+            await self._in_store(self._store.set, "file", fileId, res["data"])
+        return self.hydrate(res["data"], File, self.hydration)
 
     async def get_mod_file_changelog(self, modId: int, fileId: int) -> str:
-        res = await self._api.get(f"/v1/mods/{modId}/files/{fileId}/changelog")
-        return res["data"]
+        return await self._stored(
+            "changelog", fileId, f"/v1/mods/{modId}/files/{fileId}/changelog"
+        )
 
     async def get_mod_file_download_url(self, modId: int, fileId: int) -> str:
         res = await self._api.get(f"/v1/mods/{modId}/files/{fileId}/download-url")
         return res["data"]
 
+    async def get_categories(
+        self,
+        gameId: Games = Games.minecraft,
+        classId: Optional[int] = None,
+        classesOnly: Optional[bool] = None,
+    ) -> List[Category]:
+        """https://docs.curseforge.com/#get-categories
+
+        Args:
+            gameId (Games, optional): The game to list categories of. Defaults to `Games.minecraft`.
+            classId (int, optional): Only list the categories of a class. Defaults to None.
+            classesOnly (bool, optional): Only list classes. Defaults to None.
+        """
+        build = {
+            "gameId": gameId.value,
+            "classId": classId,
+            # aiohttp does not accept booleans in params
+            "classesOnly": None if classesOnly is None else str(classesOnly).lower(),
+        }
+        res = await self._api.get(
+            "/v1/categories",
+            params={k: v for k, v in build.items() if v is not None},
+        )
+        return self.hydrate_list(res["data"], Category, self.hydration)
+
     async def get_games(self) -> Enum:
         res = await self.api.get("/v1/games")
         return Enum("Games", {i["slug"]: i["id"] for i in res["data"]})
@@ -224,14 +570,170 @@ class CurseAPI:
         return await self._api.close()
 
     @staticmethod
-    def hydrate(data: Dict[Any, Any], model: Type[U]):
+    def hydrate(
+        data: Dict[Any, Any], model: Type[U], hydration: Hydration = Hydration.validate
+    ):
         """hydrates a model from a dict"""
-        return model.from_dict(data)
+        return model.hydrate(data, hydration)
 
     @staticmethod
-    def hydrate_list(data: List[Dict[Any, Any]], model: Type[U]):
+    def hydrate_list(
+        data: List[Dict[Any, Any]],
+        model: Type[U],
+        hydration: Hydration = Hydration.validate,
+    ):
         """hydrates a list of models from a list of dicts"""
-        return [model.from_dict(i) for i in data]
+        return [model.hydrate(i, hydration) for i in data]
+
+    async def _bulk(
+        self,
+        url: str,
+        key: str,
+        ids: List[int],
+        model: Type[U],
+        chunk_size: int,
+        concurrency: int,
+        strict: bool,
+        stored_as: Optional[str] = None,
+        table: Optional[Type[Table]] = None,
+    ) -> Any:
+        """posts ids in concurrent chunks, hydrating each chunk as it arrives.
+        With `stored_as` ids are looked up in the store first, and responses are saved to it.
+        With `table` the results are returned as that table instead of a list of models.
+        """
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("chunk_size and concurrency must be at least 1")
+
+        def convert(data: Dict[str, Any]) -> Any:
+            if table is not None:
+                return data
+            return self.hydrate(data, model, self.hydration)
+
+        unique = list(dict.fromkeys(ids))
+        found: Dict[int, Any] = {}
+        if stored_as and self._store is not None:
+            stored = await self._in_store(self._store.get_many, stored_as, unique)
+            for i in unique:
+                if str(i) in stored:
+                    found[i] = convert(stored[str(i)])
+        request = [i for i in unique if i not in found]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: List[int]) -> List[Tuple[int, Any]]:
+            async with semaphore:
+                res = await self._api.post(url, params={key: chunk})
+            if stored_as and self._store is not None:
+                await self._in_store(
+                    self._store.set_many, stored_as, {i["id"]: i for i in res["data"]}
+                )
+            return [(i["id"], convert(i)) for i in res["data"]]
+
+        chunks = await asyncio.gather(
+            *(
+                fetch(request[i : i + chunk_size])
+                for i in range(0, len(request), chunk_size)
+            )
+        )
+        for chunk in chunks:
+            found.update(chunk)
+        results = [found[i] for i in unique if i in found]
+        if table is not None:
+            results = table(results)
+
+        missing = [i for i in unique if i not in found]
+        if missing:
+            if strict:
+                raise MissingResourcesException(missing, results)
+            warnings.warn(
+                f"{url} did not return {len(missing)} of {len(unique)} ids: {missing}",
+                stacklevel=3,
+            )
+        return results
+
+    async def _stream(
+        self, method: str, url: str, params: Optional[dict], model: Type[U]
+    ) -> AsyncIterator[U]:
+        """yields each hydrated element of a streamed `data` array"""
+        async for data in iter_array(self._api.stream(method, url, params)):
+            yield self.hydrate(data, model, self.hydration)
+
+    async def _stream_bulk(
+        self, url: str, key: str, ids: List[int], model: Type[U], chunk_size: int
+    ) -> AsyncIterator[U]:
+        """streams ids chunk by chunk, see `_bulk`"""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        unique = list(dict.fromkeys(ids))
+        found = set()
+        for i in range(0, len(unique), chunk_size):
+            params = {key: unique[i : i + chunk_size]}
+            async for item in self._stream("POST", url, params, model):
+                found.add(item.id)  # type: ignore
+                yield item
+
+        missing = [i for i in unique if i not in found]
+        if missing:
+            warnings.warn(
+                f"{url} did not return {len(missing)} of {len(unique)} ids: {missing}",
+                stacklevel=3,
+            )
+
+    @staticmethod
+    async def _in_store(call: Callable[..., T], *args: Any) -> T:
+        """runs a store call in the default executor, sqlite blocks on disk and other writers"""
+        return await asyncio.get_event_loop().run_in_executor(None, call, *args)
+
+    async def _stored(self, endpoint: str, key: Any, url: str) -> Any:
+        """returns the `data` of a GET, consulting the store first when configured"""
+        if self._store is not None:
+            data = await self._in_store(self._store.get, endpoint, key)
+            if data is not None:
+                return data
+
+        res = await self._api.get(url)
+        if self._store is not None:
+            await self._in_store(self._store.set, endpoint, key, res["data"])
+        return res["data"]
+
+    @staticmethod
+    async def _paginate(
+        fetch: Callable[[int, int], Awaitable[Tuple[List[U], Pagination]]],
+        index: int,
+        pageSize: int,
+        concurrency: int,
+    ) -> AsyncIterator[U]:
+        """yields the items of every page, prefetching up to `concurrency` pages"""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not 0 <= index < INDEX_CAP:
+            raise ValueError(f"index must be between 0 and {INDEX_CAP}")
+
+        items, page = await fetch(index, min(pageSize, INDEX_CAP - index))
+        for i in items:
+            yield i
+
+        end = min(page.totalCount, INDEX_CAP)
+        starts = iter(range(index + pageSize, end, pageSize))
+        pending: Deque[asyncio.Task] = deque()
+
+        def schedule():
+            start = next(starts, None)
+            if start is not None:
+                size = min(pageSize, INDEX_CAP - start)
+                pending.append(asyncio.ensure_future(fetch(start, size)))
+
+        try:
+            for _ in range(concurrency):
+                schedule()
+            while pending:
+                items, _ = await pending.popleft()
+                schedule()
+                for i in items:
+                    yield i
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def download(self, url: str, chunk_size: int = 32):
         return await self._api.download(url, chunk_size)
@@ -250,10 +752,11 @@ class SimpleCurseAPI(CurseAPI):
         factory: Type["APIFactory"],
         base_url: str = "https://api.curseforge.com",
         user_agent: str = "stinky-c/curse-api",
+        store: Optional["DiskCache"] = None,
+        transport: Optional[TransportConfig] = None,
+        hydration: Hydration = Hydration.validate,
+        **kwargs,
     ) -> None:
-        self._api: "APIFactory" = factory(
-            api_key=api_key, base_url=base_url, user_agent=user_agent
-        )
         """The main factory for handling requests
         accepts additional kwargs passing to the creation of the factory
 
@@ -262,4 +765,16 @@ class SimpleCurseAPI(CurseAPI):
             factory (APIFactory): a factory for handling API requests.
             base_url (str, optional): An overide of the url base. Defaults to "https://api.curseforge.com".
             user_agent (str, optional): user_agent used for requests. Defaults to "stinky-c/curse-api".
+            store (DiskCache, optional): A persistent cache for immutable data. Defaults to None.
+            transport (TransportConfig, optional): Connection settings passed to the factory. Defaults to None.
+            hydration (Hydration, optional): How responses are turned into models. Defaults to `Hydration.validate`.
         """
+        if transport is not None:
+            kwargs["transport"] = transport
+        super().__init__(
+            factory(
+                api_key=api_key, base_url=base_url, user_agent=user_agent, **kwargs
+            ),
+            store=store,
+            hydration=hydration,
+        )
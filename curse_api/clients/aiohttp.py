@@ -9,6 +9,10 @@ except ImportError:
 from typing import Any, AsyncIterator, Dict, Optional
 
 from ..abc import APIFactory
+from ..decoders import Decoder, default_decoder
+from ..layers.base import request_key
+from ..layers.cache import ResponseCache, conditional_headers
+from ..transport import TransportConfig
 
 __all__ = [
     "AiohttpFactory",
@@ -24,6 +28,9 @@ class AiohttpFactory(APIFactory):
         base_url: str = "https://api.curseforge.com",
         user_agent: str = "stinky-c/curse-api",
         timeout: ClientTimeout = DEFAULT_TIMEOUT,
+        validators: Optional[ResponseCache] = None,
+        transport: Optional[TransportConfig] = None,
+        decoder: Optional[Decoder] = None,
     ) -> None:
         """A basic factory handling API requests using aiohttp
 
@@ -34,7 +41,13 @@ class AiohttpFactory(APIFactory):
             base_url (str): The base URL for handling requests
             user_agent (str): A user agent for requests
             settings: extra httpx settings
+            validators (ResponseCache, optional): Stores ETag and Last-Modified validators to make GETs conditional.
+                Share it with a `CacheFactory` to revalidate its expired entries.
+            transport (TransportConfig, optional): Connection pool, keep-alive and DNS cache settings.
+            decoder (Decoder, optional): Decodes response bodies. Defaults to the fastest of orjson, msgspec and json.
         """
+        self._validators = validators
+        self._decode = decoder or default_decoder()
 
         _headers = {
             "X-API-KEY": api_key,
@@ -46,9 +59,24 @@ class AiohttpFactory(APIFactory):
             base_url=base_url,
             headers=_headers,
             timeout=timeout,
+            connector=self._connector(transport or TransportConfig()),
         )
         self._sess.trace_configs
 
+    @staticmethod
+    def _connector(transport: TransportConfig) -> aiohttp.TCPConnector:
+        options: Dict[str, Any] = {}
+        if transport.max_connections is not None:
+            options["limit"] = transport.max_connections
+        if transport.max_connections_per_host is not None:
+            options["limit_per_host"] = transport.max_connections_per_host
+        if transport.keepalive_expiry is not None:
+            options["keepalive_timeout"] = transport.keepalive_expiry
+        if transport.dns_cache_ttl is not None:
+            options["use_dns_cache"] = transport.dns_cache_ttl > 0
+            options["ttl_dns_cache"] = transport.dns_cache_ttl or None
+        return aiohttp.TCPConnector(**options)
+
     async def close(self):
         await self._sess.close()
 
@@ -62,9 +90,27 @@ class AiohttpFactory(APIFactory):
             params (dict): a dict of parameters
             kwargs (any): unpacked into requests get method
         """
-        res = await self._sess.get(url, params=params, **kwargs)
+        if self._validators is None or kwargs:
+            res = await self._sess.get(url, params=params, **kwargs)
+            res.raise_for_status()
+            return self._decode(await res.read())
+
+        key = request_key("GET", url, params)
+        entry = self._validators.get(key)
+        res = await self._sess.get(
+            url, params=params, headers=conditional_headers(entry)
+        )
+        if res.status == 304 and entry is not None:
+            res.release()
+            return entry.value  # unchanged, skip decoding
+
         res.raise_for_status()
-        return await res.json()
+        body = await res.read()
+        data = self._decode(body)
+        etag, modified = res.headers.get("ETag"), res.headers.get("Last-Modified")
+        if etag or modified:
+            self._validators.set(key, data, 0, len(body), etag, modified)
+        return data
 
     async def post(
         self, url: str, params: Optional[dict] = None, **kwargs
@@ -78,13 +124,34 @@ class AiohttpFactory(APIFactory):
         """
         res = await self._sess.post(url, json=params, **kwargs)
         res.raise_for_status()
-        return await res.json()
+        return self._decode(await res.read())
 
     async def download(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
         res = await self._sess.get(url, allow_redirects=True)
         res.raise_for_status()
         return res.content.iter_chunked(chunk_size)
 
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Yields the raw body of a response as it is received
+
+        Args:
+            method (str): GET or POST
+            url (str): the url to request
+            params (dict): the query of a GET or the json data of a POST
+            chunk_size (int): the max size of each chunk
+        """
+        body = {"params": params} if method.upper() == "GET" else {"json": params}
+        async with self._sess.request(method, url, **body) as res:
+            res.raise_for_status()
+            async for chunk in res.content.iter_chunked(chunk_size):
+                yield chunk
+
     @property
     def session(self):
         return self._sess
@@ -1,15 +1,21 @@
 try:
     import httpx
-    from httpx._config import DEFAULT_TIMEOUT_CONFIG
+    from httpx._config import DEFAULT_LIMITS, DEFAULT_TIMEOUT_CONFIG
     from httpx._types import TimeoutTypes
 except ImportError:
     from ..errors import MissingImportException
 
     raise MissingImportException("missing httpx")
 
+import importlib.util
 from typing import Dict, Any, Optional, AsyncIterator
 
 from ..abc import APIFactory
+from ..decoders import Decoder, default_decoder
+from ..errors import MissingImportException
+from ..layers.base import request_key
+from ..layers.cache import ResponseCache, conditional_headers
+from ..transport import TransportConfig
 
 
 class HttpxFactory(APIFactory):
@@ -21,6 +27,9 @@ class HttpxFactory(APIFactory):
         base_url: str = "https://api.curseforge.com",
         user_agent: str = "stinky-c/curse-api",
         timeout: TimeoutTypes = DEFAULT_TIMEOUT_CONFIG,
+        validators: Optional[ResponseCache] = None,
+        transport: Optional[TransportConfig] = None,
+        decoder: Optional[Decoder] = None,
     ) -> None:
         """A basic factory handling API requests using httpx
 
@@ -30,7 +39,16 @@ class HttpxFactory(APIFactory):
             base_url (str): The base URL for handling requests
             user_agent (str): A user agent for requests
             settings: extra httpx settings
+            validators (ResponseCache, optional): Stores ETag and Last-Modified validators to make GETs conditional.
+                Share it with a `CacheFactory` to revalidate its expired entries.
+            transport (TransportConfig, optional): Connection pool and HTTP/2 settings.
+            decoder (Decoder, optional): Decodes response bodies. Defaults to the fastest of orjson, msgspec and json.
         """
+        self._validators = validators
+        self._decode = decoder or default_decoder()
+        transport = transport or TransportConfig()
+        if transport.http2 and importlib.util.find_spec("h2") is None:
+            raise MissingImportException("missing h2, required for http2")
 
         _headers = {
             "X-API-KEY": api_key,
@@ -42,6 +60,20 @@ class HttpxFactory(APIFactory):
             base_url=base_url,
             headers=_headers,
             timeout=timeout,
+            limits=self._limits(transport),
+            http2=transport.http2,
+        )
+
+    @staticmethod
+    def _limits(transport: TransportConfig) -> httpx.Limits:
+        default = DEFAULT_LIMITS
+        return httpx.Limits(
+            max_connections=transport.max_connections or default.max_connections,
+            max_keepalive_connections=transport.max_keepalive_connections
+            or default.max_keepalive_connections,
+            keepalive_expiry=transport.keepalive_expiry
+            if transport.keepalive_expiry is not None
+            else default.keepalive_expiry,
         )
 
     async def close(self):
@@ -57,9 +89,25 @@ class HttpxFactory(APIFactory):
             params (dict): a dict of parameters
             kwargs (any): unpacked into requests get method
         """
-        res = await self._sess.get(url, params=params, **kwargs)
+        if self._validators is None or kwargs:
+            res = await self._sess.get(url, params=params, **kwargs)
+            res.raise_for_status()
+            return self._decode(res.content)
+
+        key = request_key("GET", url, params)
+        entry = self._validators.get(key)
+        res = await self._sess.get(
+            url, params=params, headers=conditional_headers(entry)
+        )
+        if res.status_code == 304 and entry is not None:
+            return entry.value  # unchanged, skip decoding
+
         res.raise_for_status()
-        return res.json()
+        data = self._decode(res.content)
+        etag, modified = res.headers.get("ETag"), res.headers.get("Last-Modified")
+        if etag or modified:
+            self._validators.set(key, data, 0, len(res.content), etag, modified)
+        return data
 
     async def post(
         self, url: str, params: Optional[dict] = None, **kwargs
@@ -73,13 +121,34 @@ class HttpxFactory(APIFactory):
         """
         res = await self._sess.post(url, json=params, **kwargs)
         res.raise_for_status()
-        return res.json()
+        return self._decode(res.content)
 
     async def download(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
         res = await self._sess.get(url, follow_redirects=True)
         res.raise_for_status()
         return res.aiter_bytes(chunk_size)
 
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Yields the raw body of a response as it is received
+
+        Args:
+            method (str): GET or POST
+            url (str): the url to request
+            params (dict): the query of a GET or the json data of a POST
+            chunk_size (int): the max size of each chunk
+        """
+        body = {"params": params} if method.upper() == "GET" else {"json": params}
+        async with self._sess.stream(method, url, **body) as res:
+            res.raise_for_status()
+            async for chunk in res.aiter_bytes(chunk_size):
+                yield chunk
+
     @property
     def session(self):
         return self._sess
@@ -0,0 +1,61 @@
+import json
+from typing import Any, Callable, Dict, Optional
+
+__all__ = [
+    "Decoder",
+    "DECODERS",
+    "default_decoder",
+    "get_decoder",
+]
+
+Decoder = Callable[[bytes], Any]
+"""Decodes a raw JSON response body"""
+
+
+def _stdlib() -> Decoder:
+    # json.loads accepts bytes, but decodes them to an intermediate str first
+    return json.loads
+
+
+def _orjson() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Decoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+# in order of preference, orjson and msgspec parse bytes without a str copy
+DECODERS: Dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+
+def get_decoder(name: str) -> Decoder:
+    """Returns a decoder by name, raising `ImportError` if its library is missing"""
+    try:
+        return DECODERS[name]()
+    except KeyError:
+        raise ValueError(f"unknown decoder {name!r}, expected one of {list(DECODERS)}")
+
+
+_default: Optional[Decoder] = None
+
+
+def default_decoder() -> Decoder:
+    """Returns the fastest installed decoder"""
+    global _default
+    if _default is None:
+        for load in DECODERS.values():
+            try:
+                _default = load()
+                break
+            except ImportError:
+                continue
+    return _default  # type: ignore
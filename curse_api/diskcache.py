@@ -0,0 +1,180 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+__all__ = [
+    "DiskCache",
+]
+
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS entries (
+    endpoint TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (endpoint, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO totals SELECT 'bytes', COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET value = value + new.size WHERE name = 'bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET value = value - old.size WHERE name = 'bytes';
+END;
+COMMIT;
+"""
+"""The total size lives in the database, kept by triggers, so every process sharing it agrees"""
+
+_FLUSH_AFTER = 256
+"""Access times held back before they are written without another write to join"""
+
+
+class DiskCache:
+    """A SQLite backed cache for API data which never changes once published,
+    such as file records and changelogs. Survives restarts of the process and may be
+    shared by several. The least recently used entries are evicted once `max_bytes` is exceeded.
+    Reads do not write, access times are batched into the next write.
+    Calls block on disk and on other writers, `CurseAPI` makes them in an executor.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_bytes: int = 256 * 1024**2,
+        filename: str = "curse_api.sqlite3",
+    ) -> None:
+        """
+        Args:
+            directory (str | PathLike): The directory to keep the database in, created if missing
+            max_bytes (int, optional): The max total size of stored values. Defaults to 256MiB.
+            filename (str, optional): The database file name. Defaults to "curse_api.sqlite3".
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, filename)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._accessed: Dict[Tuple[str, str], float] = {}
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        # the delete of INSERT OR REPLACE only fires triggers with this on
+        self._db.execute("PRAGMA recursive_triggers=ON")
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def size(self) -> int:
+        """The total size of stored values in bytes"""
+        with self._lock:
+            return self._size()
+
+    def get(self, endpoint: str, key: Any) -> Optional[Any]:
+        """Returns the stored value or None"""
+        return self.get_many(endpoint, [key]).get(str(key))
+
+    def get_many(self, endpoint: str, keys: Iterable[Any]) -> Dict[str, Any]:
+        """Returns the stored values of keys which are present, keyed by `str(key)`"""
+        keys = [str(i) for i in keys]
+        found: Dict[str, Any] = {}
+        with self._lock:
+            # stay under the default SQLITE_MAX_VARIABLE_NUMBER
+            for i in range(0, len(keys), 900):
+                chunk = keys[i : i + 900]
+                rows = self._db.execute(
+                    f"SELECT key, value FROM entries WHERE endpoint = ? AND key IN ({','.join('?' * len(chunk))})",
+                    (endpoint, *chunk),
+                ).fetchall()
+                found.update((k, json.loads(v)) for k, v in rows)
+
+            now = time.time()
+            self._accessed.update(((endpoint, k), now) for k in found)
+            if len(self._accessed) >= _FLUSH_AFTER:
+                with self._db:
+                    self._flush()
+        return found
+
+    def set(self, endpoint: str, key: Any, value: Any):
+        self.set_many(endpoint, {key: value})
+
+    def set_many(self, endpoint: str, items: Dict[Any, Any]):
+        """Stores JSON serializable values, replacing existing keys"""
+        now = time.time()
+        rows = []
+        for k, v in items.items():
+            data = json.dumps(v, separators=(",", ":"))
+            rows.append((endpoint, str(k), data, len(data), now))
+
+        with self._lock:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows
+                )
+                for row in rows:
+                    self._accessed.pop(row[:2], None)
+                self._flush()
+            self._evict()
+
+    def delete(self, endpoint: str, key: Any):
+        row = (endpoint, str(key))
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    "DELETE FROM entries WHERE endpoint = ? AND key = ?", row
+                )
+            self._accessed.pop(row, None)
+
+    def clear(self):
+        with self._lock:
+            with self._db:
+                self._db.execute("DELETE FROM entries")
+            self._accessed.clear()
+
+    def close(self):
+        with self._lock:
+            with self._db:
+                self._flush()
+            self._db.close()
+
+    def _size(self) -> int:
+        return self._db.execute(
+            "SELECT value FROM totals WHERE name = 'bytes'"
+        ).fetchone()[0]
+
+    def _flush(self):
+        """writes the held back access times, inside a transaction"""
+        if self._accessed:
+            self._db.executemany(
+                "UPDATE entries SET accessed = ? WHERE endpoint = ? AND key = ?",
+                ((t, *k) for k, t in self._accessed.items()),
+            )
+            self._accessed.clear()
+
+    def _evict(self):
+        if self._size() <= self.max_bytes:
+            return
+
+        # evict down to 90% so every insert near the limit does not evict
+        target = self.max_bytes * 0.9
+        with self._db:
+            # take the write lock first, so the size can not change under us
+            self._db.execute("BEGIN IMMEDIATE")
+            self._flush()
+            size = self._size()
+            rows = self._db.execute(
+                "SELECT endpoint, key, size FROM entries ORDER BY accessed"
+            )
+            evict = []
+            for endpoint, key, length in rows:
+                if size <= target:
+                    break
+                evict.append((endpoint, key))
+                size -= length
+            self._db.executemany(
+                "DELETE FROM entries WHERE endpoint = ? AND key = ?", evict
+            )
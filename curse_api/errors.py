@@ -1,3 +1,6 @@
+from typing import Any, List
+
+
 class CurseForgeException(Exception):
     """Base for all CurseForge Exceptions"""
 
@@ -11,3 +14,20 @@ class MissingImportException(Exception):
 
 class APIBannedException(CurseForgeException):
     """Mod has been API banned, and is unreachable"""
+
+
+class MissingResourcesException(CurseForgeException):
+    """One or more requested ids were not returned by the API"""
+
+    def __init__(self, missing: List[int], found: List[Any]) -> None:
+        super().__init__(f"missing ids: {missing}")
+        self.missing = missing
+        self.found = found
+
+
+class CircuitOpenException(CurseForgeException):
+    """The circuit breaker is open, requests fail fast until the API recovers"""
+
+    def __init__(self, retry_in: float) -> None:
+        super().__init__(f"circuit open, retrying in {retry_in:.1f}s")
+        self.retry_in = retry_in
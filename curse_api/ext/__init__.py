@@ -1,3 +1,20 @@
 from .manifest import ManifestParser
+from .catalog import CatalogEnumerator
+from .coalesce import CoalescingCurseAPI
+from .modloaders import ModLoaderCatalog
+from .versions import MinecraftVersionIndex
+from .categories import CategoryIndex
+from .scan import DirectoryScanner, FingerprintCache, FolderScanResult, ScanResult
 
-__all__ = ("ManifestParser",)
+__all__ = (
+    "ManifestParser",
+    "CatalogEnumerator",
+    "CoalescingCurseAPI",
+    "ModLoaderCatalog",
+    "MinecraftVersionIndex",
+    "CategoryIndex",
+    "DirectoryScanner",
+    "FingerprintCache",
+    "ScanResult",
+    "FolderScanResult",
+)
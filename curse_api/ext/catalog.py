@@ -0,0 +1,197 @@
+from __future__ import annotations
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from ..api import INDEX_CAP
+from ..categories import BaseCategory, Minecraft_Categories
+from ..enums import Games, ModLoaderType
+from ..models import Mod
+from ..tables import ModTable, Row
+
+if TYPE_CHECKING:
+    from ..api import CurseAPI
+
+AnyDict = Dict[str, Any]
+
+_DONE = object()
+
+
+class CatalogEnumerator:
+    """Enumerates every mod of a search, including past the API index cap.
+    Any search with more results than the cap is split by `categoryId`, then `gameVersion`
+    and finally `modLoaderType` until every partition can be paged through.
+    Mods matching several partitions are only yielded once.
+    """
+
+    def __init__(
+        self,
+        api: "CurseAPI",
+        categories: Iterable[BaseCategory] = Minecraft_Categories,
+        gameVersions: Optional[Sequence[str]] = None,
+        modLoaderTypes: Iterable[ModLoaderType] = tuple(
+            i for i in ModLoaderType if i is not ModLoaderType.Any
+        ),
+        concurrency: int = 8,
+        page_concurrency: int = 4,
+        pageSize: int = 50,
+    ) -> None:
+        """
+        Args:
+            api (CurseAPI): The api used for searching
+            categories (Iterable[BaseCategory], optional): Categories to split by. Defaults to `Minecraft_Categories`.
+            gameVersions (Sequence[str], optional): Game versions to split by. Fetched from `minecraft_versions` if None.
+            modLoaderTypes (Iterable[ModLoaderType], optional): Modloaders to split by. Defaults to all but `ModLoaderType.Any`.
+            concurrency (int, optional): The number of partitions searched at once. Defaults to 8.
+            page_concurrency (int, optional): The number of pages prefetched per partition. Defaults to 4.
+            pageSize (int, optional): The number of mods fetched per request. Defaults to 50.
+        """
+        self.api = api
+        self.categories = [i.value for i in categories]
+        self.gameVersions = list(gameVersions) if gameVersions is not None else None
+        self.modLoaderTypes = [i.value for i in modLoaderTypes]
+        self.concurrency = concurrency
+        self.page_concurrency = page_concurrency
+        self.pageSize = pageSize
+        self.truncated: List[AnyDict] = []
+        """Partitions cut off at the index cap, as they could not be split further or their split missed mods"""
+        self.index_cap = INDEX_CAP
+
+    async def iter_mods(
+        self, gameId: Games = Games.minecraft, table: bool = False, **filters
+    ) -> AsyncIterator[Union[Mod, Row[Mod]]]:
+        """Yields every unique mod matching the search filters, see `CurseAPI.search_mods`.
+        With `table` pages are kept as compact `ModTable`s and their rows are yielded instead.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.pageSize * self.concurrency)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: List[asyncio.Future] = []
+        seen = set()
+        running = 0
+
+        def spawn(query: AnyDict, total: "Optional[asyncio.Future[int]]" = None):
+            nonlocal running
+            running += 1
+            tasks.append(
+                asyncio.ensure_future(
+                    self._partition(query, table, semaphore, queue, spawn, total)
+                )
+            )
+
+        self.truncated = []
+        self._versions_lock = asyncio.Lock()
+        spawn({"gameId": gameId, **filters})
+        try:
+            while running:
+                item = await queue.get()
+                if item is _DONE:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                elif item.id not in seen:
+                    seen.add(item.id)
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def collect(
+        self, gameId: Games = Games.minecraft, **filters
+    ) -> Dict[int, Mod]:
+        """Returns every unique mod matching the search filters keyed by id"""
+        return {i.id: i async for i in self.iter_mods(gameId, **filters)}
+
+    async def collect_table(
+        self, gameId: Games = Games.minecraft, **filters
+    ) -> ModTable:
+        """Returns every unique mod matching the search filters as a `ModTable`"""
+        table = ModTable()
+        async for i in self.iter_mods(gameId, table=True, **filters):
+            table.append(i)
+        return table
+
+    async def _partition(
+        self,
+        query: AnyDict,
+        table: bool,
+        semaphore: asyncio.Semaphore,
+        queue: asyncio.Queue,
+        spawn: Callable[[AnyDict, "Optional[asyncio.Future[int]]"], None],
+        total: "Optional[asyncio.Future[int]]" = None,
+    ):
+        """pages through a query, or splits it and reports its `totalCount` to `total`"""
+        try:
+            async with semaphore:
+                mods, page = await self.api.search_mods(
+                    **query, index=0, pageSize=self.pageSize, table=table
+                )
+            if total is not None:
+                total.set_result(page.totalCount)
+
+            if page.totalCount > self.index_cap:
+                children = await self._split(query)
+                if children:
+                    loop = asyncio.get_event_loop()
+                    totals = [loop.create_future() for _ in children]
+                    for i, found in zip(children, totals):
+                        spawn(i, found)
+                    # mods without the filter, such as mods without a modloader or in a category
+                    # missing from `categories`, are in no child and only reachable from here
+                    if sum(await asyncio.gather(*totals)) >= page.totalCount:
+                        return
+                self.truncated.append(query)
+
+            async with semaphore:
+                for i in mods:
+                    await queue.put(i)
+                if page.totalCount > len(mods) and mods:
+                    async for i in self.api.iter_search_mods(
+                        **query,
+                        index=len(mods),
+                        pageSize=self.pageSize,
+                        concurrency=self.page_concurrency,
+                        table=table,
+                    ):
+                        await queue.put(i)
+        except Exception as e:
+            if total is not None and not total.done():
+                total.set_result(0)  # the error itself is raised by `iter_mods`
+            await queue.put(e)
+        finally:
+            await queue.put(_DONE)
+
+    async def _split(self, query: AnyDict) -> List[AnyDict]:
+        """narrows a query by the next unused filter"""
+        if query.get("categoryId") is None and self.categories:
+            return [dict(query, categoryId=i) for i in self.categories]
+
+        if query.get("gameVersion") is None:
+            versions = await self._game_versions(query["gameId"])
+            if versions:
+                return [dict(query, gameVersion=i) for i in versions]
+
+        # modLoaderType must be coupled with gameVersion
+        if query.get("modLoaderType") is None and query.get("gameVersion") is not None:
+            return [dict(query, modLoaderType=i) for i in self.modLoaderTypes]
+
+        return []
+
+    async def _game_versions(self, gameId: Games) -> List[str]:
+        async with self._versions_lock:
+            if self.gameVersions is None:
+                if gameId != Games.minecraft:
+                    self.gameVersions = []
+                else:
+                    versions = await self.api.minecraft_versions()
+                    self.gameVersions = [i.versionString for i in versions]
+        return self.gameVersions
@@ -0,0 +1,251 @@
+from __future__ import annotations
+import asyncio
+import json
+import os
+import time
+import warnings
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic.json import pydantic_encoder
+
+from ..enums import Games
+from ..models import Category, Mod
+from .refresh import Refreshable
+
+if TYPE_CHECKING:
+    from ..api import CurseAPI
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def bundled_categories(games: Iterable[Games]) -> List[Category]:
+    """Returns the categories of the bundled enums. Only the id, gameId, name and slug are known,
+    classes and parents can not be told apart.
+    """
+    from ..categories import CATEGORIES
+
+    found = []
+    for game in games:
+        if game not in CATEGORIES:
+            continue
+        for i in CATEGORIES[game]:
+            found.append(
+                Category(
+                    id=i.value,
+                    gameId=game.value,
+                    name=i.name,
+                    slug=i.name.replace("_", "-"),
+                    url="",
+                    iconUrl="",
+                    dateModified=_EPOCH,
+                    isClass=False,
+                    classId=None,
+                    parentCategoryId=None,
+                    displayIndex=None,
+                )
+            )
+    return found
+
+
+class CategoryIndex(Refreshable):
+    """Every category of some games from `/v1/categories`, with lookups by id,
+    by slug and through parents and children. Picks up categories added after release.
+
+    The list is saved to `snapshot` and read back on startup while younger than `ttl`.
+    When the API can not be reached an older snapshot, or else the bundled enums, is used.
+
+    ```py
+    index = await CategoryIndex(api, snapshot="categories.json").load()
+    magic = index.by_slug(Games.minecraft, "magic")
+    index.children(magic.parentCategoryId)
+    ```
+    """
+
+    def __init__(
+        self,
+        api: Optional["CurseAPI"] = None,
+        games: Sequence[Games] = (Games.minecraft,),
+        snapshot: Optional[Union[str, "os.PathLike[str]"]] = None,
+        ttl: float = 24 * 3600,
+    ) -> None:
+        """
+        Args:
+            api (CurseAPI, optional): The api used for fetching. Without one only the snapshot and bundled enums are used.
+            games (Sequence[Games], optional): The games to index. Defaults to minecraft.
+            snapshot (str | PathLike, optional): A JSON file to save the list to and start from. Defaults to None.
+            ttl (float, optional): Seconds before the list is fetched again. Defaults to a day.
+        """
+        super().__init__(ttl)
+        self.api = api
+        self.games = tuple(games)
+        self.snapshot = snapshot
+        self.source = ""
+        """Where the list came from: "api", "snapshot" or "bundled" """
+        self._by_id: Dict[int, Category] = {}
+        self._by_slug: Dict[Tuple[int, str], Category] = {}
+        self._by_class_slug: Dict[Tuple[int, Optional[int], str], Category] = {}
+        self._children: Dict[int, Tuple[Category, ...]] = {}
+        self._classes: Dict[int, Tuple[Category, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._by_id
+
+    async def load(self, force: bool = False):
+        """Fetches the list if it expired. Starts from a snapshot younger than `ttl` without fetching,
+        if the first fetch fails an older snapshot or the bundled enums are used with a warning.
+        """
+        if not self.loaded and not force:
+            saved = self._read_snapshot()
+            age = time.time() - saved[0] if saved is not None else self.ttl
+            if saved is not None and age < self.ttl:
+                self._index(saved[1], "snapshot", self.ttl - age)
+                return self
+        try:
+            return await super().load(force)
+        except Exception as e:  # only raised while nothing is loaded
+            saved = self._read_snapshot()
+            source = "snapshot" if saved is not None else "bundled"
+            warnings.warn(f"categories could not be fetched, using the {source}: {e!r}")
+            fallback = saved[1] if saved is not None else bundled_categories(self.games)
+            # retry soon rather than serving the fallback for a whole ttl
+            self._index(fallback, source, min(self.ttl, 60))
+            return self
+
+    async def _fetch(self) -> List[Category]:
+        if self.api is None:
+            raise TypeError("an api is required to fetch categories")
+        api = self.api
+        lists = await asyncio.gather(*(api.get_categories(i) for i in self.games))
+        return [i for found in lists for i in found]
+
+    def index(self, categories: Iterable[Category]):
+        """Replaces the list and rebuilds every index"""
+        categories = list(categories)
+        self._index(categories, "api", self.ttl)
+        try:
+            self._write_snapshot(categories)
+        except OSError as e:
+            # the fetched list is indexed either way
+            warnings.warn(f"category snapshot could not be saved: {e!r}")
+
+    def _index(self, categories: Iterable[Category], source: str, ttl: float):
+        by_id = {i.id: i for i in categories}
+        by_slug: Dict[Tuple[int, str], Category] = {}
+        by_class_slug: Dict[Tuple[int, Optional[int], str], Category] = {}
+        children: DefaultDict[int, List[Category]] = defaultdict(list)
+        classes: DefaultDict[int, List[Category]] = defaultdict(list)
+
+        # classes first, so a class wins a slug shared with one of its categories
+        for i in sorted(by_id.values(), key=lambda i: (not i.isClass, i.id)):
+            by_slug.setdefault((i.gameId, i.slug), i)
+            by_class_slug.setdefault((i.gameId, i.classId, i.slug), i)
+            if i.isClass:
+                classes[i.gameId].append(i)
+            if i.parentCategoryId is not None and i.parentCategoryId != i.id:
+                children[i.parentCategoryId].append(i)
+
+        self._by_id = by_id
+        self._by_slug = by_slug
+        self._by_class_slug = by_class_slug
+        self._children = {k: tuple(v) for k, v in children.items()}
+        self._classes = {k: tuple(v) for k, v in classes.items()}
+        self.source = source
+        self._refreshed(ttl)
+
+    def get(self, id: int) -> Optional[Category]:
+        return self._by_id.get(id)
+
+    def by_slug(
+        self, gameId: Games, slug: str, classId: Optional[int] = None
+    ) -> Optional[Category]:
+        """Returns a category by slug, `classId` picks between categories of different classes sharing a slug"""
+        if classId is not None:
+            return self._by_class_slug.get((gameId, classId, slug))
+        return self._by_slug.get((gameId, slug))
+
+    def classes(self, gameId: Games) -> Tuple[Category, ...]:
+        """Returns the classes of a game, such as mods and modpacks"""
+        return self._classes.get(gameId, ())
+
+    def parent(self, id: int) -> Optional[Category]:
+        category = self._by_id.get(id)
+        if category is None or category.parentCategoryId is None:
+            return None
+        return self._by_id.get(category.parentCategoryId)
+
+    def children(self, id: int) -> Tuple[Category, ...]:
+        return self._children.get(id, ())
+
+    def ancestors(self, id: int) -> List[Category]:
+        """Returns the parents of a category up to its class, nearest first"""
+        found: List[Category] = []
+        parent = self.parent(id)
+        while parent is not None and parent not in found:
+            found.append(parent)
+            parent = self.parent(parent.id)
+        return found
+
+    def descendants(self, id: int) -> List[Category]:
+        """Returns every category below a category, breadth first"""
+        found: List[Category] = []
+        seen = {id}
+        queue = deque(self.children(id))
+        while queue:
+            i = queue.popleft()
+            if i.id in seen:
+                continue
+            seen.add(i.id)
+            found.append(i)
+            queue.extend(self.children(i.id))
+        return found
+
+    def class_of(self, mod: Mod) -> Optional[Category]:
+        """Returns the class of a mod, also for classes added after release"""
+        return self._by_id.get(mod.classId) if mod.classId else None
+
+    def _read_snapshot(self) -> Optional[Tuple[float, List[Category]]]:
+        if self.snapshot is None or not os.path.exists(self.snapshot):
+            return None
+        try:
+            with open(self.snapshot) as f:
+                data = json.load(f)
+            return data["saved"], [Category.from_dict(i) for i in data["categories"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            warnings.warn(f"ignoring unreadable category snapshot: {e!r}")
+            return None
+
+    def _write_snapshot(self, categories: List[Category]):
+        if self.snapshot is None:
+            return
+        temp = f"{os.fspath(self.snapshot)}.tmp"
+        try:
+            with open(temp, "w") as f:
+                json.dump(
+                    {"saved": time.time(), "categories": categories},
+                    f,
+                    default=pydantic_encoder,
+                    separators=(",", ":"),
+                )
+            os.replace(temp, self.snapshot)  # readers never see a partial file
+        except OSError:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
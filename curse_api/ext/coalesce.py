@@ -0,0 +1,142 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from ..abc import APIFactory
+from ..api import BULK_CHUNK_SIZE, CurseAPI
+from ..errors import MissingResourcesException
+from ..models import File, Hydration, Mod
+
+if TYPE_CHECKING:
+    from ..diskcache import DiskCache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+__all__ = [
+    "Batcher",
+    "CoalescingCurseAPI",
+]
+
+
+class Batcher(Generic[K, V]):
+    """Collects keys requested within one loop tick, or `window` seconds,
+    and loads them with a single call. Concurrent loads of the same key share a result.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        window: float = 0.0,
+        max_batch: int = BULK_CHUNK_SIZE,
+    ) -> None:
+        """
+        Args:
+            load (Callable): Given a list of keys returns a dict of the found values
+            window (float, optional): Seconds to wait for more keys, 0 waits for the current loop tick. Defaults to 0.
+            max_batch (int, optional): Dispatch early once this many keys are waiting. Defaults to `BULK_CHUNK_SIZE`.
+        """
+        self._load = load
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[K, asyncio.Future] = {}
+        self._handle: Optional[asyncio.Handle] = None
+
+    async def load(self, key: K) -> V:
+        fut = self._pending.get(key)
+        if fut is None:
+            loop = asyncio.get_event_loop()
+            fut = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch:
+                self._dispatch()
+            elif self._handle is None:
+                if self.window > 0:
+                    self._handle = loop.call_later(self.window, self._dispatch)
+                else:
+                    self._handle = loop.call_soon(self._dispatch)
+
+        # one cancelled caller must not cancel the batch for everyone else
+        return await asyncio.shield(fut)
+
+    def _dispatch(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: Dict[K, asyncio.Future]):
+        try:
+            found = await self._load(list(batch))
+        except Exception as e:
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        for key, fut in batch.items():
+            if fut.done():
+                continue
+            if key in found:
+                fut.set_result(found[key])
+            else:
+                fut.set_exception(MissingResourcesException([key], []))  # type: ignore
+
+
+class CoalescingCurseAPI(CurseAPI):
+    """A `CurseAPI` that merges concurrent `get_mod` and `get_mod_file` calls
+    into single `get_mods` and `get_files` requests.
+    """
+
+    def __init__(
+        self,
+        client: "APIFactory",
+        window: float = 0.0,
+        max_batch: int = BULK_CHUNK_SIZE,
+        hydration: Hydration = Hydration.validate,
+        store: Optional["DiskCache"] = None,
+    ) -> None:
+        """
+        Args:
+            client: An instance of an client wrapper.
+            window (float, optional): Seconds to collect calls for, 0 collects calls made in the same loop tick. Defaults to 0.
+            max_batch (int, optional): The max number of ids sent per request. Defaults to `BULK_CHUNK_SIZE`.
+            hydration (Hydration, optional): How responses are turned into models. Defaults to `Hydration.validate`.
+            store (DiskCache, optional): A persistent cache for immutable data. Defaults to None.
+        """
+        super().__init__(client, store=store, hydration=hydration)
+        self._mods: Batcher[int, Mod] = Batcher(self._load_mods, window, max_batch)
+        self._files: Batcher[int, File] = Batcher(self._load_files, window, max_batch)
+
+    async def get_mod(self, modId: int) -> Mod:
+        return await self._mods.load(modId)
+
+    async def get_mod_file(self, modId: int, fileId: int) -> File:
+        file = await self._files.load(fileId)
+        if file.modId != modId:
+            raise MissingResourcesException([fileId], [])
+        return file
+
+    async def _load_mods(self, ids: List[int]) -> Dict[int, Mod]:
+        try:
+            mods = await self.get_mods(ids, chunk_size=len(ids), strict=True)
+        except MissingResourcesException as e:
+            mods = e.found
+        return {i.id: i for i in mods}
+
+    async def _load_files(self, ids: List[int]) -> Dict[int, File]:
+        try:
+            files = await self.get_files(ids, chunk_size=len(ids), strict=True)
+        except MissingResourcesException as e:
+            files = e.found
+        return {i.id: i for i in files}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Dict, Any, TYPE_CHECKING, List
+from ..api import BULK_CHUNK_SIZE
 from ..models import File, ManifestMetadata, Mod
 
 if TYPE_CHECKING:
@@ -13,21 +14,35 @@ class ManifestParser:
     def __init__(self, api: "CurseAPI") -> None:
         self.api = api
 
-    async def load_files(self, data: AnyDict) -> List[File]:
+    async def load_files(
+        self,
+        data: AnyDict,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        strict: bool = False,
+    ) -> List[File]:
+        """Returns the manifest files in manifest order, see `CurseAPI.get_files`"""
         files = data.get("files", None)
         if not isinstance(files, list):
             raise TypeError("Files is not list")
 
         fids = [i["fileID"] for i in files]
-        return await self.api.get_files(fids)
-
-    async def load_mods(self, data: AnyDict) -> List[Mod]:
+        return await self.api.get_files(fids, chunk_size, concurrency, strict)
+
+    async def load_mods(
+        self,
+        data: AnyDict,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+        strict: bool = False,
+    ) -> List[Mod]:
+        """Returns the manifest mods in manifest order, see `CurseAPI.get_mods`"""
         files = data.get("files", None)
         if not isinstance(files, list):
             raise TypeError("Files is not list")
 
         fids = [i["projectID"] for i in files]
-        return await self.api.get_mods(fids)
+        return await self.api.get_mods(fids, chunk_size, concurrency, strict)
 
     async def load_modloader(self, data: AnyDict):  # TODO: type better
         minecraft = data.get("minecraft")
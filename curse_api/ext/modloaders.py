@@ -0,0 +1,177 @@
+from __future__ import annotations
+import asyncio
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..enums import ModLoaderType
+from ..models import MinecraftModLoaderIndex, MinecraftModLoaderVersion
+from .refresh import Refreshable
+
+if TYPE_CHECKING:
+    from ..api import CurseAPI
+
+Key = Tuple[str, ModLoaderType]
+
+
+class ModLoaderCatalog(Refreshable):
+    """An indexed, cached view of `CurseAPI.modloader_versions`.
+    Lookups by game version, loader type, latest and recommended are dict lookups,
+    the list is fetched again once `ttl` expires. Details from
+    `get_specific_minecraft_modloader` are fetched on first use and kept.
+
+    ```py
+    catalog = ModLoaderCatalog(api)
+    forge = await catalog.find("1.12.2", ModLoaderType.Forge)
+    fabric = await catalog.recommended("1.19.3", ModLoaderType.Fabric)
+    ```
+    """
+
+    def __init__(
+        self, api: "CurseAPI", ttl: float = 3600, concurrency: int = 8
+    ) -> None:
+        """
+        Args:
+            api (CurseAPI): The api used for fetching
+            ttl (float, optional): Seconds before the list is fetched again. Defaults to 3600.
+            concurrency (int, optional): The number of details fetched at once by `details_many`. Defaults to 8.
+        """
+        super().__init__(ttl)
+        self.api = api
+        self.concurrency = concurrency
+        self._all: Tuple[MinecraftModLoaderIndex, ...] = ()
+        self._by_name: Dict[str, MinecraftModLoaderIndex] = {}
+        self._by_version: Dict[str, Tuple[MinecraftModLoaderIndex, ...]] = {}
+        self._by_type: Dict[ModLoaderType, Tuple[MinecraftModLoaderIndex, ...]] = {}
+        self._by_key: Dict[Key, Tuple[MinecraftModLoaderIndex, ...]] = {}
+        self._latest: Dict[Key, MinecraftModLoaderIndex] = {}
+        self._recommended: Dict[Key, MinecraftModLoaderIndex] = {}
+        self._details: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    async def _fetch(self) -> List[MinecraftModLoaderIndex]:
+        return await self.api.modloader_versions()
+
+    def index(self, versions: Iterable[MinecraftModLoaderIndex]):
+        """Replaces the list and rebuilds every index"""
+        by_version: DefaultDict[str, List[MinecraftModLoaderIndex]] = defaultdict(list)
+        by_type: DefaultDict[
+            ModLoaderType, List[MinecraftModLoaderIndex]
+        ] = defaultdict(list)
+        by_key: DefaultDict[Key, List[MinecraftModLoaderIndex]] = defaultdict(list)
+        latest: Dict[Key, MinecraftModLoaderIndex] = {}
+        recommended: Dict[Key, MinecraftModLoaderIndex] = {}
+
+        # newest first, so the first flagged entry of a key wins
+        ordered = sorted(versions, key=lambda i: i.dateModified, reverse=True)
+        for i in ordered:
+            key = (i.gameVersion, i.type)
+            by_version[i.gameVersion].append(i)
+            by_type[i.type].append(i)
+            by_key[key].append(i)
+            if i.latest:
+                latest.setdefault(key, i)
+            if i.recommended:
+                recommended.setdefault(key, i)
+
+        self._all = tuple(ordered)
+        self._by_name = {i.name: i for i in ordered}
+        self._by_version = {k: tuple(v) for k, v in by_version.items()}
+        self._by_type = {k: tuple(v) for k, v in by_type.items()}
+        self._by_key = {k: tuple(v) for k, v in by_key.items()}
+        self._latest = latest
+        self._recommended = recommended
+        self._refreshed(self.ttl)
+
+    async def find(
+        self,
+        gameVersion: Optional[str] = None,
+        type: Optional[ModLoaderType] = None,
+        latest: Optional[bool] = None,
+        recommended: Optional[bool] = None,
+    ) -> Tuple[MinecraftModLoaderIndex, ...]:
+        """Returns the modloaders matching every given filter, newest first"""
+        await self.load()
+        if gameVersion is not None and type is not None:
+            found = self._by_key.get((gameVersion, type), ())
+        elif gameVersion is not None:
+            found = self._by_version.get(gameVersion, ())
+        elif type is not None:
+            found = self._by_type.get(type, ())
+        else:
+            found = self._all
+
+        if latest is None and recommended is None:
+            return found
+        return tuple(
+            i
+            for i in found
+            if (latest is None or i.latest == latest)
+            and (recommended is None or i.recommended == recommended)
+        )
+
+    async def get(self, name: str) -> Optional[MinecraftModLoaderIndex]:
+        """Returns a modloader by name such as "forge-14.23.5.2860" """
+        await self.load()
+        return self._by_name.get(name)
+
+    async def latest(
+        self, gameVersion: str, type: ModLoaderType
+    ) -> Optional[MinecraftModLoaderIndex]:
+        """Returns the modloader flagged latest for a game version"""
+        await self.load()
+        return self._latest.get((gameVersion, type))
+
+    async def recommended(
+        self, gameVersion: str, type: ModLoaderType
+    ) -> Optional[MinecraftModLoaderIndex]:
+        """Returns the modloader flagged recommended for a game version"""
+        await self.load()
+        return self._recommended.get((gameVersion, type))
+
+    async def game_versions(self, type: Optional[ModLoaderType] = None) -> List[str]:
+        """Returns the game versions which have a modloader"""
+        await self.load()
+        if type is None:
+            return list(self._by_version)
+        return list(dict.fromkeys(i.gameVersion for i in self._by_type.get(type, ())))
+
+    async def details(self, name: str) -> MinecraftModLoaderVersion:
+        """Returns `get_specific_minecraft_modloader`, fetched once and then kept"""
+        fut = self._details.get(name)
+        if fut is None:
+            fut = self._details[name] = asyncio.ensure_future(
+                self.api.get_specific_minecraft_modloader(name)
+            )
+            fut.add_done_callback(lambda f: self._fetched(name, f))
+        return await asyncio.shield(fut)
+
+    async def details_many(
+        self, names: Iterable[str]
+    ) -> Dict[str, MinecraftModLoaderVersion]:
+        """Returns the details of every name, fetching up to `concurrency` at once"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(name: str):
+            if name in self._details:
+                return await self.details(name)
+            async with semaphore:
+                return await self.details(name)
+
+        names = list(dict.fromkeys(names))
+        results = await asyncio.gather(*(fetch(i) for i in names))
+        return dict(zip(names, results))
+
+    def _fetched(self, name: str, fut: asyncio.Future):
+        # failures are not kept so the next call retries
+        if fut.cancelled() or fut.exception() is not None:
+            self._details.pop(name, None)
@@ -0,0 +1,62 @@
+import asyncio
+import time
+import warnings
+from typing import Any, Optional
+
+__all__ = [
+    "Refreshable",
+]
+
+
+class Refreshable:
+    """The base of indexes over an API list which is fetched again once `ttl` expires.
+    Subclasses implement `_fetch` and `index`.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._expires = 0.0
+        self._generation = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self._expires
+
+    @property
+    def loaded(self) -> bool:
+        return self._generation > 0
+
+    async def load(self, force: bool = False):
+        """Fetches the list if it expired, concurrent calls share one request.
+        A failed refresh keeps serving the previous list with a warning.
+        """
+        if self.fresh and not force:
+            return self
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        generation = self._generation
+        async with self._lock:
+            if generation != self._generation:
+                return self  # refreshed while waiting
+            try:
+                data = await self._fetch()
+            except Exception as e:
+                if not self.loaded:
+                    raise
+                warnings.warn(f"serving a stale {type(self).__name__}: {e!r}")
+                self._refreshed(min(self.ttl, 60))
+                return self
+            self.index(data)
+        return self
+
+    async def _fetch(self) -> Any:
+        raise NotImplementedError
+
+    def index(self, data: Any):
+        """Replaces the list and rebuilds every index"""
+        raise NotImplementedError
+
+    def _refreshed(self, ttl: float):
+        self._expires = time.monotonic() + ttl
+        self._generation += 1
@@ -0,0 +1,299 @@
+from __future__ import annotations
+import asyncio
+import json
+import os
+import warnings
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..api import BULK_CHUNK_SIZE
+from ..fingerprint import fingerprint_file
+from ..enums import Games
+from ..models import (
+    File,
+    FingerprintFuzzyMatch,
+    FingerprintFuzzyMatchResult,
+    FingerprintsMatchesResult,
+    FolderFingerprint,
+    Mod,
+)
+
+if TYPE_CHECKING:
+    from ..api import CurseAPI
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class FingerprintCache:
+    """Fingerprints of local files keyed by path, size and modification time,
+    so a rescan only hashes changed files. Optionally saved to a JSON file.
+    """
+
+    def __init__(self, path: Optional[PathLike] = None) -> None:
+        """
+        Args:
+            path (str | PathLike, optional): A JSON file to load from and save to. Defaults to None.
+        """
+        self.path = path
+        self._entries: Dict[str, Tuple[int, int, int]] = {}
+        self._dirty = False
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._entries = {k: tuple(v) for k, v in json.load(f).items()}  # type: ignore
+            except (OSError, ValueError, TypeError) as e:
+                warnings.warn(f"ignoring unreadable fingerprint cache: {e!r}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[int]:
+        """Returns the fingerprint if the file did not change since it was stored"""
+        entry = self._entries.get(path)
+        if entry is None or entry[:2] != (stat.st_size, stat.st_mtime_ns):
+            return None
+        return entry[2]
+
+    def set(self, path: str, stat: os.stat_result, fingerprint: int):
+        self._entries[path] = (stat.st_size, stat.st_mtime_ns, fingerprint)
+        self._dirty = True
+
+    def discard(self, paths: Iterable[str]):
+        """Forgets files, such as deleted ones"""
+        for i in paths:
+            if self._entries.pop(i, None) is not None:
+                self._dirty = True
+
+    def save(self):
+        """Writes the cache if it has a path and changed"""
+        if self.path is None or not self._dirty:
+            return
+        temp = f"{os.fspath(self.path)}.tmp"
+        with open(temp, "w") as f:
+            json.dump(self._entries, f, separators=(",", ":"))
+        os.replace(temp, self.path)  # readers never see a partial file
+        self._dirty = False
+
+
+@dataclass
+class ScanResult:
+    """The installed files of a directory identified by fingerprint, keyed by local path"""
+
+    fingerprints: Dict[str, int]
+    files: Dict[str, File]
+    """Paths with an exact match"""
+    mods: Dict[str, Mod] = field(default_factory=dict)
+    """The mods of matched paths, empty if mods were not fetched"""
+    unmatched: List[str] = field(default_factory=list)
+    """Paths without a match, such as local builds or mods not hosted on CurseForge"""
+    matches: Optional[FingerprintsMatchesResult] = None
+
+
+@dataclass
+class FolderScanResult:
+    """The installed addon folders of a directory identified by fuzzy matching, keyed by local path"""
+
+    folders: Dict[str, FolderFingerprint]
+    matches: Dict[str, FingerprintFuzzyMatch]
+    """Folders with a match, the one sharing the most fingerprints if several match"""
+    unmatched: List[str] = field(default_factory=list)
+    result: Optional[FingerprintFuzzyMatchResult] = None
+
+
+class DirectoryScanner:
+    """Identifies the files in a directory, such as a `mods` folder, or its addon folders.
+    Fingerprints are computed across a process pool and matched with
+    `CurseAPI.get_fingerprints` in concurrent chunks.
+
+    ```py
+    scanner = DirectoryScanner(api, FingerprintCache("fingerprints.json"))
+    result = await scanner.scan_directory("instance/mods")
+    for path, mod in result.mods.items():
+        print(path, mod.name, result.files[path].displayName)
+    ```
+    """
+
+    def __init__(
+        self,
+        api: "CurseAPI",
+        cache: Optional[FingerprintCache] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        concurrency: int = 4,
+    ) -> None:
+        """
+        Args:
+            api (CurseAPI): The api used for matching
+            cache (FingerprintCache, optional): Fingerprints kept between scans. Defaults to an in memory cache.
+            executor (Executor, optional): Runs `fingerprint_file`. Defaults to a process pool per scan.
+            chunk_size (int, optional): The max number of fingerprints per request. Defaults to `BULK_CHUNK_SIZE`.
+            concurrency (int, optional): The max number of requests in flight. Defaults to 4.
+        """
+        self.api = api
+        self.cache = cache if cache is not None else FingerprintCache()
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+
+    async def fingerprints(self, paths: Iterable[PathLike]) -> Dict[str, int]:
+        """Returns the fingerprint of every file, only hashing files missing from the cache.
+        Files which can not be read are skipped with a warning.
+        """
+        found: Dict[str, int] = {}
+        todo: Dict[str, os.stat_result] = {}
+        order = [os.path.abspath(i) for i in paths]
+        for path in order:
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                warnings.warn(f"skipping {path}: {e!r}")
+                continue
+            cached = self.cache.get(path, stat)
+            if cached is None:
+                todo[path] = stat
+            else:
+                found[path] = cached
+
+        if todo:
+            executor = self.executor
+            if executor is None:
+                workers = min(len(todo), os.cpu_count() or 1)
+                executor = ProcessPoolExecutor(max_workers=workers)
+            loop = asyncio.get_event_loop()
+            try:
+                hashed = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, fingerprint_file, i)
+                        for i in todo
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                if executor is not self.executor:
+                    executor.shutdown(wait=False)
+            for (path, stat), result in zip(todo.items(), hashed):
+                if isinstance(result, OSError):
+                    warnings.warn(f"skipping {path}: {result!r}")
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                self.cache.set(path, stat, result)
+                found[path] = result
+        self.cache.save()
+        return {i: found[i] for i in order if i in found}
+
+    async def scan(self, paths: Iterable[PathLike], mods: bool = True) -> ScanResult:
+        """Identifies some files, see `scan_directory`"""
+        fingerprints = await self.fingerprints(paths)
+        matches = await self.api.get_fingerprints(
+            list(fingerprints.values()), self.chunk_size, self.concurrency
+        )
+        by_fingerprint = {i.file.fileFingerprint: i.file for i in matches.exactMatches}
+
+        result = ScanResult(fingerprints, {}, matches=matches)
+        for path, fingerprint in fingerprints.items():
+            if fingerprint in by_fingerprint:
+                result.files[path] = by_fingerprint[fingerprint]
+            else:
+                result.unmatched.append(path)
+
+        if mods and result.files:
+            found = await self.api.get_mods(
+                [i.modId for i in result.files.values()],
+                self.chunk_size,
+                self.concurrency,
+            )
+            by_id = {i.id: i for i in found}
+            result.mods = {
+                path: by_id[file.modId]
+                for path, file in result.files.items()
+                if file.modId in by_id
+            }
+        return result
+
+    async def scan_directory(
+        self,
+        path: PathLike,
+        pattern: str = "*.jar",
+        recursive: bool = False,
+        mods: bool = True,
+    ) -> ScanResult:
+        """Identifies the files of a directory, keyed by absolute path.
+        Cached entries of files deleted from the directory are dropped.
+
+        Args:
+            path (str | PathLike): The directory to scan
+            pattern (str, optional): A glob of the files to identify. Defaults to "*.jar".
+            recursive (bool, optional): Include subdirectories. Defaults to False.
+            mods (bool, optional): Fetch the mod of every matched file. Defaults to True.
+        """
+        root = Path(path)
+        found = root.rglob(pattern) if recursive else root.glob(pattern)
+        paths = sorted(str(i.absolute()) for i in found if i.is_file())
+
+        self._prune(root)
+        return await self.scan(paths, mods)
+
+    async def scan_folders(self, path: PathLike, gameId: Games) -> FolderScanResult:
+        """Identifies the addon folders of a directory, such as the `AddOns` folder of WoW
+        or the `Mods` folder of Sims 4, keyed by absolute path. Every subdirectory is one addon.
+        The files of all folders are fingerprinted together across the pool, then every folder
+        is matched with `CurseAPI.get_fingerprints_fuzzy` in as few requests as fit.
+
+        Args:
+            path (str | PathLike): The directory holding the addon folders
+            gameId (Games): The game of the addons
+        """
+        root = Path(path)
+        files = {
+            str(i.absolute()): sorted(
+                str(j.absolute()) for j in i.rglob("*") if j.is_file()
+            )
+            for i in sorted(root.iterdir())
+            if i.is_dir()
+        }
+        self._prune(root)
+        fingerprints = await self.fingerprints(j for i in files.values() for j in i)
+
+        result = FolderScanResult({}, {})
+        owners: Dict[int, List[str]] = {}
+        for folder, paths in files.items():
+            found = [fingerprints[i] for i in paths if i in fingerprints]
+            if not found:
+                continue  # empty folders can not match
+            result.folders[folder] = FolderFingerprint(
+                foldername=os.path.basename(folder), fingerprints=found
+            )
+            for i in set(found):
+                owners.setdefault(i, []).append(folder)
+
+        result.result = await self.api.get_fingerprints_fuzzy(
+            gameId, list(result.folders.values()), self.chunk_size, self.concurrency
+        )
+        # matches do not name the folder, it is the one sharing the most fingerprints
+        best: Dict[str, int] = {}
+        for match in result.result.fuzzyMatches:
+            votes = Counter(
+                j for i in set(match.fingerprints) for j in owners.get(i, ())
+            )
+            if not votes:
+                continue
+            folder, shared = votes.most_common(1)[0]
+            if shared > best.get(folder, 0):
+                best[folder] = shared
+                result.matches[folder] = match
+        result.unmatched = [i for i in result.folders if i not in result.matches]
+        return result
+
+    def _prune(self, root: Path):
+        """drops cached files deleted from a directory"""
+        prefix = os.path.join(os.path.abspath(root), "")
+        self.cache.discard(
+            i for i in self.cache if i.startswith(prefix) and not os.path.exists(i)
+        )
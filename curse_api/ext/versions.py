@@ -0,0 +1,169 @@
+from __future__ import annotations
+import re
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from ..models import File, MinecraftGameVersion
+from .refresh import Refreshable
+
+if TYPE_CHECKING:
+    from ..api import CurseAPI
+
+_PARTS = re.compile(r"\d+")
+_VERSION = re.compile(r"\d+(\.\d+)*")
+_BASE = 100_000
+
+
+def version_key(version: str) -> Optional[int]:
+    """Returns an integer ordering release version strings such as "1.19.2",
+    or None for anything else such as "Forge", snapshots like "23w05a" and
+    pre-releases like "1.20-pre1", which would otherwise pass for a release.
+    Up to four parts are compared. `SortableGameVersion.gameVersionPadded` is accepted as well.
+    """
+    match = _VERSION.fullmatch(version.strip())
+    if match is None:
+        return None
+    parts = [int(i) for i in _PARTS.findall(match.group())[:4]]
+    parts += [0] * (4 - len(parts))
+    key = 0
+    for i in parts:
+        key = key * _BASE + min(i, _BASE - 1)
+    return key
+
+
+class MinecraftVersionIndex(Refreshable):
+    """A sorted, cached view of `CurseAPI.minecraft_versions`.
+    Every version string is given an integer sort key once, range queries
+    are binary searches and checking `File.gameVersions` only takes dict lookups.
+    Queries use the last loaded list, call `load` to fetch or refresh it.
+
+    ```py
+    index = await MinecraftVersionIndex(api).load()
+    modern = index.between("1.16", "1.20")
+    index.is_compatible(file, minimum="1.18")
+    ```
+    """
+
+    def __init__(
+        self,
+        api: Optional["CurseAPI"] = None,
+        ttl: float = 3600,
+        versions: Optional[Iterable[MinecraftGameVersion]] = None,
+    ) -> None:
+        """
+        Args:
+            api (CurseAPI, optional): The api used for fetching. Required by `load`.
+            ttl (float, optional): Seconds before the list is fetched again. Defaults to 3600.
+            versions (Iterable[MinecraftGameVersion], optional): Versions to index right away. Defaults to None.
+        """
+        super().__init__(ttl)
+        self.api = api
+        self._versions: List[MinecraftGameVersion] = []
+        self._sorted: List[int] = []
+        self._keys: Dict[str, Optional[int]] = {}
+        self._by_string: Dict[str, MinecraftGameVersion] = {}
+        self._newest_approved: Optional[MinecraftGameVersion] = None
+        if versions is not None:
+            self.index(versions)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __iter__(self):
+        return iter(self._versions)
+
+    def __contains__(self, version: str) -> bool:
+        return version in self._by_string
+
+    async def _fetch(self) -> List[MinecraftGameVersion]:
+        if self.api is None:
+            raise TypeError("an api is required to load versions")
+        return await self.api.minecraft_versions()
+
+    def index(self, versions: Iterable[MinecraftGameVersion]):
+        """Replaces the list and rebuilds every index"""
+        keyed = [(version_key(i.versionString), i) for i in versions]
+        keyed = sorted(((k, i) for k, i in keyed if k is not None), key=lambda i: i[0])
+        self._versions = [i for _, i in keyed]
+        self._sorted = [k for k, _ in keyed]
+        self._keys = {i.versionString: k for k, i in keyed}
+        self._by_string = {i.versionString: i for i in self._versions}
+        self._newest_approved = next(
+            (i for i in reversed(self._versions) if i.approved), None
+        )
+        self._refreshed(self.ttl)
+
+    def key(self, version: str) -> Optional[int]:
+        """Returns the sort key of a version string, parsed once then memoized.
+        None for strings which are not versions, such as "Forge" in `File.gameVersions`.
+        """
+        try:
+            return self._keys[version]
+        except KeyError:
+            key = self._keys[version] = version_key(version)
+            return key
+
+    def get(self, version: str) -> Optional[MinecraftGameVersion]:
+        return self._by_string.get(version)
+
+    def newest(self, approved: bool = True) -> Optional[MinecraftGameVersion]:
+        """Returns the newest version, only approved ones by default"""
+        if approved:
+            return self._newest_approved
+        return self._versions[-1] if self._versions else None
+
+    def between(
+        self, low: Optional[str] = None, high: Optional[str] = None
+    ) -> List[MinecraftGameVersion]:
+        """Returns the versions from `low` to `high` inclusive, oldest first.
+        A bound covers its patch versions, `between("1.16", "1.20")` includes 1.20.1.
+        Bounds do not need to be known versions, None leaves a side open.
+        """
+        start = bisect_left(self._sorted, self._bound(low)) if low else 0
+        end = (
+            bisect_right(self._sorted, self._bound(high, upper=True))
+            if high
+            else len(self._sorted)
+        )
+        return self._versions[start:end]
+
+    def at_least(self, version: str) -> List[MinecraftGameVersion]:
+        """Returns `version` and every newer version, oldest first"""
+        return self.between(version, None)
+
+    def compare(self, a: str, b: str) -> int:
+        """Returns -1, 0 or 1 like `a <=> b`, raises ValueError for non version strings"""
+        ka, kb = self.key(a), self.key(b)
+        if ka is None or kb is None:
+            raise ValueError(f"not a version: {a if ka is None else b!r}")
+        return (ka > kb) - (ka < kb)
+
+    def file_versions(self, file: File) -> List[int]:
+        """Returns the sort keys of the game versions of a file, skipping loaders and other tags"""
+        keys = (self.key(i) for i in file.gameVersions)
+        return sorted(i for i in keys if i is not None)
+
+    def is_compatible(
+        self, file: File, minimum: Optional[str] = None, maximum: Optional[str] = None
+    ) -> bool:
+        """True if a file lists any game version from `minimum` to `maximum` inclusive.
+        A bound covers its patch versions like in `between`.
+        """
+        low = self._bound(minimum) if minimum else 0
+        high = self._bound(maximum, upper=True) if maximum else _BASE ** 4
+        key = self.key
+        for i in file.gameVersions:
+            k = key(i)
+            if k is not None and low <= k <= high:
+                return True
+        return False
+
+    def _bound(self, version: str, upper: bool = False) -> int:
+        key = self.key(version)
+        if key is None:
+            raise ValueError(f"not a version: {version!r}")
+        if upper:
+            # "1.20" covers every 1.20.x, pad the unspecified parts
+            given = len(_PARTS.findall(version)[:4])
+            key += _BASE ** (4 - given) - 1
+        return key
@@ -0,0 +1,216 @@
+import mmap
+import os
+import sys
+from array import array
+from typing import Callable, Dict, Iterable, Optional, Union
+
+__all__ = [
+    "Hasher",
+    "HASHERS",
+    "WHITESPACE",
+    "default_hasher",
+    "fingerprint",
+    "fingerprint_file",
+    "get_hasher",
+    "murmur2",
+    "normalize",
+]
+
+WHITESPACE = b"\t\n\r "
+"""Bytes left out of fingerprints"""
+
+SEED = 1
+CHUNK_SIZE = 1 << 20
+
+_M = 0x5BD1E995
+_M_INVERSE = 0xE59B19BD
+"""`_M * _M_INVERSE == 1` modulo 2 ** 32"""
+_MASK = 0xFFFFFFFF
+
+Hasher = Callable[[bytes, int], int]
+"""Returns the 32 bit murmur2 hash of some bytes with a seed"""
+
+
+_LANES = 1 << 14
+"""Blocks mixed at once, larger big ints get slower again"""
+
+_LANE_MASK = int.from_bytes(b"\xff\xff\xff\xff\0\0\0\0" * _LANES, "little")
+
+
+def _mix(data: bytes) -> array:
+    """Returns `k *= m; k ^= k >> 24; k *= m` of every 4 byte block.
+    The blocks are spread into 64 bit lanes of one big int, a 32 bit block times
+    the 31 bit constant can not carry into the next lane, so each step is a single
+    big int operation in C followed by masking every lane back to 32 bits.
+    """
+    n = len(data) // 4
+    wide = bytearray(8 * n)
+    for i in range(4):
+        wide[i::8] = data[i::4]
+    mask = _LANE_MASK if n == _LANES else _LANE_MASK & ((1 << (64 * n)) - 1)
+
+    k = (int.from_bytes(wide, "little") * _M) & mask
+    k ^= (k >> 24) & mask
+    k = (k * _M) & mask
+
+    wide = k.to_bytes(8 * n, "little")
+    narrow = bytearray(4 * n)
+    for i in range(4):
+        narrow[i::4] = wide[i::8]
+    blocks = array("I")
+    blocks.frombytes(narrow)
+    if sys.byteorder == "big":
+        blocks.byteswap()
+    return blocks
+
+
+class _Murmur2:
+    """Incremental murmur2, the total length has to be known up front"""
+
+    def __init__(self, length: int, seed: int = SEED) -> None:
+        self.h = (seed ^ length) & _MASK
+        self._tail = b""
+
+    def update(self, data: bytes):
+        if self._tail:
+            data = self._tail + data
+        end = len(data) & ~3
+        self._tail = data[end:]
+
+        # only this step depends on the previous block and has to run in python
+        h, m, mask = self.h, _M, _MASK
+        for start in range(0, end, 4 * _LANES):
+            for k in _mix(data[start : min(start + 4 * _LANES, end)]):
+                h = ((h * m) ^ k) & mask
+        self.h = h
+
+    def digest(self) -> int:
+        h, tail = self.h, self._tail
+        if tail:
+            for i, b in enumerate(tail):
+                h ^= b << (8 * i)
+            h = (h * _M) & _MASK
+        h ^= h >> 13
+        h = (h * _M) & _MASK
+        return h ^ (h >> 15)
+
+
+def _murmur2(data: bytes, seed: int) -> int:
+    hasher = _Murmur2(len(data), seed)
+    hasher.update(data)
+    return hasher.digest()
+
+
+def _unfinalize(h: int) -> int:
+    """Undoes the final mixing of murmur2, giving the state after the last block"""
+    h ^= (h >> 15) ^ (h >> 30)
+    h = (h * _M_INVERSE) & _MASK
+    return h ^ (h >> 13) ^ (h >> 26)
+
+
+def _python() -> Hasher:
+    return _murmur2
+
+
+def _murmurhash2() -> Hasher:
+    from murmurhash2 import murmurhash2
+
+    return murmurhash2
+
+
+# in order of preference, the pure python hasher runs at tens of MB/s
+HASHERS: Dict[str, Callable[[], Hasher]] = {
+    "murmurhash2": _murmurhash2,
+    "python": _python,
+}
+
+
+def get_hasher(name: str) -> Hasher:
+    """Returns a hasher by name, raising `ImportError` if its library is missing"""
+    try:
+        return HASHERS[name]()
+    except KeyError:
+        raise ValueError(f"unknown hasher {name!r}, expected one of {list(HASHERS)}")
+
+
+_default: Optional[Hasher] = None
+
+
+def default_hasher() -> Hasher:
+    """Returns the fastest installed hasher"""
+    global _default
+    if _default is None:
+        for load in HASHERS.values():
+            try:
+                _default = load()
+                break
+            except ImportError:
+                continue
+    return _default  # type: ignore
+
+
+def normalize(data: bytes) -> bytes:
+    """Removes the whitespace bytes ignored by fingerprints"""
+    return data.translate(None, WHITESPACE)
+
+
+def murmur2(data: bytes, seed: int = SEED, hasher: Optional[Hasher] = None) -> int:
+    """Returns the murmur2 hash of some bytes as is"""
+    return (hasher or default_hasher())(data, seed)
+
+
+def fingerprint(data: bytes, hasher: Optional[Hasher] = None) -> int:
+    """Returns the CurseForge fingerprint of some bytes, as used by `CurseAPI.get_fingerprints`"""
+    return murmur2(normalize(data), SEED, hasher)
+
+
+def _chunks(view: mmap.mmap, chunk_size: int) -> Iterable[bytes]:
+    for i in range(0, len(view), chunk_size):
+        yield view[i : i + chunk_size]
+
+
+def _stream(chunks: Iterable[bytes], length: int, seed: int, hasher: Hasher) -> int:
+    """Returns the murmur2 hash of the joined chunks using a hasher of whole buffers.
+    Each run of whole blocks is hashed on its own seeded with the state so far,
+    the state is recovered from the result by undoing the final mixing.
+    """
+    h = (seed ^ length) & _MASK
+    tail = b""
+    for chunk in chunks:
+        data = tail + chunk if tail else chunk
+        end = len(data) & ~3
+        tail = data[end:]
+        if end:
+            h = _unfinalize(hasher(data if end == len(data) else data[:end], h ^ end))
+    return hasher(tail, h ^ len(tail))
+
+
+def fingerprint_file(
+    path: Union[str, "os.PathLike[str]"],
+    chunk_size: int = CHUNK_SIZE,
+    hasher: Optional[Hasher] = None,
+) -> int:
+    """Returns the CurseForge fingerprint of a file.
+    The file is memory mapped and normalized once into an anonymous map, as the length
+    without whitespace seeds the hash. That map is hashed a chunk at a time,
+    so a native hasher runs at native speed on files of any size.
+
+    Args:
+        path (str | PathLike): The file to fingerprint
+        chunk_size (int, optional): Bytes normalized and hashed at once. Defaults to 1 MiB.
+        hasher (Hasher, optional): Defaults to `default_hasher()`.
+    """
+    hasher = hasher or default_hasher()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return murmur2(b"", SEED, hasher)  # empty files can not be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            with mmap.mmap(-1, len(view)) as normalized:
+                for i in _chunks(view, chunk_size):
+                    normalized.write(normalize(i))
+                length = normalized.tell()
+                chunks = (
+                    normalized[i : min(i + chunk_size, length)]
+                    for i in range(0, length, chunk_size)
+                )
+                return _stream(chunks, length, SEED, hasher)
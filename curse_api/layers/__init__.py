@@ -0,0 +1,21 @@
+from .base import FactoryWrapper, request_key
+from .breaker import CircuitBreakerFactory
+from .cache import CacheFactory, ResponseCache
+from .hedge import HedgedFactory
+from .ratelimit import RateLimitFactory, TokenBucket
+from .retry import RetryFactory, RetryPolicy
+from .singleflight import SingleflightFactory
+
+__all__ = (
+    "CacheFactory",
+    "CircuitBreakerFactory",
+    "FactoryWrapper",
+    "HedgedFactory",
+    "RateLimitFactory",
+    "ResponseCache",
+    "RetryFactory",
+    "RetryPolicy",
+    "SingleflightFactory",
+    "TokenBucket",
+    "request_key",
+)
@@ -0,0 +1,116 @@
+import json
+import time
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..abc import APIFactory
+
+__all__ = [
+    "FactoryWrapper",
+    "READ_ONLY_POSTS",
+    "is_failure",
+    "request_key",
+    "retry_after",
+    "status_of",
+]
+
+# POST endpoints which only read data, these are as safe to repeat as a GET
+READ_ONLY_POSTS = frozenset(
+    (
+        "/v1/mods",
+        "/v1/mods/files",
+        "/v1/fingerprints",
+        "/v1/fingerprints/fuzzy",
+    )
+)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def request_key(method: str, url: str, params: Optional[dict] = None) -> str:
+    """Returns a stable key for a request, params are order independent"""
+    return json.dumps(
+        [method.upper(), url, params or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_normalize,
+    )
+
+
+def status_of(exc: BaseException) -> Optional[int]:
+    """Returns the HTTP status of an httpx or aiohttp error, None for transport errors"""
+    response = getattr(exc, "response", None)  # httpx.HTTPStatusError
+    status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def is_failure(exc: BaseException) -> bool:
+    """True if an error says the upstream is unhealthy: transport errors, 5xx and 429.
+    Other client errors are valid answers from a healthy server.
+    """
+    status = status_of(exc)
+    return status is None or status >= 500 or status == 429
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Returns the seconds asked for by the Retry-After header of an httpx or aiohttp error"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exc, "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class FactoryWrapper(APIFactory):
+    """The base of factories adding behaviour around another factory.
+    Every call is passed through to the wrapped factory unless overridden.
+    """
+
+    def __init__(self, factory: APIFactory) -> None:
+        if not issubclass(type(factory), APIFactory):
+            raise TypeError("factory must be an APIFactory")
+        self._factory = factory
+
+    @property
+    def factory(self) -> APIFactory:
+        """The wrapped factory"""
+        return self._factory
+
+    async def close(self):
+        await self._factory.close()
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._factory.get(url, params, **kwargs)
+
+    async def post(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._factory.post(url, params, **kwargs)
+
+    async def download(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
+        return await self._factory.download(url, chunk_size)
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> AsyncIterator[bytes]:
+        # streams are passed through, a partially consumed body can not be cached or retried
+        return self._factory.stream(method, url, params, chunk_size)
@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from ..abc import APIFactory
+from ..errors import CircuitOpenException
+from .base import FactoryWrapper, is_failure, request_key
+from .cache import ResponseCache
+
+__all__ = [
+    "BreakerStats",
+    "CircuitBreakerFactory",
+    "CircuitState",
+]
+
+
+class CircuitState(Enum):
+    Closed = "closed"
+    Open = "open"
+    HalfOpen = "half_open"
+
+
+@dataclass
+class BreakerStats:
+    opened: int = 0
+    rejected: int = 0
+    """Requests failed fast while open"""
+    fallbacks: int = 0
+    """Rejected GETs answered from the fallback cache"""
+
+
+class CircuitBreakerFactory(FactoryWrapper):
+    """Stops sending requests while the API is failing or too slow.
+    Opens once the error or slow call rate of the last `window` calls passes its threshold.
+    While open requests raise `CircuitOpenException`, or are answered from `fallback` if it has the GET.
+    After `open_for` seconds `probes` requests are let through, closing it again if they succeed.
+    """
+
+    def __init__(
+        self,
+        factory: APIFactory,
+        error_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_threshold: float = 0.8,
+        window: int = 50,
+        min_calls: int = 10,
+        open_for: float = 30.0,
+        probes: int = 1,
+        fallback: Optional[ResponseCache] = None,
+    ) -> None:
+        """
+        Args:
+            factory (APIFactory): The factory to wrap
+            error_threshold (float, optional): The failure rate opening the circuit. Defaults to 0.5.
+            slow_call_duration (float, optional): Seconds after which a call counts as slow, None disables. Defaults to None.
+            slow_threshold (float, optional): The slow call rate opening the circuit. Defaults to 0.8.
+            window (int, optional): The number of recent calls considered. Defaults to 50.
+            min_calls (int, optional): Calls needed in the window before it can open. Defaults to 10.
+            open_for (float, optional): Seconds to fail fast before probing. Defaults to 30.
+            probes (int, optional): Successful probes needed to close. Defaults to 1.
+            fallback (ResponseCache, optional): A cache serving GETs while open, such as the one of a `CacheFactory`.
+        """
+        super().__init__(factory)
+        self.error_threshold = error_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_threshold = slow_threshold
+        self.min_calls = min_calls
+        self.open_for = open_for
+        self.probes = probes
+        self.fallback = fallback
+        self.stats = BreakerStats()
+        self.state = CircuitState.Closed
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probing = 0
+        self._probed = 0
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._guard(
+            "GET", url, params, lambda: self._factory.get(url, params, **kwargs)
+        )
+
+    async def post(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._guard(
+            "POST", url, params, lambda: self._factory.post(url, params, **kwargs)
+        )
+
+    def _allow(self) -> bool:
+        if self.state is CircuitState.Open:
+            if time.monotonic() < self._opened_at + self.open_for:
+                return False
+            self.state = CircuitState.HalfOpen
+            self._probing = self._probed = 0
+
+        if self.state is CircuitState.HalfOpen:
+            if self._probing >= self.probes:
+                return False
+            self._probing += 1
+        return True
+
+    def _open(self):
+        self.state = CircuitState.Open
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+        self.stats.opened += 1
+
+    def _record(self, ok: bool, latency: float, probe: bool):
+        slow = self.slow_call_duration is not None and latency > self.slow_call_duration
+        if probe:
+            if self.state is not CircuitState.HalfOpen:
+                return
+            self._probing -= 1
+            if not ok or slow:
+                self._open()
+            else:
+                self._probed += 1
+                if self._probed >= self.probes:
+                    self.state = CircuitState.Closed
+            return
+        if self.state is not CircuitState.Closed:
+            return  # sent before the circuit opened
+
+        self._calls.append((ok, slow))
+        if len(self._calls) < self.min_calls:
+            return
+        failures = sum(not i for i, _ in self._calls) / len(self._calls)
+        slows = sum(i for _, i in self._calls) / len(self._calls)
+        if failures >= self.error_threshold or slows >= self.slow_threshold:
+            self._open()
+
+    async def _guard(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        call: Callable[[], Awaitable[Dict[Any, Any]]],
+    ) -> Dict[Any, Any]:
+        if not self._allow():
+            self.stats.rejected += 1
+            if method == "GET" and self.fallback is not None:
+                entry = self.fallback.get(request_key(method, url, params))
+                if entry is not None:
+                    self.stats.fallbacks += 1
+                    return entry.value
+            raise CircuitOpenException(
+                max(self._opened_at + self.open_for - time.monotonic(), 0.0)
+            )
+
+        probe = self.state is CircuitState.HalfOpen
+        start = time.monotonic()
+        try:
+            res = await call()
+        except asyncio.CancelledError:
+            if probe and self.state is CircuitState.HalfOpen:
+                self._probing -= 1
+            raise
+        except Exception as e:
+            self._record(not is_failure(e), time.monotonic() - start, probe)
+            raise
+        self._record(True, time.monotonic() - start, probe)
+        return res
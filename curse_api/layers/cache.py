@@ -0,0 +1,244 @@
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Mapping, Optional, Pattern, Tuple
+
+from ..abc import APIFactory
+from .base import FactoryWrapper, request_key
+
+__all__ = [
+    "CacheEntry",
+    "CacheFactory",
+    "CacheStats",
+    "DEFAULT_TTLS",
+    "ResponseCache",
+    "conditional_headers",
+]
+
+# url patterns and their time to live in seconds, the first match is used
+DEFAULT_TTLS: Mapping[str, float] = {
+    r"/v1/games": 24 * 3600,
+    r"/v1/categories": 3600,
+    r"/v1/minecraft/version": 3600,
+    r"/v1/minecraft/modloader": 3600,
+    r"/v1/mods/\d+/files/\d+/changelog$": 24 * 3600,
+    r"/v1/mods/\d+/files/\d+$": 24 * 3600,
+    r"/v1/mods/\d+/files/\d+/download-url$": 3600,
+    r"/v1/mods/\d+/description$": 900,
+    r"/v1/mods/\d+$": 300,
+    r"/v1/mods/\d+/files$": 300,
+    r"/v1/mods/search": 120,
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    """Hits served from an expired entry while it is refreshed"""
+    evictions: int = 0
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    expires: float
+    """The `time.monotonic` time after which the entry is stale"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+
+def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+    """Returns the headers revalidating an entry, empty without validators"""
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+class ResponseCache:
+    """An in-memory LRU cache of decoded responses, bounded by entry count and bytes.
+    Expired entries are kept until evicted so they can still be served stale.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = 64 * 1024**2
+    ) -> None:
+        """
+        Args:
+            max_entries (int, optional): The max number of entries. Defaults to 1024.
+            max_bytes (int, optional): The max total size of entries as JSON. Defaults to 64MiB.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of all entries in bytes"""
+        return self._bytes
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns an entry, fresh or not, marking it as recently used"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Stores a value for `ttl` seconds, evicting the least recently used entries to fit.
+        `size` is measured as JSON when not given.
+        """
+        if size is None:
+            size = len(json.dumps(value, separators=(",", ":"), default=str))
+        self.pop(key)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = CacheEntry(
+            value, size, time.monotonic() + ttl, etag, last_modified
+        )
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.stats.evictions += 1
+
+    def pop(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+
+class CacheFactory(FactoryWrapper):
+    """Caches GET responses in a `ResponseCache` with per-endpoint TTLs.
+    With `stale_while_revalidate` expired entries are served instantly while a
+    single background request refreshes them.
+
+    Passing the same `ResponseCache` as the `validators` of `HttpxFactory` or `AiohttpFactory`
+    makes refreshes of expired entries conditional requests.
+    """
+
+    def __init__(
+        self,
+        factory: APIFactory,
+        cache: Optional[ResponseCache] = None,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        default_ttl: float = 0,
+        stale_while_revalidate: float = 0,
+    ) -> None:
+        """
+        Args:
+            factory (APIFactory): The factory to wrap
+            cache (ResponseCache, optional): The storage to use, can be shared between factories. Defaults to a new `ResponseCache`.
+            ttls (Mapping[str, float], optional): Url regex patterns to seconds to cache for. Defaults to `DEFAULT_TTLS`.
+            default_ttl (float, optional): Seconds to cache unmatched urls for, 0 disables caching. Defaults to 0.
+            stale_while_revalidate (float, optional): Seconds past expiry an entry may still be served. Defaults to 0.
+        """
+        super().__init__(factory)
+        self.cache = cache if cache is not None else ResponseCache()
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._ttls: Tuple[Tuple[Pattern, float], ...] = tuple(
+            (re.compile(k), v) for k, v in ttls.items()
+        )
+        self._refreshing: Dict[str, asyncio.Future] = {}
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def ttl(self, url: str) -> float:
+        """Returns the seconds a url is cached for"""
+        for pattern, ttl in self._ttls:
+            if pattern.match(url):
+                return ttl
+        return self.default_ttl
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        ttl = self.ttl(url)
+        if kwargs or ttl <= 0:
+            return await super().get(url, params, **kwargs)
+
+        key = request_key("GET", url, params)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.fresh:
+                self.stats.hits += 1
+                return entry.value
+            if time.monotonic() < entry.expires + self.stale_while_revalidate:
+                self.stats.stale += 1
+                self._refresh(key, url, params, ttl)
+                return entry.value
+
+        self.stats.misses += 1
+        value = await self._factory.get(url, params)
+        self._save(key, value, ttl)
+        return value
+
+    def _save(self, key: str, value: Any, ttl: float):
+        entry = self.cache.get(key)
+        if entry is not None and entry.value is value:
+            # already stored by a revalidating factory, keep its validators
+            entry.expires = time.monotonic() + ttl
+        else:
+            self.cache.set(key, value, ttl)
+
+    def _refresh(self, key: str, url: str, params: Optional[dict], ttl: float):
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            value = await self._factory.get(url, params)
+            self._save(key, value, ttl)
+
+        fut = self._refreshing[key] = asyncio.ensure_future(refresh())
+        fut.add_done_callback(lambda f: self._refreshed(key, f))
+
+    def _refreshed(self, key: str, fut: asyncio.Future):
+        del self._refreshing[key]
+        if not fut.cancelled():
+            fut.exception()  # a failed refresh keeps serving the stale entry
+
+    async def close(self):
+        for fut in list(self._refreshing.values()):
+            fut.cancel()
+        await super().close()
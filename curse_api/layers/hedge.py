@@ -0,0 +1,184 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+from ..abc import APIFactory
+from .base import is_failure
+
+__all__ = [
+    "HedgeStats",
+    "HedgedFactory",
+    "HostHealth",
+]
+
+Call = Callable[[APIFactory], Awaitable[Dict[Any, Any]]]
+
+
+class HostHealth:
+    """Recent latencies and an error rate of one factory"""
+
+    def __init__(self, samples: int = 200, decay: float = 0.1) -> None:
+        self.latencies: Deque[float] = deque(maxlen=samples)
+        self.error_rate = 0.0
+        """An exponentially weighted average of failures, 0 is healthy"""
+        self._decay = decay
+
+    def record(self, latency: float, ok: bool):
+        if ok:
+            self.latencies.append(latency)
+        self.error_rate += self._decay * ((not ok) - self.error_rate)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(p * len(ordered)), len(ordered) - 1)]
+
+    @property
+    def cost(self) -> float:
+        """Lower is better, slow or failing hosts cost more"""
+        median = self.percentile(0.5) or 0.0
+        return (median + 0.001) * (1 + 20 * self.error_rate)
+
+
+@dataclass
+class HedgeStats:
+    hedged: int = 0
+    """Requests where a second request was fired"""
+    hedge_wins: int = 0
+    """Hedged requests answered by the second request"""
+    failovers: int = 0
+    """Requests repeated on another factory after an error"""
+
+
+class HedgedFactory(APIFactory):
+    """Sends requests to the healthiest of several factories, usually the same API behind
+    different base urls such as a caching mirror.
+    A GET without a response within the `percentile` latency of its factory is repeated
+    on the next best factory and the first response wins.
+    Server and transport errors fail over to the next factory.
+    """
+
+    def __init__(
+        self,
+        factories: Sequence[APIFactory],
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        Args:
+            factories (Sequence[APIFactory]): Factories in order of preference
+            percentile (float, optional): The latency percentile after which a GET is hedged. Defaults to 0.95.
+            min_delay (float, optional): The shortest hedge delay in seconds. Defaults to 0.05.
+            max_delay (float, optional): The longest hedge delay, also used until enough samples are recorded. Defaults to 2.
+            min_samples (int, optional): Latencies needed before the percentile is trusted. Defaults to 20.
+        """
+        if not factories:
+            raise ValueError("at least one factory is required")
+        self.factories = list(factories)
+        self.health = [HostHealth() for _ in self.factories]
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.stats = HedgeStats()
+
+    def ranked(self) -> List[int]:
+        """Indexes of the factories, healthiest first. Ties keep the given order"""
+        return sorted(range(len(self.factories)), key=lambda i: self.health[i].cost)
+
+    def hedge_delay(self, index: int) -> float:
+        health = self.health[index]
+        if len(health.latencies) < self.min_samples:
+            return self.max_delay
+        delay = health.percentile(self.percentile) or self.max_delay
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    async def close(self):
+        await asyncio.gather(*(i.close() for i in self.factories))
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._send(lambda f: f.get(url, params, **kwargs), hedge=True)
+
+    async def post(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._send(lambda f: f.post(url, params, **kwargs), hedge=False)
+
+    async def download(self, url: str, chunk_size: int) -> AsyncIterator[bytes]:
+        return await self.factories[self.ranked()[0]].download(url, chunk_size)
+
+    async def _attempt(self, index: int, call: Call) -> Dict[Any, Any]:
+        start = time.monotonic()
+        try:
+            res = await call(self.factories[index])
+        except asyncio.CancelledError:  # a lost race says nothing about health
+            raise
+        except Exception as e:
+            self.health[index].record(time.monotonic() - start, not is_failure(e))
+            raise
+        self.health[index].record(time.monotonic() - start, True)
+        return res
+
+    async def _send(self, call: Call, hedge: bool) -> Dict[Any, Any]:
+        order = self.ranked()
+        # with one factory a hedge is sent to the same one again
+        backups = iter(order[1:] or (order if hedge else ()))
+        primary = asyncio.ensure_future(self._attempt(order[0], call))
+        tasks = {primary: order[0]}
+        delay: Optional[float] = self.hedge_delay(order[0]) if hedge else None
+        hedged = False
+        error: Optional[BaseException] = None
+
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(
+                    tasks, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    delay = None  # hedge once
+                    backup = next(backups, None)
+                    if backup is not None:
+                        hedged = True
+                        self.stats.hedged += 1
+                        tasks[
+                            asyncio.ensure_future(self._attempt(backup, call))
+                        ] = backup
+                    continue
+
+                for task in done:
+                    tasks.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        if hedged and task is not primary:
+                            self.stats.hedge_wins += 1
+                        return task.result()
+                    if not is_failure(exc):
+                        raise exc
+                    error = exc
+                    backup = next(backups, None)
+                    if backup is not None:
+                        self.stats.failovers += 1
+                        tasks[
+                            asyncio.ensure_future(self._attempt(backup, call))
+                        ] = backup
+            raise error  # type: ignore
+        finally:
+            for task in tasks:
+                task.cancel()
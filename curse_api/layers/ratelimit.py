@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional
+
+from ..abc import APIFactory
+from .base import FactoryWrapper, retry_after, status_of
+
+__all__ = [
+    "RateLimitFactory",
+    "TokenBucket",
+]
+
+
+class TokenBucket:
+    """An adaptive token bucket allowing `rate` requests per second with bursts of `burst`.
+    A 429 halves the rate and blocks until its Retry-After, every success then raises
+    the rate again a little until `max_rate` is reached.
+    Buckets are not thread safe, share them between tasks of one event loop.
+    """
+
+    _shared: ClassVar[Dict[str, "TokenBucket"]] = {}
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: int = 20,
+        min_rate: float = 0.5,
+        increase: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            rate (float, optional): Requests allowed per second. Defaults to 10.
+            burst (int, optional): The max number of requests sent at once after idling. Defaults to 20.
+            min_rate (float, optional): The rate never drops below this. Defaults to 0.5.
+            increase (float, optional): The rate regained per success. Defaults to 1% of `rate`.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.max_rate = self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase if increase is not None else rate / 100
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    @classmethod
+    def shared(cls, key: str, rate: float = 10, burst: int = 20) -> "TokenBucket":
+        """Returns the bucket shared by everything using `key`, such as an API key.
+        `rate` and `burst` only apply when the bucket is created.
+        """
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        bucket = cls._shared.get(digest)
+        if bucket is None:
+            bucket = cls._shared[digest] = cls(rate, burst)
+        return bucket
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Waits for a token, tokens are handed out in call order"""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1  # reserve, a negative balance queues behind earlier callers
+        delay = max(self._blocked_until - now, -self._tokens / self.rate)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Slows down after a 429, blocking every caller for `retry_after` seconds"""
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def reward(self):
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+class RateLimitFactory(FactoryWrapper):
+    """Throttles requests with a `TokenBucket`.
+    A 429 is retried after its Retry-After, up to `max_retries` times.
+    """
+
+    def __init__(
+        self,
+        factory: APIFactory,
+        bucket: Optional[TokenBucket] = None,
+        key: Optional[str] = None,
+        rate: float = 10,
+        burst: int = 20,
+        max_retries: int = 3,
+    ) -> None:
+        """
+        Args:
+            factory (APIFactory): The factory to wrap
+            bucket (TokenBucket, optional): The bucket to take tokens from. Defaults to the shared bucket of `key`.
+            key (str, optional): Usually the API key, factories with the same key share one bucket. Defaults to a private bucket.
+            rate (float, optional): Requests per second of a new bucket. Defaults to 10.
+            burst (int, optional): The burst of a new bucket. Defaults to 20.
+            max_retries (int, optional): Retries of a request answered with 429. Defaults to 3.
+        """
+        super().__init__(factory)
+        if bucket is None:
+            bucket = (
+                TokenBucket.shared(key, rate, burst)
+                if key is not None
+                else TokenBucket(rate, burst)
+            )
+        self.bucket = bucket
+        self.max_retries = max_retries
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._limit(lambda: self._factory.get(url, params, **kwargs))
+
+    async def post(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._limit(lambda: self._factory.post(url, params, **kwargs))
+
+    async def _limit(
+        self, call: Callable[[], Awaitable[Dict[Any, Any]]]
+    ) -> Dict[Any, Any]:
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            try:
+                res = await call()
+            except Exception as e:
+                if status_of(e) != 429:
+                    raise
+                self.bucket.penalize(retry_after(e))
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                continue
+            self.bucket.reward()
+            return res
@@ -0,0 +1,145 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from ..abc import APIFactory
+from .base import READ_ONLY_POSTS, FactoryWrapper, retry_after, status_of
+
+__all__ = [
+    "RetryFactory",
+    "RetryPolicy",
+    "RetryStats",
+    "TRANSPORT_ERRORS",
+]
+
+
+def _transport_errors() -> Tuple[Type[BaseException], ...]:
+    errors = [OSError, asyncio.TimeoutError]
+    try:
+        import httpx
+
+        errors.append(httpx.TransportError)
+    except ImportError:
+        pass
+    try:
+        import aiohttp
+
+        errors += [aiohttp.ClientConnectionError, aiohttp.ClientPayloadError]
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+# connection resets, timeouts and broken bodies of the installed clients
+TRANSPORT_ERRORS = _transport_errors()
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before repeating a failed request"""
+
+    max_attempts: int = 4
+    """Attempts including the first one"""
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    statuses: FrozenSet[int] = frozenset((408, 429, 500, 502, 503, 504))
+    exceptions: Tuple[Type[BaseException], ...] = TRANSPORT_ERRORS
+    posts: FrozenSet[str] = field(default_factory=lambda: READ_ONLY_POSTS)
+    """POST urls which are safe to repeat"""
+
+    def retryable(self, exc: BaseException) -> bool:
+        status = status_of(exc)
+        if status is not None:
+            return status in self.statuses
+        return isinstance(exc, self.exceptions)
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Exponential backoff with full jitter, never shorter than a Retry-After"""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        wait = retry_after(exc) if exc is not None else None
+        return max(backoff, min(wait, self.max_delay)) if wait else backoff
+
+
+@dataclass
+class RetryStats:
+    retries: int = 0
+    """Attempts made after a failure"""
+    recovered: int = 0
+    """Requests which succeeded after retrying"""
+    exhausted: int = 0
+    """Requests which failed after every attempt"""
+
+
+class RetryFactory(FactoryWrapper):
+    """Retries GETs and read-only POSTs failing with a transient error"""
+
+    def __init__(
+        self,
+        factory: APIFactory,
+        policy: Optional[RetryPolicy] = None,
+        on_retry: Optional[
+            Callable[[str, str, int, BaseException, float], None]
+        ] = None,
+    ) -> None:
+        """
+        Args:
+            factory (APIFactory): The factory to wrap
+            policy (RetryPolicy, optional): Defaults to `RetryPolicy()`.
+            on_retry (Callable, optional): Called with the method, url, attempt, error and delay before each retry.
+        """
+        super().__init__(factory)
+        self.policy = policy or RetryPolicy()
+        self.on_retry = on_retry
+        self.stats = RetryStats()
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        return await self._retry(
+            "GET", url, lambda: self._factory.get(url, params, **kwargs)
+        )
+
+    async def post(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        if url not in self.policy.posts:
+            return await super().post(url, params, **kwargs)
+        return await self._retry(
+            "POST", url, lambda: self._factory.post(url, params, **kwargs)
+        )
+
+    async def _retry(
+        self, method: str, url: str, call: Callable[[], Awaitable[Dict[Any, Any]]]
+    ) -> Dict[Any, Any]:
+        attempt = 0
+        while True:
+            try:
+                res = await call()
+            except Exception as e:
+                attempt += 1
+                if not self.policy.retryable(e):
+                    raise
+                if attempt >= self.policy.max_attempts:
+                    self.stats.exhausted += 1
+                    raise
+
+                delay = self.policy.delay(attempt - 1, e)
+                self.stats.retries += 1
+                if self.on_retry is not None:
+                    self.on_retry(method, url, attempt, e, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            if attempt:
+                self.stats.recovered += 1
+            return res
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from ..abc import APIFactory
+from .base import READ_ONLY_POSTS, FactoryWrapper, request_key
+
+__all__ = [
+    "SingleflightFactory",
+]
+
+
+class SingleflightFactory(FactoryWrapper):
+    """Concurrent identical requests share one underlying call and its decoded result.
+    Errors are raised to every waiter. The shared dict must be treated as read only.
+    """
+
+    def __init__(
+        self,
+        factory: APIFactory,
+        posts: Iterable[str] = READ_ONLY_POSTS,
+    ) -> None:
+        """
+        Args:
+            factory (APIFactory): The factory to wrap
+            posts (Iterable[str], optional): POST urls that may be shared. Defaults to `READ_ONLY_POSTS`.
+        """
+        super().__init__(factory)
+        self.posts = frozenset(posts)
+        self.shared = 0
+        """The number of calls answered by an already in-flight request"""
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def get(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        if kwargs:
+            return await super().get(url, params, **kwargs)
+        return await self._flight(
+            "GET", url, params, lambda: self._factory.get(url, params)
+        )
+
+    async def post(
+        self, url: str, params: Optional[dict] = None, **kwargs
+    ) -> Dict[Any, Any]:
+        if kwargs or url not in self.posts:
+            return await super().post(url, params, **kwargs)
+        return await self._flight(
+            "POST", url, params, lambda: self._factory.post(url, params)
+        )
+
+    async def _flight(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        call: Callable[[], Awaitable[Dict[Any, Any]]],
+    ) -> Dict[Any, Any]:
+        key = request_key(method, url, params)
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = self._inflight[key] = asyncio.ensure_future(call())
+            fut.add_done_callback(lambda f: self._land(key, f))
+        else:
+            self.shared += 1
+
+        # a cancelled waiter must not cancel the call for everyone else
+        return await asyncio.shield(fut)
+
+    def _land(self, key: str, fut: asyncio.Future):
+        if self._inflight.get(key) is fut:
+            del self._inflight[key]
+        if not fut.cancelled():
+            fut.exception()  # mark as retrieved when every waiter left early
@@ -1,8 +1,20 @@
 import json
 from datetime import datetime
-from typing import Any, List, Optional, TextIO
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+)
 
 from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 from pydantic.json import pydantic_encoder
 
 from .enums import (
@@ -19,7 +31,9 @@ from .enums import (
     ModStatus,
     Games,
 )
-from .categories import CATEGORIES, BaseCategory
+
+if TYPE_CHECKING:
+    from .categories import BaseCategory
 
 """
 schemas can be found at https://docs.curseforge.com/#schemas
@@ -27,6 +41,96 @@ If exceptions to the format or naming conventions there will be a comment detail
 """
 
 
+class Hydration(Enum):
+    """How models are built from API data"""
+
+    validate = "validate"
+    """Fully validated by pydantic, the default"""
+    trusted = "trusted"
+    """Built without validation, only datetimes, enums and nested models are converted"""
+    lazy = "lazy"
+    """Built like `trusted` but lists of nested models are only hydrated once read"""
+
+
+Converter = Callable[[Any], Any]
+
+
+def _parse_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass  # older pythons only accept 3 or 6 fraction digits
+    return parse_datetime(value)
+
+
+def _is_model(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseCurseModel)
+
+
+def _converter(field: ModelField, lazy: bool = False) -> Optional[Converter]:
+    """returns what converts a trusted value of a field, None if it is used as is"""
+    type_ = field.type_
+    convert: Optional[Converter] = None
+    if isinstance(type_, type):
+        if issubclass(type_, BaseCurseModel):
+            if lazy and field.shape == SHAPE_LIST:
+                return lambda v: _Deferred(type_, v) if v is not None else None
+            convert = type_.from_lazy_dict if lazy else type_.from_trusted_dict
+        elif issubclass(type_, datetime):
+            convert = _parse_datetime
+        elif issubclass(type_, Enum):
+            convert = type_
+
+    if convert is None or field.shape not in (SHAPE_SINGLETON, SHAPE_LIST):
+        return None
+    item = convert
+    if field.shape == SHAPE_LIST:
+        return lambda v: [item(i) for i in v] if v is not None else None
+    if field.allow_none:
+        return lambda v: item(v) if v is not None else None
+    return item
+
+
+class _Deferred:
+    """The raw items of a list of models, hydrated on first access"""
+
+    __slots__ = ("model", "items")
+
+    def __init__(self, model: Type["BaseCurseModel"], items: List[dict]) -> None:
+        self.model = model
+        self.items = items
+
+    def resolve(self) -> List["BaseCurseModel"]:
+        return [self.model.from_lazy_dict(i) for i in self.items]
+
+    def __repr__(self) -> str:
+        return f"<deferred {len(self.items)} {self.model.__name__}>"
+
+
+class _LazyField:
+    """Hydrates and memoizes a deferred field when it is read"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            raise AttributeError(self.name)
+        value = obj.__dict__[self.name]
+        if type(value) is _Deferred:
+            value = obj.__dict__[self.name] = value.resolve()
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+Plan = Tuple[Tuple[str, str, Optional[Converter], Any], ...]
+
+
 class BaseCurseModel(BaseModel):
     """The base for curseforge data"""
 
@@ -39,6 +143,72 @@ class BaseCurseModel(BaseModel):
         """Given data returns a hydrated object"""
         return cls.parse_obj(data)
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict):
+        """Given data straight from the API returns a hydrated object without validating it.
+        Only datetimes, enums and nested models are converted, malformed data is not detected.
+        """
+        plan = cls.__dict__.get("_trusted_plan")
+        if plan is None:
+            plan = cls._build_plan("_trusted_plan", lazy=False)
+        return cls._from_plan(data, plan)
+
+    @classmethod
+    def from_lazy_dict(cls, data: dict):
+        """Like `from_trusted_dict` but lists of nested models are kept as raw dicts
+        until the field is first read, then hydrated and memoized.
+        """
+        plan = cls.__dict__.get("_lazy_plan")
+        if plan is None:
+            plan = cls._build_plan("_lazy_plan", lazy=True)
+        return cls._from_plan(data, plan)
+
+    @classmethod
+    def _from_plan(cls, data: dict, plan: Plan):
+        values = {}
+        for name, alias, convert, default in plan:
+            value = data.get(alias, default)
+            values[name] = convert(value) if convert is not None else value
+
+        m = cls.__new__(cls)
+        object.__setattr__(m, "__dict__", values)
+        object.__setattr__(m, "__fields_set__", set(values))
+        m._init_private_attributes()
+        return m
+
+    @classmethod
+    def _build_plan(cls, attr: str, lazy: bool) -> Plan:
+        plan = tuple(
+            (name, field.alias, _converter(field, lazy), field.get_default())
+            for name, field in cls.__fields__.items()
+        )
+        if lazy:
+            # pydantic keeps fields in the instance dict, a data descriptor is read first
+            for name, field in cls.__fields__.items():
+                if field.shape == SHAPE_LIST and _is_model(field.type_):
+                    type.__setattr__(cls, name, _LazyField(name))
+        type.__setattr__(cls, attr, plan)
+        return plan
+
+    @classmethod
+    def hydrate(cls, data: dict, hydration: "Hydration" = Hydration.validate):
+        """Builds an object with the given strategy"""
+        if hydration is Hydration.trusted:
+            return cls.from_trusted_dict(data)
+        if hydration is Hydration.lazy:
+            return cls.from_lazy_dict(data)
+        return cls.from_dict(data)
+
+    def _resolve_deferred(self):
+        deferred = [k for k, v in self.__dict__.items() if type(v) is _Deferred]
+        for k in deferred:
+            self.__dict__[k] = self.__dict__[k].resolve()
+
+    def _iter(self, *args, **kwargs):
+        # dict, json, copy and equality all iterate fields through here
+        self._resolve_deferred()
+        return super()._iter(*args, **kwargs)
+
     def to_json(self):
         """dumps object to TextIO"""
         return json.dumps(self, default=pydantic_encoder)
@@ -74,8 +244,9 @@ class Category(BaseCurseModel):
     iconUrl: str
     dateModified: datetime
     isClass: bool
-    classId: int
-    parentCategoryId: int
+    classId: Optional[int]  # null for classes
+    parentCategoryId: Optional[int]  # null for classes
+    displayIndex: Optional[int]
 
 
 # game version
@@ -209,6 +380,12 @@ class FingerprintFuzzyMatch(BaseCurseModel):
     fingerprints: List[int]
 
 
+class FingerprintFuzzyMatchResult(BaseCurseModel):
+    """https://docs.curseforge.com/#tocS_FingerprintFuzzyMatchResult"""
+
+    fuzzyMatches: List[FingerprintFuzzyMatch]
+
+
 class FingerprintMatch(BaseCurseModel):
     """https://docs.curseforge.com/#tocS_FingerprintMatch"""
 
@@ -334,16 +511,22 @@ class Mod(BaseCurseModel):
     thumbsUpCount: int
 
     @property
-    def category(self) -> Optional[BaseCategory]:
+    def category(self) -> Optional["BaseCategory"]:
         """This is a conveince method to look up the category belonging to a game
         slugs can be created by replace underscores with dashes
         `.replace("_","-")`
+        None if the class is not in the bundled enums.
 
         """
         if not self.classId:
             return None
 
-        return CATEGORIES[Games(self.gameId)](self.classId)
+        from .categories import CATEGORIES  # built on first use
+
+        try:
+            return CATEGORIES[Games(self.gameId)](self.classId)
+        except (KeyError, ValueError):
+            return None  # added after this release, see `curse_api.ext.CategoryIndex`
 
     @property
     def modPageURL(self) -> Optional[str]:
@@ -0,0 +1,178 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, List, Optional
+
+__all__ = [
+    "ArrayItemParser",
+    "iter_array",
+]
+
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING = re.compile(r'["\\]')
+_SEPARATOR = re.compile(r"\s*([,\]]?)")
+_WHITESPACE = re.compile(r"\s*")
+_NUMBER_REST = re.compile(r"[0-9.eE+-]*")
+
+
+class ArrayItemParser:
+    """Incrementally decodes the elements of one array of a top-level JSON object
+    from a byte stream. Elements are decoded as soon as they are complete,
+    everything outside the array is skipped without being decoded.
+    Only the element being received is kept in memory.
+
+    ```py
+    parser = ArrayItemParser("data")
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            ...
+    for item in parser.close():
+        ...
+    ```
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        """
+        Args:
+            key (str, optional): The key of the array in the top-level object. Defaults to "data".
+        """
+        self.key = key
+        self.done = False
+        """True once the whole array was received"""
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decode = json.JSONDecoder().raw_decode
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._in_array = False
+        self._retry_at = 0
+        """Buffer length needed before decoding an incomplete element again"""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Returns every element completed by a chunk"""
+        if self.done:
+            return []
+        keep = self._string_start if self._in_string else self._pos
+        self._buf = self._buf[keep:] + self._text.decode(chunk)
+        self._pos -= keep
+        self._string_start -= keep
+        self._retry_at -= keep
+        if self._in_array:
+            return self._items(final=False)
+        return self._scan()
+
+    def close(self) -> List[Any]:
+        """Returns the last elements, raises ValueError if the array was not received completely"""
+        items = []
+        if self._in_array:
+            self._buf += self._text.decode(b"", final=True)
+            items = self._items(final=True)
+        if not self.done:
+            raise ValueError(f"stream ended before the {self.key!r} array was complete")
+        return items
+
+    def _scan(self) -> List[Any]:
+        """skips through the top-level object until the array starts"""
+        buf, pos = self._buf, self._pos
+        while not self.done:
+            if self._in_string:
+                m = _STRING.search(buf, pos)
+                if m is None:
+                    pos = max(pos, len(buf))
+                    break
+                i = m.start()
+                if buf[i] == "\\":  # skip the escaped character
+                    pos = i + 2
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    self._last_key = buf[self._string_start + 1 : i]
+                pos = i + 1
+                continue
+
+            m = _STRUCTURE.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            i = m.start()
+            c = buf[i]
+            pos = i + 1
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c in "[{":
+                if c == "[" and self._depth == 1 and self._last_key == self.key:
+                    self._in_array = True
+                    self._pos = self._retry_at = pos
+                    return self._items(final=False)
+                self._depth += 1
+            else:
+                self._depth -= 1
+
+        self._pos = pos
+        return []
+
+    def _items(self, final: bool) -> List[Any]:
+        """decodes every complete element of the array"""
+        buf, items = self._buf, []
+        while True:
+            pos = _WHITESPACE.match(buf, self._pos).end()  # type: ignore
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":  # an empty array
+                self._finish()
+                break
+            if len(buf) < self._retry_at and not final:
+                break  # decoding an incomplete element every chunk is quadratic
+
+            try:
+                item, end = self._decode(buf, pos)
+            except ValueError:
+                if final:
+                    raise ValueError(f"malformed element in the {self.key!r} array")
+                self._retry_at = len(buf) + (len(buf) - pos)
+                break
+            sep = _SEPARATOR.match(buf, end)
+            if not sep.group(1):  # type: ignore
+                if final:
+                    raise ValueError(f"malformed element in the {self.key!r} array")
+                # the separator is in the next chunk, or a number such as `1.` or `-1e` continues
+                number = _NUMBER_REST.match(buf, end).end()  # type: ignore
+                if sep.end() < len(buf) and number < len(buf):  # type: ignore
+                    raise ValueError(f"malformed element in the {self.key!r} array")
+                break
+
+            items.append(item)
+            self._pos = sep.end()  # type: ignore
+            if sep.group(1) == "]":  # type: ignore
+                self._finish()
+                break
+        return items
+
+    def _finish(self):
+        # the rest of the object is not needed
+        self._in_array = False
+        self.done = True
+        self._buf = ""
+        self._pos = 0
+
+
+async def iter_array(
+    chunks: AsyncIterator[bytes], key: str = "data"
+) -> AsyncIterator[Any]:
+    """Yields each decoded element of the `key` array of a streamed JSON object
+    as soon as it has been received.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The response body
+        key (str, optional): The key of the array in the top-level object. Defaults to "data".
+    """
+    parser = ArrayItemParser(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
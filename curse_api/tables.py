@@ -0,0 +1,241 @@
+import heapq
+import json
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .decoders import default_decoder
+from .models import BaseCurseModel, File, Hydration, Mod, _parse_datetime
+
+__all__ = [
+    "FileTable",
+    "ModTable",
+    "Row",
+    "Table",
+]
+
+U = TypeVar("U", bound=BaseCurseModel)
+T = TypeVar("T", bound="Table")
+
+NULL = -1
+"""Stored in integer columns for a null value"""
+
+_decode = None
+
+
+def _loads(blob: bytes) -> Dict[str, Any]:
+    global _decode
+    if _decode is None:
+        _decode = default_decoder()
+    return _decode(blob)
+
+
+def _timestamp(value: Any) -> float:
+    return _parse_datetime(value).timestamp()
+
+
+class Row(Generic[U]):
+    """A view of one row of a table. Columns are read as attributes,
+    the full model is only built by `model`.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "Table[U]", index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __getattr__(self, name: str) -> Any:
+        return self.table.value(name, self.index)
+
+    def raw(self) -> Dict[str, Any]:
+        """Returns the row as the API returned it"""
+        return _loads(self.table._blobs[self.index])
+
+    def model(self, hydration: Hydration = Hydration.lazy) -> U:
+        """Builds the full model of the row, every call builds a new one"""
+        return self.table.model.hydrate(self.raw(), hydration)
+
+    def __repr__(self) -> str:
+        return f"<{type(self.table).__name__} row {self.index} id={self.id}>"
+
+
+class Table(Generic[U]):
+    """A compact columnar result set. Numbers and dates are packed into arrays,
+    strings are interned and every row is kept as compact JSON to build models from.
+    Dates are stored as POSIX timestamps.
+    """
+
+    model: Type[U]
+    integers: Dict[str, str] = {}
+    """Integer columns and their array typecode"""
+    nullable: Tuple[str, ...] = ()
+    """Integer columns which may be null, stored as `NULL`"""
+    dates: Tuple[str, ...] = ()
+    strings: Tuple[str, ...] = ()
+
+    def __init__(self, rows: Iterable[Union[Dict[str, Any], Row[U]]] = ()) -> None:
+        """
+        Args:
+            rows (Iterable[dict | Row], optional): API data or rows of another table to add. Defaults to none.
+        """
+        self._columns: Dict[str, Any] = {k: array(v) for k, v in self.integers.items()}
+        self._columns.update((k, array("d")) for k in self.dates)
+        self._columns.update((k, []) for k in self.strings)
+        self._blobs: List[bytes] = []
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __iter__(self) -> Iterator[Row[U]]:
+        return (Row(self, i) for i in range(len(self)))
+
+    def __getitem__(self, index: int) -> Row[U]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("table index out of range")
+        return Row(self, index)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} rows={len(self)}>"
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate size of the packed columns and row data"""
+        size = sum(len(i) for i in self._blobs)
+        for k in self.integers:
+            size += len(self._columns[k]) * self._columns[k].itemsize
+        return size + len(self) * 8 * len(self.dates)
+
+    def column(self, name: str) -> Any:
+        """Returns a column, an `array` for numbers and dates or a list of strings"""
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no column {name!r}")
+
+    def value(self, name: str, index: int) -> Any:
+        """Returns a single value converted back to its python type"""
+        value = self.column(name)[index]
+        if name in self.dates:
+            return datetime.fromtimestamp(value, timezone.utc)
+        if value == NULL and name in self.nullable:
+            return None
+        return value
+
+    def append(self, row: Union[Dict[str, Any], Row[U]]):
+        """Adds API data, or copies the row of another table without decoding it"""
+        if isinstance(row, Row):
+            for k, col in self._columns.items():
+                col.append(row.table._columns[k][row.index])
+            self._blobs.append(row.table._blobs[row.index])
+            return
+
+        for k in self.integers:
+            value = row.get(k)
+            self._columns[k].append(NULL if value is None else int(value))
+        for k in self.dates:
+            self._columns[k].append(_timestamp(row[k]))
+        for k in self.strings:
+            self._columns[k].append(sys.intern(row[k]))
+        self._blobs.append(json.dumps(row, separators=(",", ":")).encode())
+
+    def extend(self, rows: Iterable[Union[Dict[str, Any], Row[U]]]):
+        for i in rows:
+            self.append(i)
+
+    def take(self: T, indices: Iterable[int]) -> T:
+        """Returns a new table of the rows at `indices`, in that order"""
+        table = type(self)()
+        for i in indices:
+            for k, col in table._columns.items():
+                col.append(self._columns[k][i])
+            table._blobs.append(self._blobs[i])
+        return table
+
+    def where(self: T, name: str, predicate: Callable[[Any], bool]) -> T:
+        """Returns a new table of the rows whose raw column value matches `predicate`.
+        Dates are passed as timestamps.
+        """
+        return self.take(i for i, v in enumerate(self.column(name)) if predicate(v))
+
+    def argsort(self, name: str, reverse: bool = False) -> List[int]:
+        """Returns the row indices ordered by a column"""
+        return sorted(
+            range(len(self)), key=self.column(name).__getitem__, reverse=reverse
+        )
+
+    def sort(self: T, name: str, reverse: bool = False) -> T:
+        """Returns a new table ordered by a column"""
+        return self.take(self.argsort(name, reverse))
+
+    def top(self: T, name: str, n: int) -> T:
+        """Returns a new table of the `n` rows with the largest values of a column"""
+        return self.take(
+            heapq.nlargest(n, range(len(self)), key=self.column(name).__getitem__)
+        )
+
+    def models(self, hydration: Hydration = Hydration.lazy) -> List[U]:
+        """Builds the full model of every row"""
+        return [self.model.hydrate(_loads(i), hydration) for i in self._blobs]
+
+    def find(self, id: int) -> Optional[Row[U]]:
+        """Returns the row with an id, or None"""
+        try:
+            return Row(self, self.column("id").index(id))
+        except ValueError:
+            return None
+
+
+class ModTable(Table[Mod]):
+    """A columnar set of `Mod`"""
+
+    model = Mod
+    integers = {
+        "id": "q",
+        "gameId": "l",
+        "classId": "l",
+        "primaryCategoryId": "l",
+        "mainFileId": "q",
+        "downloadCount": "q",
+        "gamePopularityRank": "q",
+        "thumbsUpCount": "q",
+    }
+    nullable = ("classId",)
+    dates = ("dateCreated", "dateModified", "dateReleased")
+    strings = ("name", "slug")
+
+
+class FileTable(Table[File]):
+    """A columnar set of `File`"""
+
+    model = File
+    integers = {
+        "id": "q",
+        "gameId": "l",
+        "modId": "q",
+        "releaseType": "b",
+        "fileStatus": "b",
+        "fileLength": "q",
+        "downloadCount": "q",
+        "alternateFileId": "q",
+        "fileFingerprint": "q",
+    }
+    dates = ("fileDate",)
+    strings = ("displayName", "fileName")
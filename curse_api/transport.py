@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Optional
+
+__all__ = [
+    "TransportConfig",
+]
+
+
+@dataclass
+class TransportConfig:
+    """Connection settings accepted by every client factory and `SimpleCurseAPI`.
+    Each factory maps them to its library's own options, None keeps the library default.
+    Options a library has no equivalent for are ignored by it.
+    """
+
+    max_connections: Optional[int] = None
+    """Connections open at once across all hosts"""
+    max_connections_per_host: Optional[int] = None
+    """Connections open at once per host, aiohttp only"""
+    max_keepalive_connections: Optional[int] = None
+    """Idle connections kept open for reuse, httpx only"""
+    keepalive_expiry: Optional[float] = None
+    """Seconds an idle connection is kept open"""
+    http2: bool = False
+    """Multiplex requests over one connection per host, httpx only and requires `h2`"""
+    dns_cache_ttl: Optional[int] = None
+    """Seconds a DNS lookup is cached for, 0 disables the cache, aiohttp only"""
@@ -1,5 +1,6 @@
 from curse_api import SimpleCurseAPI, ModLoaderType
 from curse_api.clients.httpx import HttpxFactory
+from curse_api.ext import ModLoaderCatalog
 import os
 import asyncio
 import json
@@ -45,8 +46,9 @@ async def main():
             and i.recommended
         ][0]
 
-        # NOTE the modloader version list is large and not cached
-        # dump to disk or otherways if you wish to save network resources
+        # NOTE the modloader version list is large
+        # wrap the factory in `curse_api.layers.CacheFactory` to keep it in memory
+        # or dump to disk if you wish to save network resources between runs
         with open("versions.json", "w") as f:
             from pydantic.json import pydantic_encoder
 
@@ -55,6 +57,15 @@ async def main():
 
             json.dump(versions, f, default=pydantic_encoder)
 
+        # for repeated lookups `ModLoaderCatalog` indexes the list and refreshes it hourly
+        catalog = ModLoaderCatalog(api)
+        forge_1_12_2 = await catalog.find("1.12.2", ModLoaderType.Forge)
+        fabric_1_19_3 = await catalog.recommended("1.19.3", ModLoaderType.Fabric)
+        if fabric_1_19_3:
+            # fetched once, later calls are answered from memory
+            details = await catalog.details(fabric_1_19_3.name)
+            print(details.mavenVersionString, len(forge_1_12_2))
+
         # works the same for minecraft version
         mc_versions = await api.minecraft_versions()
         for i in (i for i in mc_versions if i.versionString == "1.7.2"):
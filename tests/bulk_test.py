@@ -0,0 +1,50 @@
+from curse_api import CurseAPI
+from curse_api.errors import MissingResourcesException
+from curse_api.ext import ManifestParser
+from conftest import FakeFactory
+from payloads import make_file, make_mod
+import pytest
+
+
+def bulk_handler(make, key, exists=lambda i: True):
+    def handler(method, url, params):
+        # the API does not keep request order
+        return {"data": [make(i) for i in reversed(params[key]) if exists(i)]}
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_get_mods_chunked_in_order():
+    factory = FakeFactory(bulk_handler(make_mod, "modIds"))
+    api = CurseAPI(factory)
+    ids = [5, 3, 9, 1, 3, 7, 2]
+    mods = await api.get_mods(ids, chunk_size=2)
+    assert [i.id for i in mods] == [5, 3, 9, 1, 7, 2], "Mods are out of order"
+    assert len(factory.calls) == 3, "Ids were not chunked"
+    assert all(len(c[2]["modIds"]) <= 2 for c in factory.calls), "Chunk is too big"
+
+
+@pytest.mark.asyncio
+async def test_get_files_missing():
+    factory = FakeFactory(bulk_handler(make_file, "fileIds", lambda i: i % 2))
+    api = CurseAPI(factory)
+
+    with pytest.warns(UserWarning):
+        files = await api.get_files([1, 2, 3, 4])
+    assert [i.id for i in files] == [1, 3]
+
+    with pytest.raises(MissingResourcesException) as e:
+        await api.get_files([1, 2, 3, 4], chunk_size=1, strict=True)
+    assert e.value.missing == [2, 4], "Wrong missing ids"
+    assert [i.id for i in e.value.found] == [1, 3], "Lost partial results"
+
+
+@pytest.mark.asyncio
+async def test_manifest_chunked():
+    factory = FakeFactory(bulk_handler(make_file, "fileIds"))
+    parser = ManifestParser(CurseAPI(factory))
+    manifest = {"files": [{"projectID": 1, "fileID": i} for i in range(10, 0, -1)]}
+    files = await parser.load_files(manifest, chunk_size=3)
+    assert [i.id for i in files] == list(range(10, 0, -1)), "Manifest order lost"
+    assert len(factory.calls) == 4
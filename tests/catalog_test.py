@@ -0,0 +1,90 @@
+from curse_api import CurseAPI, Games, Minecraft_Categories
+from curse_api.ext import CatalogEnumerator
+from conftest import FakeFactory
+from payloads import make_mod
+import curse_api.api
+import pytest
+
+CATEGORIES = [Minecraft_Categories.magic, Minecraft_Categories.storage]
+VERSIONS = ["1.12.2", "1.19.2"]
+
+
+def catalog_handler(catalog):
+    def handler(method, url, params):
+        hits = [
+            m
+            for m in catalog
+            if all(
+                params.get(k) in (None, m[k])
+                for k in ("categoryId", "gameVersion", "modLoaderType")
+            )
+        ]
+        index, size = params["index"], params["pageSize"]
+        page = hits[index : index + size]
+        return {
+            "data": [make_mod(m["id"]) for m in page],
+            "pagination": {
+                "index": index,
+                "pageSize": size,
+                "resultCount": len(page),
+                "totalCount": len(hits),
+            },
+        }
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_collect_past_index_cap(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(curse_api.api, "INDEX_CAP", 20)
+    catalog = [
+        {
+            "id": i + 1,
+            "categoryId": CATEGORIES[i % 3 == 0].value,
+            "gameVersion": VERSIONS[i % 2],
+            "modLoaderType": 1 + (i % 4 == 0) * 3,
+        }
+        for i in range(60)
+    ]
+    factory = FakeFactory(catalog_handler(catalog))
+    enumerator = CatalogEnumerator(
+        CurseAPI(factory), categories=CATEGORIES, gameVersions=VERSIONS, pageSize=5
+    )
+    enumerator.index_cap = 20
+
+    mods = await enumerator.collect(Games.minecraft)
+    assert sorted(mods) == list(range(1, 61)), "Catalog is incomplete"
+    assert not enumerator.truncated, "A partition was cut off"
+
+    table = await enumerator.collect_table(Games.minecraft)
+    assert sorted(table.column("id")) == list(range(1, 61)), "Table is incomplete"
+
+
+@pytest.mark.asyncio
+async def test_split_missing_mods(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(curse_api.api, "INDEX_CAP", 20)
+    # 20 mods without a modloader are in no modLoaderType partition
+    catalog = [
+        {
+            "id": i + 1,
+            "categoryId": Minecraft_Categories.magic.value,
+            "gameVersion": "1.19.2",
+            "modLoaderType": None if i < 20 else 1 + (i % 2) * 3,
+        }
+        for i in range(60)
+    ]
+    factory = FakeFactory(catalog_handler(catalog))
+    enumerator = CatalogEnumerator(
+        CurseAPI(factory), categories=CATEGORIES, gameVersions=VERSIONS, pageSize=5
+    )
+    enumerator.index_cap = 20
+
+    mods = await enumerator.collect(Games.minecraft)
+    assert sorted(mods) == list(range(1, 61)), "Mods outside the split were lost"
+    assert enumerator.truncated == [
+        {
+            "gameId": Games.minecraft,
+            "categoryId": Minecraft_Categories.magic.value,
+            "gameVersion": "1.19.2",
+        }
+    ], "The uncovered partition was not reported"
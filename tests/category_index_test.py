@@ -0,0 +1,130 @@
+from curse_api import CurseAPI, Games
+from curse_api.ext import CategoryIndex
+from curse_api.models import Mod
+from conftest import FakeFactory
+import json
+import time
+import pytest
+
+# (id, classId, parentCategoryId, isClass, slug)
+CATEGORIES = [
+    (6, None, None, True, "mc-mods"),
+    (4471, None, None, True, "modpacks"),
+    (406, 6, 6, False, "world-gen"),
+    (407, 6, 406, False, "biomes"),
+    (409, 6, 406, False, "structures"),
+    (4473, 4471, 4471, False, "magic"),
+    (419, 6, 6, False, "magic"),
+    (9000, None, None, True, "new-class"),
+]
+
+
+def category(id, classId, parent, isClass, slug):
+    return {
+        "id": id,
+        "gameId": 432,
+        "name": slug.replace("-", " ").title(),
+        "slug": slug,
+        "url": f"https://www.curseforge.com/minecraft/{slug}",
+        "iconUrl": "",
+        "dateModified": "2022-01-01T00:00:00Z",
+        "isClass": isClass,
+        "classId": classId,
+        "parentCategoryId": parent,
+        "displayIndex": 0,
+    }
+
+
+def handler(method, url, params):
+    if url == "/v1/categories":
+        return {"data": [category(*i) for i in CATEGORIES]}
+    raise LookupError(url)
+
+
+def failing(method, url, params):
+    raise ConnectionError("offline")
+
+
+@pytest.mark.asyncio
+async def test_lookups():
+    factory = FakeFactory(handler)
+    index = await CategoryIndex(CurseAPI(factory)).load()
+
+    assert factory.calls == [("GET", "/v1/categories", {"gameId": 432})]
+    assert index.source == "api"
+    assert len(index) == len(CATEGORIES)
+    assert index.get(407).slug == "biomes"
+    assert index.get(1) is None
+    assert 9000 in index
+
+    # a shared slug resolves to the lowest id, or per class
+    assert index.by_slug(Games.minecraft, "magic").id == 419
+    assert index.by_slug(Games.minecraft, "magic", classId=4471).id == 4473
+    assert index.by_slug(Games.minecraft, "missing") is None
+    assert [i.id for i in index.classes(Games.minecraft)] == [6, 4471, 9000]
+
+
+@pytest.mark.asyncio
+async def test_hierarchy():
+    index = await CategoryIndex(CurseAPI(FakeFactory(handler))).load()
+
+    assert index.parent(407).id == 406
+    assert index.parent(6) is None
+    assert [i.id for i in index.children(406)] == [407, 409]
+    assert [i.id for i in index.ancestors(407)] == [406, 6]
+    assert [i.id for i in index.descendants(6)] == [406, 419, 407, 409]
+
+
+@pytest.mark.asyncio
+async def test_class_of_unknown_class():
+    index = await CategoryIndex(CurseAPI(FakeFactory(handler))).load()
+    mod = Mod.construct(gameId=432, classId=9000)
+
+    # not in the bundled enums
+    assert mod.category is None
+    assert index.class_of(mod).slug == "new-class"
+
+
+@pytest.mark.asyncio
+async def test_snapshot(tmp_path):
+    path = tmp_path / "categories.json"
+    await CategoryIndex(CurseAPI(FakeFactory(handler)), snapshot=path).load()
+    assert len(json.loads(path.read_text())["categories"]) == len(CATEGORIES)
+
+    # a fresh snapshot is used without a request
+    factory = FakeFactory(handler)
+    index = await CategoryIndex(CurseAPI(factory), snapshot=path).load()
+    assert factory.calls == []
+    assert index.source == "snapshot"
+    assert index.get(4473).parentCategoryId == 4471
+
+    # an expired one only when the api fails
+    index = CategoryIndex(CurseAPI(FakeFactory(failing)), snapshot=path, ttl=0)
+    with pytest.warns(UserWarning, match="using the snapshot"):
+        await index.load()
+    assert index.source == "snapshot"
+    assert [i.id for i in index.children(406)] == [407, 409]
+
+
+@pytest.mark.asyncio
+async def test_bundled_fallback():
+    index = CategoryIndex(CurseAPI(FakeFactory(failing)))
+    with pytest.warns(UserWarning, match="using the bundled"):
+        await index.load()
+
+    assert index.source == "bundled"
+    assert index.get(4473).name == "magic"
+    assert index.by_slug(Games.minecraft, "world-biomes").id == 407
+    assert index._expires - time.monotonic() <= 60  # retried soon
+
+
+@pytest.mark.asyncio
+async def test_unwritable_snapshot(tmp_path):
+    path = tmp_path / "missing" / "categories.json"
+    index = CategoryIndex(CurseAPI(FakeFactory(handler)), snapshot=path)
+    with pytest.warns(UserWarning, match="could not be saved"):
+        await index.load()
+
+    assert index.source == "api"
+    assert 9000 in index
+    assert index._expires - time.monotonic() > 60
@@ -0,0 +1,39 @@
+from curse_api.errors import MissingResourcesException
+from curse_api.ext import CoalescingCurseAPI
+from conftest import FakeFactory
+from payloads import make_file, make_mod
+import asyncio
+import pytest
+
+
+def handler(method, url, params):
+    if url == "/v1/mods":
+        return {"data": [make_mod(i) for i in params["modIds"] if i < 100]}
+    return {"data": [make_file(i, modId=i // 10) for i in params["fileIds"]]}
+
+
+@pytest.mark.asyncio
+async def test_get_mod_coalesced():
+    factory = FakeFactory(handler)
+    api = CoalescingCurseAPI(factory)
+    mods = await asyncio.gather(*(api.get_mod(i) for i in [1, 2, 3, 2, 1]))
+    assert [i.id for i in mods] == [1, 2, 3, 2, 1], "Results fanned out wrong"
+    assert factory.calls == [("POST", "/v1/mods", {"modIds": [1, 2, 3]})]
+
+    with pytest.raises(MissingResourcesException):
+        await api.get_mod(404)
+
+
+@pytest.mark.asyncio
+async def test_get_mod_file_coalesced():
+    factory = FakeFactory(handler)
+    api = CoalescingCurseAPI(factory, window=0.01)
+    results = await asyncio.gather(
+        api.get_mod_file(1, 10),
+        api.get_mod_file(2, 20),
+        api.get_mod_file(3, 20),
+        return_exceptions=True,
+    )
+    assert [i.id for i in results[:2]] == [10, 20]  # type: ignore
+    assert isinstance(results[2], MissingResourcesException), "Wrong mod accepted"
+    assert len(factory.calls) == 1, "Calls were not coalesced"
@@ -1,7 +1,10 @@
 from curse_api import SimpleCurseAPI
+from curse_api.abc import APIFactory
 from curse_api.clients.httpx import HttpxFactory
 from curse_api.clients.aiohttp import AiohttpFactory
 from curse_api.ext import ManifestParser
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import json
 import os
 import pytest
 import asyncio
@@ -10,6 +13,43 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+class FakeFactory(APIFactory):
+    """An offline factory answering requests with a handler, records every call"""
+
+    def __init__(self, handler: Callable[[str, str, Optional[dict]], Any]) -> None:
+        self.handler = handler
+        self.calls: List[Tuple[str, str, Optional[dict]]] = []
+
+    async def close(self):
+        ...
+
+    async def get(self, url: str, params: Optional[dict] = None) -> Dict[Any, Any]:
+        self.calls.append(("GET", url, params))
+        await asyncio.sleep(0)
+        return self.handler("GET", url, params)
+
+    async def post(self, url: str, params: Optional[dict] = None) -> Dict[Any, Any]:
+        self.calls.append(("POST", url, params))
+        await asyncio.sleep(0)
+        return self.handler("POST", url, params)
+
+    async def download(self, url: str, chunk_size: int):
+        raise NotImplementedError
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 64 * 1024,
+    ):
+        self.calls.append((method, url, params))
+        body = json.dumps(self.handler(method, url, params)).encode()
+        for i in range(0, len(body), chunk_size):
+            await asyncio.sleep(0)
+            yield body[i : i + chunk_size]
+
+
 # TODO: fix event loop closing early
 @pytest.fixture(scope="session")
 def event_loop():
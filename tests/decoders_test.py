@@ -0,0 +1,36 @@
+from curse_api import CurseAPI
+from curse_api.clients.httpx import HttpxFactory
+from curse_api.decoders import default_decoder, get_decoder
+from payloads import make_mod
+import httpx
+import json
+import pytest
+
+
+def test_decoders_agree():
+    body = json.dumps({"data": make_mod(1)}).encode()
+    assert default_decoder()(body) == get_decoder("json")(body)
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+@pytest.mark.asyncio
+async def test_factory_decoder():
+    bodies = []
+
+    def decode(body: bytes):
+        bodies.append(body)
+        return json.loads(body)
+
+    factory = HttpxFactory("key", decoder=decode)
+    factory._sess = httpx.AsyncClient(
+        base_url="https://api.curseforge.com",
+        transport=httpx.MockTransport(
+            lambda r: httpx.Response(200, json={"data": make_mod(1)})
+        ),
+    )
+    async with CurseAPI(factory) as api:
+        assert (await api.get_mod(1)).id == 1
+    assert len(bodies) == 1 and isinstance(
+        bodies[0], bytes
+    ), "Decoder was not given bytes"
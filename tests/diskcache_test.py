@@ -0,0 +1,106 @@
+from curse_api import CurseAPI
+from curse_api.diskcache import DiskCache
+from curse_api.ext import CoalescingCurseAPI
+from conftest import FakeFactory
+from payloads import make_file
+import os
+import pytest
+
+
+def handler(method, url, params):
+    if method == "POST":
+        return {"data": [make_file(i, modId=1) for i in params["fileIds"]]}
+    if url.endswith("/changelog"):
+        return {"data": "<p>changes</p>"}
+    return {"data": make_file(int(url.rsplit("/", 1)[1]), modId=1)}
+
+
+@pytest.mark.asyncio
+async def test_warm_restart(tmp_path):
+    fake = FakeFactory(handler)
+    api = CurseAPI(fake, store=DiskCache(tmp_path))
+    file = await api.get_mod_file(1, 10)
+    await api.get_files([10, 11, 12])
+    await api.get_mod_file_changelog(1, 10)
+    assert len(fake.calls) == 3, "Stored file was requested again"
+    assert fake.calls[1][2] == {"fileIds": [11, 12]}
+    api.store.close()  # type: ignore
+
+    restarted = FakeFactory(handler)
+    api = CurseAPI(restarted, store=DiskCache(tmp_path))
+    assert await api.get_mod_file(1, 10) == file, "Stored file changed"
+    assert [i.id for i in await api.get_files([12, 10, 11])] == [12, 10, 11]
+    assert await api.get_mod_file_changelog(1, 10) == "<p>changes</p>"
+    assert not restarted.calls, "Store was not used after a restart"
+
+
+def test_eviction(tmp_path):
+    store = DiskCache(tmp_path, max_bytes=1000)
+    for i in range(5):
+        store.set("file", i, "x" * 198)
+    store.get("file", 0)
+    store.set("file", 5, "x" * 198)
+    assert store.size <= 1000
+    assert store.get("file", 0) is not None, "Recently used entry was evicted"
+    assert store.get("file", 1) is None, "Least recently used entry was kept"
+
+
+def test_shared_size(tmp_path):
+    first = DiskCache(tmp_path, max_bytes=1000)
+    second = DiskCache(tmp_path, max_bytes=1000)
+    for i in range(4):
+        first.set("file", i, "x" * 198)
+        second.set("file", i + 4, "x" * 198)
+    assert first.size == second.size <= 1000, "Writers disagree on the size"
+    assert second.get("file", 7) is not None
+    assert first.get("file", 0) is None, "Least recently used entry was kept"
+
+    first.set("file", 7, "y" * 98)
+    assert second.size == first.size
+
+
+def test_reads_do_not_write(tmp_path):
+    store = DiskCache(tmp_path)
+    store.set("file", 1, "x")
+    before = store.path + "-wal"
+    size = os.path.getsize(before)
+    for _ in range(10):
+        assert store.get("file", 1) == "x"
+    assert os.path.getsize(before) == size, "Cache hits were written"
+
+    held = store._accessed[("file", "1")]
+
+    # held back access times are written on close
+    store.close()
+    restarted = DiskCache(tmp_path)
+    assert restarted._db.execute("SELECT accessed FROM entries").fetchone() == (held,)
+    assert restarted.size == len('"x"')
+
+
+@pytest.mark.asyncio
+async def test_mod_mismatch(tmp_path):
+    # without a store the answer of the API stands, it is not requested twice
+    fake = FakeFactory(handler)
+    file = await CurseAPI(fake).get_mod_file(2, 10)
+    assert file.modId == 1
+    assert len(fake.calls) == 1
+
+    # a stored file of another mod is requested again
+    fake = FakeFactory(handler)
+    api = CurseAPI(fake, store=DiskCache(tmp_path))
+    await api.get_mod_file(1, 10)
+    await api.get_mod_file(2, 10)
+    assert len(fake.calls) == 2
+    await api.get_mod_file(1, 10)
+    assert len(fake.calls) == 2, "Matching stored file was requested again"
+    api.store.close()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_coalescing_store(tmp_path):
+    fake = FakeFactory(handler)
+    api = CoalescingCurseAPI(fake, store=DiskCache(tmp_path))
+    await api.get_files([10, 11])
+    assert (await api.get_mod_file(1, 11)).id == 11
+    assert len(fake.calls) == 1, "Coalescing api did not use the store"
+    api.store.close()  # type: ignore
@@ -0,0 +1,105 @@
+from curse_api.fingerprint import (
+    HASHERS,
+    fingerprint,
+    fingerprint_file,
+    get_hasher,
+    murmur2,
+    normalize,
+)
+import random
+import pytest
+
+
+def reference(data: bytes, seed: int = 1) -> int:
+    """MurmurHash2 as written in C, one block at a time"""
+    m, mask = 0x5BD1E995, 0xFFFFFFFF
+    h = (seed ^ len(data)) & mask
+    end = len(data) - len(data) % 4
+    for i in range(0, end, 4):
+        k = int.from_bytes(data[i : i + 4], "little")
+        k = (k * m) & mask
+        k ^= k >> 24
+        k = (k * m) & mask
+        h = (h * m) & mask
+        h ^= k
+    tail = data[end:]
+    if len(tail) >= 3:
+        h ^= tail[2] << 16
+    if len(tail) >= 2:
+        h ^= tail[1] << 8
+    if len(tail) >= 1:
+        h ^= tail[0]
+        h = (h * m) & mask
+    h ^= h >> 13
+    h = (h * m) & mask
+    h ^= h >> 15
+    return h
+
+
+def sample(size: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    return bytes(rng.choice(b"ab\x00\xff \t\r\n") for _ in range(size))
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 5, 7, 8, 63, 1000])
+def test_murmur2(size):
+    data = sample(size, size)
+    assert murmur2(data, 1, get_hasher("python")) == reference(data, 1)
+    assert murmur2(data, 0, get_hasher("python")) == reference(data, 0)
+
+
+def test_whitespace_ignored():
+    assert fingerprint(b"a b\r\n\tc") == fingerprint(b"abc")
+    assert fingerprint(b"abc") == reference(b"abc")
+    assert normalize(b" x\ty\r\nz ") == b"xyz"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_fingerprint_file(tmp_path, chunk_size):
+    data = sample(5000, 42)
+    path = tmp_path / "mod.jar"
+    path.write_bytes(data)
+
+    assert fingerprint_file(path, chunk_size) == reference(normalize(data))
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.jar"
+    path.write_bytes(b"")
+    assert fingerprint_file(path) == reference(b"")
+
+
+def test_hashers():
+    with pytest.raises(ValueError):
+        get_hasher("sha1")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 512, 4096])
+def test_native_hasher_stream(tmp_path, chunk_size):
+    data = sample(5000, 7)
+    path = tmp_path / "mod.jar"
+    path.write_bytes(data)
+    seen = []
+
+    def native(buffer: bytes, seed: int) -> int:
+        seen.append(len(buffer))
+        return reference(buffer, seed)
+
+    # whole blocks are hashed a chunk at a time, the tail once at the end
+    length = len(normalize(data))
+    assert fingerprint_file(path, chunk_size, native) == reference(normalize(data))
+    assert sum(seen) == length and seen[-1] == length % 4
+    assert all(i % 4 == 0 and i <= chunk_size + 3 for i in seen[:-1])
+
+
+@pytest.mark.parametrize("name", list(HASHERS))
+def test_installed_hashers(tmp_path, name):
+    try:
+        hasher = get_hasher(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    data = sample(5000, 3)
+    path = tmp_path / "mod.jar"
+    path.write_bytes(data)
+    assert fingerprint_file(path, 100, hasher) == reference(normalize(data))
+    assert fingerprint(data, hasher) == reference(normalize(data))
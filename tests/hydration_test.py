@@ -0,0 +1,60 @@
+from curse_api import CurseAPI
+from curse_api.models import File, Hydration, Mod
+from conftest import FakeFactory
+from payloads import make_file, make_mod
+import pytest
+
+
+def test_trusted_matches_validated():
+    data = make_mod(1, screenshots=[], latestFiles=[make_file(10), make_file(11)])
+    trusted = Mod.from_trusted_dict(data)
+    assert trusted == Mod.from_dict(data), "Trusted hydration differs from validated"
+    assert trusted.dateModified.tzinfo is not None, "Datetime was not parsed"
+    assert isinstance(trusted.latestFiles[0], File), "Nested model was not hydrated"
+    assert trusted.to_dict() == Mod.from_dict(data).to_dict()
+
+
+def test_trusted_defaults():
+    data = make_file(1)
+    del data["downloadUrl"], data["serverPackFileId"]
+    assert File.from_trusted_dict(data) == File.from_dict(data)
+
+
+@pytest.mark.asyncio
+async def test_api_trusted_hydration():
+    def handler(method, url, params):
+        if method == "POST":
+            return {"data": [make_mod(i) for i in params["modIds"]]}
+        return {"data": make_mod(1)}
+
+    api = CurseAPI(FakeFactory(handler), hydration=Hydration.trusted)
+    mod = await api.get_mod(1)
+    assert mod == Mod.from_dict(make_mod(1))
+    mods = await api.get_mods([1, 2, 3])
+    assert [i.id for i in mods] == [1, 2, 3]
+
+
+def test_lazy_hydrates_on_access():
+    data = make_mod(1, latestFiles=[make_file(10), make_file(11)])
+    mod = Mod.from_lazy_dict(data)
+    assert mod.id == 1 and mod.slug == "mod-1"
+    assert not isinstance(mod.__dict__["latestFiles"], list), "Hydrated eagerly"
+
+    files = mod.latestFiles
+    assert [i.id for i in files] == [10, 11]
+    assert isinstance(files[0], File)
+    assert mod.latestFiles is files, "Hydrated list was not memoized"
+    assert files[0].hashes[0].value == data["latestFiles"][0]["hashes"][0]["value"]
+
+
+def test_lazy_round_trips():
+    data = make_mod(2)
+    validated = Mod.from_dict(data)
+    lazy = Mod.hydrate(data, Hydration.lazy)
+    assert lazy.to_dict() == validated.to_dict()
+    assert lazy.to_json() == validated.to_json()
+
+    lazy = Mod.from_lazy_dict(data)
+    assert lazy == validated, "Equality did not hydrate deferred fields"
+    lazy.screenshots = []
+    assert lazy.screenshots == []
@@ -0,0 +1,70 @@
+import ast
+import os
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+# cumulative microseconds `import curse_api` may take, far above the usual ~1ms
+IMPORT_BUDGET_US = 25_000
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Runs `python -X importtime` in a fresh interpreter,
+    returns the cumulative import time in microseconds of every module imported
+    """
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    times = {}
+    for line in res.stderr.splitlines():
+        parts = line.partition("import time:")[2].split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def test_import_is_lazy():
+    times = import_times("import curse_api")
+    heavy = {"pydantic", "curse_api.api", "curse_api.models", "curse_api.categories"}
+    assert not heavy & set(times), "import curse_api loaded heavy modules"
+    assert times["curse_api"] < IMPORT_BUDGET_US, "import curse_api got slower"
+
+
+def test_categories_are_lazy():
+    times = import_times("import curse_api.models")
+    assert "curse_api.categories" not in times, "models loaded the categories"
+
+    times = import_times("from curse_api import CurseAPI, Mod")
+    assert "curse_api.categories" not in times, "the api loaded the categories"
+
+
+def test_lazy_attributes():
+    import curse_api
+    from curse_api.categories import CATEGORIES, Minecraft_Categories
+
+    assert curse_api.Minecraft_Categories is Minecraft_Categories
+    assert CATEGORIES[curse_api.Games.minecraft] is Minecraft_Categories
+    assert Minecraft_Categories.magic == 4473
+    assert "SimpleCurseAPI" in dir(curse_api)
+
+
+def test_stub_matches_tables():
+    from curse_api.categories import _TABLES
+
+    with open(os.path.join(ROOT, "curse_api", "categories.pyi")) as f:
+        stub = ast.parse(f.read())
+    classes = {
+        node.name: [(i.targets[0].id, i.value.value) for i in node.body]  # type: ignore
+        for node in stub.body
+        if isinstance(node, ast.ClassDef) and node.name != "BaseCategory"
+    }
+    tables = {name: members for name, (_, members) in _TABLES.items()}
+    assert list(classes) == list(tables), "categories.pyi and _TABLES list other enums"
+    for name, members in tables.items():
+        assert classes[name] == members, f"{name} differs between the stub and _TABLES"
@@ -0,0 +1,274 @@
+from curse_api import CurseAPI
+from curse_api.enums import Games, ModsSearchSortField
+from curse_api.errors import CircuitOpenException
+from curse_api.models import FolderFingerprint
+from curse_api.layers.breaker import CircuitState
+from curse_api.layers import (
+    CacheFactory,
+    CircuitBreakerFactory,
+    HedgedFactory,
+    RateLimitFactory,
+    RetryFactory,
+    RetryPolicy,
+    ResponseCache,
+    SingleflightFactory,
+    TokenBucket,
+    request_key,
+)
+from curse_api.clients.httpx import HttpxFactory
+from conftest import FakeFactory
+from payloads import make_mod
+import asyncio
+import httpx
+import time
+import pytest
+
+
+def mod_handler(method, url, params):
+    if url.startswith("/v1/mods/4"):
+        raise RuntimeError("upstream failed")
+    return {"data": make_mod(int(url.rsplit("/", 1)[1]))}
+
+
+def test_request_key():
+    a = request_key(
+        "get", "/v1/mods/search", {"slug": "jei", "sortField": ModsSearchSortField.Name}
+    )
+    b = request_key("GET", "/v1/mods/search", {"sortField": "Name", "slug": "jei"})
+    assert a == b, "Params are not normalized"
+    assert request_key("GET", "/v1/mods/1") == request_key("GET", "/v1/mods/1", {})
+
+
+@pytest.mark.asyncio
+async def test_singleflight():
+    fake = FakeFactory(mod_handler)
+    factory = SingleflightFactory(fake)
+    api = CurseAPI(factory)
+
+    mods = await asyncio.gather(*(api.get_mod(i) for i in [1, 1, 2, 1, 2]))
+    assert [i.id for i in mods] == [1, 1, 2, 1, 2]
+    assert len(fake.calls) == 2, "Identical requests were not shared"
+    assert factory.shared == 3
+
+    results = await asyncio.gather(
+        *(api.get_mod(4) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(i, RuntimeError) for i in results), "Error not shared"
+    assert len(fake.calls) == 3
+
+    await api.get_mod(1)
+    assert len(fake.calls) == 4, "Finished requests must not be reused"
+
+
+def test_response_cache_lru():
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+    assert list(cache) == ["a", "c"], "Least recently used entry was not evicted"
+
+    cache.set("big", "x" * 98, 60)
+    assert list(cache) == ["big"] and cache.size <= 100, "Byte limit ignored"
+    assert cache.stats.evictions == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_factory():
+    fake = FakeFactory(mod_handler)
+    factory = CacheFactory(fake, stale_while_revalidate=60)
+    api = CurseAPI(factory)
+
+    await api.get_mod(1)
+    await api.get_mod(1)
+    assert len(fake.calls) == 1, "Second call was not cached"
+    assert (factory.stats.hits, factory.stats.misses) == (1, 1)
+
+    for key in factory.cache:
+        factory.cache.get(key).expires = time.monotonic() - 1  # type: ignore
+    mod = await api.get_mod(1)
+    assert mod.id == 1 and factory.stats.stale == 1, "Stale entry was not served"
+    await asyncio.sleep(0.01)
+    assert len(fake.calls) == 2, "Stale entry was not refreshed"
+    assert all(factory.cache.get(k).fresh for k in factory.cache)  # type: ignore
+
+    assert factory.ttl("/v1/mods/1/files/2") > factory.ttl("/v1/mods/1")
+
+
+@pytest.mark.asyncio
+async def test_conditional_revalidation():
+    requests = []
+
+    def respond(request: httpx.Request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": make_mod(1)}, headers={"ETag": '"v1"'})
+
+    cache = ResponseCache()
+    factory = HttpxFactory("key", validators=cache)
+    factory._sess = httpx.AsyncClient(
+        base_url="https://api.curseforge.com", transport=httpx.MockTransport(respond)
+    )
+    api = CurseAPI(CacheFactory(factory, cache))
+
+    first = await api.get_mod(1)
+    for key in cache:
+        cache.get(key).expires = time.monotonic() - 1  # type: ignore
+    assert await api.get_mod(1) == first
+    assert len(requests) == 2, "Expired entry was not revalidated"
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert all(cache.get(k).fresh and cache.get(k).etag for k in cache)  # type: ignore
+    await api.close()
+
+
+def http_error(status: int, headers=None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.curseforge.com")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(str(status), request=request, response=response)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket():
+    bucket = TokenBucket(rate=100, burst=2)
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.025, "Bucket allowed more than the burst"
+    assert TokenBucket.shared("key") is TokenBucket.shared("key")
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_retry_after():
+    failures = [http_error(429, {"Retry-After": "0.05"})]
+
+    def handler(method, url, params):
+        if failures:
+            raise failures.pop()
+        return mod_handler(method, url, params)
+
+    fake = FakeFactory(handler)
+    factory = RateLimitFactory(fake, rate=100)
+    start = time.monotonic()
+    mod = await CurseAPI(factory).get_mod(1)
+    assert mod.id == 1 and len(fake.calls) == 2, "429 was not retried"
+    assert time.monotonic() - start >= 0.05, "Retry-After was ignored"
+    assert factory.bucket.rate < 100, "Rate was not lowered"
+
+
+@pytest.mark.asyncio
+async def test_retry():
+    failures = [ConnectionResetError(), http_error(502)]
+
+    def handler(method, url, params):
+        if failures:
+            raise failures.pop()
+        if method == "POST":
+            return {"data": [make_mod(i) for i in params["modIds"]]}
+        return mod_handler(method, url, params)
+
+    retries = []
+    fake = FakeFactory(handler)
+    factory = RetryFactory(
+        fake,
+        RetryPolicy(base_delay=0.001),
+        on_retry=lambda *args: retries.append(args[:3]),
+    )
+    api = CurseAPI(factory)
+
+    assert (await api.get_mod(1)).id == 1
+    failures.append(http_error(503))
+    assert [i.id for i in await api.get_mods([2])] == [2], "Read-only POST not retried"
+    assert retries == [
+        ("GET", "/v1/mods/1", 1),
+        ("GET", "/v1/mods/1", 2),
+        ("POST", "/v1/mods", 1),
+    ]
+    assert (factory.stats.retries, factory.stats.recovered) == (3, 2)
+
+    failures.append(http_error(404))
+    with pytest.raises(httpx.HTTPStatusError):
+        await api.get_mod(1)
+    assert factory.stats.retries == 3, "404 must not be retried"
+
+
+@pytest.mark.asyncio
+async def test_retry_fuzzy_fingerprints():
+    failures = [http_error(503)]
+
+    def handler(method, url, params):
+        if failures:
+            raise failures.pop()
+        return {"data": {"fuzzyMatches": []}}
+
+    fake = FakeFactory(handler)
+    api = CurseAPI(RetryFactory(fake, RetryPolicy(base_delay=0.001)))
+    folder = FolderFingerprint(foldername="Details", fingerprints=[1, 2])
+    result = await api.get_fingerprints_fuzzy(Games.wow, [folder])
+    assert result.fuzzyMatches == []
+    assert len(fake.calls) == 2, "Fuzzy fingerprint POST not retried"
+
+
+class SlowFactory(FakeFactory):
+    def __init__(self, handler, delay: float) -> None:
+        super().__init__(handler)
+        self.delay = delay
+
+    async def get(self, url, params=None):
+        await asyncio.sleep(self.delay)
+        return await super().get(url, params)
+
+
+@pytest.mark.asyncio
+async def test_hedged_request():
+    slow, mirror = SlowFactory(mod_handler, 0.5), SlowFactory(mod_handler, 0)
+    factory = HedgedFactory([slow, mirror], max_delay=0.02)
+    start = time.monotonic()
+    mod = await CurseAPI(factory).get_mod(1)
+    assert mod.id == 1 and time.monotonic() - start < 0.4, "Request was not hedged"
+    assert (factory.stats.hedged, factory.stats.hedge_wins) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_failover():
+    def broken(method, url, params):
+        raise http_error(503)
+
+    down, mirror = FakeFactory(broken), FakeFactory(mod_handler)
+    factory = HedgedFactory([down, mirror])
+    api = CurseAPI(factory)
+    assert (await api.get_mod(1)).id == 1
+    assert factory.stats.failovers == 1
+    assert factory.ranked() == [1, 0], "Failing factory is still preferred"
+
+    await api.get_mod(2)
+    assert len(down.calls) == 1, "Failing factory was used again"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker():
+    healthy = [False]
+
+    def handler(method, url, params):
+        if not healthy[0]:
+            raise http_error(503)
+        return mod_handler(method, url, params)
+
+    fake = FakeFactory(handler)
+    fallback = ResponseCache()
+    fallback.set(request_key("GET", "/v1/mods/2"), {"data": make_mod(2)}, 0)
+    factory = CircuitBreakerFactory(fake, min_calls=4, open_for=0.05, fallback=fallback)
+    api = CurseAPI(factory)
+
+    for _ in range(4):
+        with pytest.raises(httpx.HTTPStatusError):
+            await api.get_mod(1)
+    with pytest.raises(CircuitOpenException):
+        await api.get_mod(1)
+    assert (await api.get_mod(2)).id == 2, "Fallback cache was not used"
+    assert len(fake.calls) == 4, "Open circuit still sent requests"
+
+    await asyncio.sleep(0.06)
+    healthy[0] = True
+    assert (await api.get_mod(1)).id == 1, "Probe was not let through"
+    assert factory.state is CircuitState.Closed
@@ -0,0 +1,78 @@
+from curse_api import CurseAPI, ModLoaderType
+from curse_api.ext import ModLoaderCatalog
+from conftest import FakeFactory
+import asyncio
+import pytest
+
+LOADERS = [
+    ("forge-14.23.5.2859", "1.12.2", 1, False, True, "2019-01-01T00:00:00Z"),
+    ("forge-14.23.5.2860", "1.12.2", 1, True, False, "2021-01-01T00:00:00Z"),
+    ("fabric-0.14.11", "1.19.3", 4, False, True, "2022-12-01T00:00:00Z"),
+    ("fabric-0.14.12", "1.19.3", 4, True, False, "2022-12-20T00:00:00Z"),
+    ("forge-44.0.0", "1.19.3", 1, True, False, "2022-12-10T00:00:00Z"),
+]
+
+
+def loader_handler(method, url, params):
+    if url == "/v1/minecraft/modloader":
+        return {
+            "data": [
+                {
+                    "name": name,
+                    "gameVersion": version,
+                    "type": type,
+                    "latest": latest,
+                    "recommended": recommended,
+                    "dateModified": date,
+                }
+                for name, version, type, latest, recommended, date in LOADERS
+            ]
+        }
+    raise LookupError(url)
+
+
+@pytest.mark.asyncio
+async def test_lookups():
+    factory = FakeFactory(loader_handler)
+    catalog = ModLoaderCatalog(CurseAPI(factory))
+
+    forge = await catalog.find("1.12.2", ModLoaderType.Forge)
+    assert [i.name for i in forge] == ["forge-14.23.5.2860", "forge-14.23.5.2859"]
+    fabric = await catalog.recommended("1.19.3", ModLoaderType.Fabric)
+    assert fabric is not None and fabric.name == "fabric-0.14.11"
+    latest = await catalog.latest("1.19.3", ModLoaderType.Forge)
+    assert latest is not None and latest.name == "forge-44.0.0"
+    assert await catalog.latest("1.7.10", ModLoaderType.Forge) is None
+    assert len(await catalog.find(type=ModLoaderType.Fabric)) == 2
+    assert len(await catalog.find("1.19.3", latest=True)) == 2
+    assert (await catalog.get("fabric-0.14.12")).gameVersion == "1.19.3"  # type: ignore
+    assert await catalog.game_versions(ModLoaderType.Fabric) == ["1.19.3"]
+    assert len(factory.calls) == 1, "The list was fetched more than once"
+
+
+@pytest.mark.asyncio
+async def test_ttl():
+    factory = FakeFactory(loader_handler)
+    catalog = ModLoaderCatalog(CurseAPI(factory), ttl=0)
+    await asyncio.gather(catalog.load(), catalog.load())
+    assert len(factory.calls) == 1, "Concurrent loads were not shared"
+    await catalog.find()
+    assert len(factory.calls) == 2, "An expired list was not fetched again"
+
+
+@pytest.mark.asyncio
+async def test_details_memoized():
+    calls = []
+
+    class API(CurseAPI):
+        async def get_specific_minecraft_modloader(self, modLoaderName: str):
+            calls.append(modLoaderName)
+            await asyncio.sleep(0)
+            return modLoaderName.upper()
+
+    catalog = ModLoaderCatalog(API(FakeFactory(loader_handler)), concurrency=2)
+    names = [i[0] for i in LOADERS]
+    details = await catalog.details_many(names + names[:2])
+    assert details == {i: i.upper() for i in names}
+    assert await catalog.details(names[0]) == names[0].upper()
+    assert sorted(calls) == sorted(names), "Details were fetched more than once"
@@ -0,0 +1,53 @@
+from curse_api import CurseAPI, SimpleCurseAPI
+from curse_api.api import INDEX_CAP
+from conftest import FakeFactory
+from payloads import make_file, make_mod
+import pytest
+
+
+def paged(total: int, make):
+    def handler(method, url, params):
+        index, size = params["index"], params["pageSize"]
+        data = [make(i + 1) for i in range(index, min(index + size, total))]
+        return {
+            "data": data,
+            "pagination": {
+                "index": index,
+                "pageSize": size,
+                "resultCount": len(data),
+                "totalCount": total,
+            },
+        }
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_iter_mod_files_offline():
+    factory = FakeFactory(paged(237, make_file))
+    api = CurseAPI(factory)
+    ids = [i.id async for i in api.iter_mod_files(1, concurrency=3)]
+    assert ids == list(range(1, 238)), "Files are missing or out of order"
+    assert len(factory.calls) == 5, "Pages were fetched more than once"
+
+
+@pytest.mark.asyncio
+async def test_iter_search_mods_index_cap():
+    factory = FakeFactory(paged(INDEX_CAP + 500, make_mod))
+    api = CurseAPI(factory)
+    count = 0
+    async for _ in api.iter_search_mods(index=INDEX_CAP - 120, pageSize=50):
+        count += 1
+    assert count == 120, "Did not stop at the index cap"
+    assert all(
+        c[2]["index"] + c[2]["pageSize"] <= INDEX_CAP for c in factory.calls
+    ), "Requested a page past the index cap"
+
+
+@pytest.mark.asyncio
+async def test_iter_mod_files(api: SimpleCurseAPI):
+    pid = 60089
+    _, page = await api.get_mod_files(pid)
+    files = [i async for i in api.iter_mod_files(pid)]
+    assert len(files) == min(page.totalCount, INDEX_CAP), "Missing files"
+    assert len({i.id for i in files}) == len(files), "Duplicate files"
@@ -0,0 +1,112 @@
+from typing import Any, Dict
+
+"""
+Offline payloads shaped like CurseForge responses
+https://docs.curseforge.com/#schemas
+"""
+
+DATE = "2022-09-25T14:46:28.817Z"
+
+
+def make_file(id: int, modId: int = 1, **overrides) -> Dict[str, Any]:
+    data = {
+        "id": id,
+        "gameId": 432,
+        "modId": modId,
+        "isAvailable": True,
+        "displayName": f"file-{id}",
+        "fileName": f"file-{id}.jar",
+        "releaseType": 1,
+        "fileStatus": 4,
+        "hashes": [{"value": "da39a3ee5e6b4b0d3255bfef95601890afd80709", "algo": 1}],
+        "fileDate": DATE,
+        "fileLength": 1024,
+        "downloadCount": id * 10,
+        "downloadUrl": f"https://edge.forgecdn.net/files/{id}/file-{id}.jar",
+        "gameVersions": ["1.19.2", "Forge"],
+        "sortableGameVersions": [
+            {
+                "gameVersionName": "1.19.2",
+                "gameVersionPadded": "0000000001.0000000019.0000000002",
+                "gameVersion": "1.19.2",
+                "gameVersionReleaseDate": DATE,
+                "gameVersionTypeId": 73407,
+            }
+        ],
+        "dependencies": [{"modId": 238222, "relationType": 3}],
+        "exposeAsAlternative": None,
+        "parentProjectFileId": None,
+        "alternateFileId": 0,
+        "isServerPack": False,
+        "serverPackFileId": None,
+        "fileFingerprint": 1234567890,
+        "modules": [{"name": "META-INF", "fingerprint": 123456}],
+    }
+    data.update(overrides)
+    return data
+
+
+def make_mod(id: int, **overrides) -> Dict[str, Any]:
+    data = {
+        "id": id,
+        "gameId": 432,
+        "name": f"mod-{id}",
+        "slug": f"mod-{id}",
+        "links": {
+            "websiteUrl": f"https://www.curseforge.com/minecraft/mc-mods/mod-{id}",
+            "wikiUrl": None,
+            "issuesUrl": None,
+            "sourceUrl": None,
+        },
+        "summary": "An offline mod",
+        "status": 4,
+        "downloadCount": id * 100,
+        "isFeatured": False,
+        "primaryCategoryId": 423,
+        "categories": [
+            {
+                "id": 423,
+                "gameId": 432,
+                "name": "Map and Information",
+                "slug": "map-information",
+                "url": "https://www.curseforge.com/minecraft/mc-mods/map-information",
+                "iconUrl": "https://media.forgecdn.net/avatars/6/38/635351497437388438.png",
+                "dateModified": DATE,
+                "isClass": False,
+                "classId": 6,
+                "parentCategoryId": 6,
+            }
+        ],
+        "classId": 6,
+        "authors": [{"id": 1, "name": "author", "url": "https://www.curseforge.com"}],
+        "logo": {
+            "id": 1,
+            "modId": id,
+            "title": "logo",
+            "description": "",
+            "thumbnailUrl": "https://media.forgecdn.net/avatars/thumbnails/1.png",
+            "url": "https://media.forgecdn.net/avatars/1.png",
+        },
+        "screenshots": [],
+        "mainFileId": id * 10,
+        "latestFiles": [make_file(id * 10, id)],
+        "latestFilesIndexes": [
+            {
+                "gameVersion": "1.19.2",
+                "fileId": id * 10,
+                "filename": f"file-{id * 10}.jar",
+                "releaseType": 1,
+                "gameVersionTypeId": 73407,
+                "modLoader": 1,
+            }
+        ],
+        "dateCreated": DATE,
+        "dateModified": DATE,
+        "dateReleased": DATE,
+        "allowModDistribution": True,
+        "gamePopularityRank": id,
+        "isAvailable": True,
+        "thumbsUpCount": 0,
+    }
+    data.update(overrides)
+    return data
@@ -0,0 +1,166 @@
+from curse_api import CurseAPI, Games
+from curse_api.ext import DirectoryScanner, FingerprintCache
+from curse_api.fingerprint import fingerprint
+from conftest import FakeFactory
+from payloads import make_file, make_mod
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pytest
+
+JARS = {"a.jar": b"alpha mod", "b.jar": b"beta mod", "local.jar": b"dev build"}
+# fingerprint -> (fileId, modId), local.jar is not hosted
+# folder name -> modId
+ADDONS = {"Details": 1, "WeakAuras": 2}
+KNOWN = {fingerprint(b"alpha mod"): (11, 1), fingerprint(b"beta mod"): (22, 2)}
+
+
+def handler(method, url, params):
+    if url == "/v1/fingerprints":
+        asked = params["fingerprints"]
+        exact = [i for i in asked if i in KNOWN]
+        return {
+            "data": {
+                "isCacheBuilt": True,
+                "exactMatches": [
+                    {
+                        "id": KNOWN[i][1],
+                        "file": make_file(*KNOWN[i], fileFingerprint=i),
+                        "latestFiles": [],
+                    }
+                    for i in exact
+                ],
+                "exactFingerprints": exact,
+                "partialMatches": [],
+                "partialMatchFingerprints": {},
+                "installedFingerprints": asked,
+                "unmatchedFingerprints": [i for i in asked if i not in KNOWN],
+            }
+        }
+    if url == "/v1/fingerprints/fuzzy":
+        assert params["gameId"] == Games.wow
+        return {
+            "data": {
+                "fuzzyMatches": [
+                    {
+                        "id": ADDONS[i["foldername"]],
+                        "file": make_file(
+                            ADDONS[i["foldername"]] * 10, ADDONS[i["foldername"]]
+                        ),
+                        "latestFiles": [],
+                        "fingerprints": i["fingerprints"][:1],
+                    }
+                    for i in params["fingerprints"]
+                    if i["foldername"] in ADDONS
+                ]
+            }
+        }
+    if url == "/v1/mods":
+        return {"data": [make_mod(i) for i in params["modIds"]]}
+    raise LookupError(url)
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.hashed = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.hashed += args
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.fixture
+def mods_dir(tmp_path):
+    for name, data in JARS.items():
+        (tmp_path / name).write_bytes(data)
+    (tmp_path / "readme.txt").write_bytes(b"not a mod")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_scan_directory(mods_dir):
+    factory = FakeFactory(handler)
+    scanner = DirectoryScanner(CurseAPI(factory))
+    result = await scanner.scan_directory(mods_dir)
+
+    a, b, local = (str(mods_dir / i) for i in JARS)
+    assert list(result.fingerprints) == [a, b, local]
+    assert result.files[a].id == 11
+    assert result.files[b].id == 22
+    assert result.mods[b].id == 2
+    assert result.unmatched == [local]
+    assert result.matches.unmatchedFingerprints == [fingerprint(b"dev build")]
+
+
+@pytest.mark.asyncio
+async def test_chunked_matching(mods_dir):
+    factory = FakeFactory(handler)
+    scanner = DirectoryScanner(
+        CurseAPI(factory), executor=ThreadPoolExecutor(2), chunk_size=1
+    )
+    result = await scanner.scan_directory(mods_dir, mods=False)
+
+    posts = [i for i in factory.calls if i[1] == "/v1/fingerprints"]
+    assert len(posts) == 3
+    assert len(result.files) == 2 and result.mods == {}
+    assert sorted(result.matches.exactFingerprints) == sorted(KNOWN)
+    assert len(result.matches.unmatchedFingerprints) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache(mods_dir, tmp_path_factory):
+    path = tmp_path_factory.mktemp("cache") / "fingerprints.json"
+    executor = RecordingExecutor(2)
+    scanner = DirectoryScanner(
+        CurseAPI(FakeFactory(handler)), FingerprintCache(path), executor
+    )
+    await scanner.scan_directory(mods_dir)
+    assert len(FingerprintCache(path)) == 3
+
+    # only the changed file is hashed again
+    jar = mods_dir / "local.jar"
+    jar.write_bytes(b"alpha mod")
+    stat = os.stat(jar)
+    os.utime(jar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    scanner = DirectoryScanner(
+        CurseAPI(FakeFactory(handler)), FingerprintCache(path), executor
+    )
+    result = await scanner.scan_directory(mods_dir)
+    assert executor.hashed == [str(mods_dir / i) for i in JARS] + [str(jar)]
+    assert result.files[str(jar)].id == 11
+
+    # deleted files are dropped
+    os.remove(mods_dir / "b.jar")
+    await scanner.scan_directory(mods_dir)
+    assert len(FingerprintCache(path)) == 2
+
+
+@pytest.mark.asyncio
+async def test_scan_folders(tmp_path):
+    for folder in ("Details", "WeakAuras", "MyAddon"):
+        (tmp_path / folder / "libs").mkdir(parents=True)
+        (tmp_path / folder / f"{folder}.toc").write_bytes(folder.encode())
+        (tmp_path / folder / "libs" / "lib.lua").write_bytes(b"local x = 1")
+    (tmp_path / "Empty").mkdir()
+
+    factory = FakeFactory(handler)
+    scanner = DirectoryScanner(
+        CurseAPI(factory), executor=ThreadPoolExecutor(2), chunk_size=4
+    )
+    result = await scanner.scan_folders(tmp_path, Games.wow)
+
+    details, auras, mine = (
+        str(tmp_path / i) for i in ("Details", "WeakAuras", "MyAddon")
+    )
+    assert list(result.folders) == [details, mine, auras]
+    assert result.folders[details].fingerprints == [
+        fingerprint(b"Details"),
+        fingerprint(b"local x = 1"),
+    ]
+    assert result.matches[details].id == 1
+    assert result.matches[auras].file.modId == 2
+    assert result.unmatched == [mine]
+
+    # two folders of two fingerprints fit a request
+    posts = [i for i in factory.calls if i[1] == "/v1/fingerprints/fuzzy"]
+    assert [len(i[2]["fingerprints"]) for i in posts] == [2, 1]
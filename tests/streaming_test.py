@@ -0,0 +1,144 @@
+from curse_api import CurseAPI, Mod
+from curse_api.clients.aiohttp import AiohttpFactory
+from curse_api.clients.httpx import HttpxFactory
+from curse_api.ext import ModLoaderCatalog
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from curse_api.models import MinecraftModLoaderIndex
+from curse_api.streaming import ArrayItemParser, iter_array
+from conftest import FakeFactory
+from payloads import DATE, make_file, make_mod
+import httpx
+import json
+import pytest
+
+
+def feed_all(body: bytes, size: int):
+    parser = ArrayItemParser()
+    items = []
+    for i in range(0, len(body), size):
+        items += parser.feed(body[i : i + size])
+    return items + parser.close()
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_parser_chunk_boundaries(size: int):
+    doc = {
+        "pagination": {"data": [0]},
+        "note": 'a "data" [string] \\ é',
+        "data": [make_mod(1, summary='esc"aped \\ [{,}] ✓'), 12345, "x", None, {}],
+        "after": {"data": [1]},
+    }
+    assert feed_all(json.dumps(doc).encode(), size) == doc["data"]
+    assert feed_all(json.dumps(doc, indent=2).encode(), size) == doc["data"]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3])
+def test_parser_split_numbers(size: int):
+    body = b'{"data":[1.5, -1e5,12,1.25e-3, 7]}'
+    assert feed_all(body, size) == [1.5, -1e5, 12, 1.25e-3, 7]
+    with pytest.raises(ValueError):
+        feed_all(b'{"data":[1.5 x]}', size)
+
+
+def test_parser_yields_early():
+    parser = ArrayItemParser()
+    assert parser.feed(b'{"data": [{"id": 1}, {"id": 2') == [{"id": 1}]
+    assert parser.feed(b'}], "pagination": {') == [{"id": 2}]
+    assert parser.done
+    assert parser.close() == []
+
+
+def test_parser_incomplete():
+    parser = ArrayItemParser()
+    parser.feed(b'{"data": [{"id": 1}, {"id"')
+    with pytest.raises(ValueError):
+        parser.close()
+
+    with pytest.raises(ValueError):
+        feed_all(b'{"data": [{"id": 1} {"id": 2}]}', 64)
+
+
+@pytest.mark.asyncio
+async def test_iter_array_empty():
+    async def chunks():
+        yield b'{"data": []}'
+
+    assert [i async for i in iter_array(chunks())] == []
+
+
+def loader(i: int):
+    return {
+        "name": f"forge-{i}",
+        "gameVersion": "1.19.2",
+        "latest": i == 0,
+        "recommended": False,
+        "dateModified": DATE,
+        "type": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_api():
+    def handler(method, url, params):
+        if url == "/v1/minecraft/modloader":
+            return {"data": [loader(i) for i in range(30)]}
+        if url == "/v1/mods":
+            return {"data": [make_mod(i) for i in params["modIds"] if i != 4]}
+        return {"data": [make_file(i) for i in params["fileIds"]]}
+
+    factory = FakeFactory(handler)
+    api = CurseAPI(factory)
+    loaders = [i async for i in api.stream_modloader_versions()]
+    assert loaders == [MinecraftModLoaderIndex.from_dict(loader(i)) for i in range(30)]
+
+    with pytest.warns(UserWarning):
+        mods = [i async for i in api.stream_mods([1, 2, 3, 4, 2], chunk_size=2)]
+    assert mods == [Mod.from_dict(make_mod(i)) for i in (1, 2, 3)]
+    assert [c[2] for c in factory.calls[1:]] == [{"modIds": [1, 2]}, {"modIds": [3, 4]}]
+
+    files = [i async for i in api.stream_files([5, 6])]
+    assert [i.id for i in files] == [5, 6]
+
+
+@pytest.mark.asyncio
+async def test_httpx_stream():
+    body = json.dumps({"data": [make_mod(i) for i in range(1, 4)]}).encode()
+
+    def handle(request: httpx.Request):
+        assert json.loads(request.content) == {"modIds": [1, 2, 3]}
+        return httpx.Response(200, content=body)
+
+    factory = HttpxFactory("key")
+    await factory.close()
+    factory._sess = httpx.AsyncClient(
+        base_url="https://api.curseforge.com", transport=httpx.MockTransport(handle)
+    )
+    api = CurseAPI(factory)
+    assert [i.id async for i in api.stream_mods([1, 2, 3])] == [1, 2, 3]
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_stream():
+    loader = {
+        "name": "forge-44.0.0",
+        "gameVersion": "1.19.3",
+        "latest": True,
+        "recommended": False,
+        "dateModified": DATE,
+        "type": 1,
+    }
+
+    async def modloaders(request: web.Request):
+        assert request.query["includeAll"] == "true"
+        return web.json_response({"data": [loader] * 3})
+
+    app = web.Application()
+    app.router.add_get("/v1/minecraft/modloader", modloaders)
+    async with TestServer(app) as server:
+        api = CurseAPI(AiohttpFactory("key", base_url=str(server.make_url(""))))
+        streamed = [i async for i in api.stream_modloader_versions()]
+        assert [i.name for i in streamed] == ["forge-44.0.0"] * 3
+        assert len(await ModLoaderCatalog(api).find("1.19.3")) == 3
+        await api.close()
@@ -0,0 +1,68 @@
+from curse_api import CurseAPI, Mod
+from curse_api.tables import FileTable, ModTable
+from conftest import FakeFactory
+from payloads import make_file, make_mod
+import pytest
+
+
+def test_columns():
+    table = ModTable(make_mod(i, classId=None if i == 3 else 6) for i in range(1, 6))
+    assert len(table) == 5
+    assert table.column("downloadCount").typecode == "q"
+    assert list(table.column("downloadCount")) == [100, 200, 300, 400, 500]
+
+    row = table[2]
+    assert row.id == 3 and row.slug == "mod-3"
+    assert row.classId is None, "Null was not restored"
+    assert row.dateModified == Mod.from_dict(make_mod(3)).dateModified
+    assert table[-1].id == 5
+
+
+def test_strings_interned():
+    table = FileTable(make_file(i, displayName="same") for i in range(2))
+    a, b = table.column("displayName")
+    assert a is b
+
+
+def test_models_round_trip():
+    data = [make_mod(i) for i in range(1, 4)]
+    table = ModTable(data)
+    assert table[0].raw() == data[0]
+    assert table[1].model() == Mod.from_dict(data[1])
+    assert table.models() == [Mod.from_dict(i) for i in data]
+
+
+def test_filter_and_sort():
+    table = ModTable(make_mod(i, downloadCount=(i * 7) % 5) for i in range(1, 6))
+    assert [i.id for i in table.sort("downloadCount", reverse=True)] == [2, 4, 1, 3, 5]
+    assert [i.id for i in table.top("downloadCount", 2)] == [2, 4]
+    assert [i.id for i in table.where("downloadCount", lambda v: v >= 2)] == [1, 2, 4]
+    assert table.find(4).downloadCount == 3  # type: ignore
+    assert table.find(42) is None
+
+    copied = ModTable(table.where("id", lambda v: v > 3))
+    assert [i.id for i in copied] == [4, 5], "Rows were not copied"
+
+
+@pytest.mark.asyncio
+async def test_api_tables():
+    def handler(method, url, params):
+        if method == "POST":
+            return {"data": [make_file(i) for i in params["fileIds"]]}
+        return {
+            "data": [make_mod(i) for i in range(1, 4)],
+            "pagination": {
+                "index": 0,
+                "pageSize": 3,
+                "resultCount": 3,
+                "totalCount": 3,
+            },
+        }
+
+    api = CurseAPI(FakeFactory(handler))
+    mods, page = await api.search_mods(table=True)
+    assert isinstance(mods, ModTable) and page.totalCount == 3
+    files = await api.get_files([3, 1, 2], table=True)
+    assert isinstance(files, FileTable)
+    assert list(files.column("id")) == [3, 1, 2]
+    assert [i.id async for i in api.iter_search_mods(table=True)] == [1, 2, 3]
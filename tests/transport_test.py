@@ -0,0 +1,33 @@
+from curse_api import SimpleCurseAPI
+from curse_api.clients.aiohttp import AiohttpFactory
+from curse_api.clients.httpx import HttpxFactory
+from curse_api.transport import TransportConfig
+import importlib.util
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport():
+    config = TransportConfig(
+        max_connections=300, max_connections_per_host=50, dns_cache_ttl=60
+    )
+    async with SimpleCurseAPI("key", AiohttpFactory, transport=config) as api:
+        connector = api.api.session.connector  # type: ignore
+        assert (connector.limit, connector.limit_per_host) == (300, 50)
+        assert connector.use_dns_cache
+
+
+@pytest.mark.asyncio
+async def test_httpx_transport():
+    config = TransportConfig(max_connections=300, keepalive_expiry=30)
+    assert HttpxFactory._limits(config).max_connections == 300
+    assert HttpxFactory._limits(TransportConfig()).max_keepalive_connections == 20
+
+    async with SimpleCurseAPI("key", HttpxFactory, transport=config):
+        pass
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 installed")
+def test_http2_requires_h2():
+    with pytest.raises(Exception, match="h2"):
+        HttpxFactory("key", transport=TransportConfig(http2=True))
@@ -0,0 +1,98 @@
+from curse_api import CurseAPI
+from curse_api.ext import MinecraftVersionIndex
+from curse_api.ext.versions import version_key
+from curse_api.models import File, MinecraftGameVersion
+from conftest import FakeFactory
+from payloads import DATE, make_file
+import pytest
+
+VERSIONS = ["1.7.10", "1.12.2", "1.16", "1.16.5", "1.19.2", "1.20", "1.20.1", "1.9"]
+
+
+def game_version(i: int, version: str, approved: bool = True):
+    return {
+        "id": i,
+        "gameVersionId": i,
+        "versionString": version,
+        "jarDownloadUrl": "",
+        "jsonDownloadUrl": "",
+        "approved": approved,
+        "dateModified": DATE,
+        "gameVersionTypeId": 1,
+        "gameVersionStatus": 1,
+        "gameVersionTypeStatus": 1,
+    }
+
+
+@pytest.fixture
+def index():
+    versions = [game_version(i, v, v != "1.20.1") for i, v in enumerate(VERSIONS)]
+    return MinecraftVersionIndex(
+        versions=[MinecraftGameVersion.from_dict(i) for i in versions]
+    )
+
+
+def strings(versions):
+    return [i.versionString for i in versions]
+
+
+def test_version_key():
+    assert version_key("1.9") < version_key("1.12.2") < version_key("1.12.10")  # type: ignore
+    assert version_key("0000000001.0000000019.0000000002") == version_key("1.19.2")
+    assert version_key("Forge") is None
+    # snapshots and pre-releases are not the release they start with
+    for i in ("1.20-Snapshot", "1.19.3-pre1", "1.20-rc1", "23w05a"):
+        assert version_key(i) is None, i
+    assert version_key(" 1.20 ") == version_key("1.20")
+
+
+def test_ordering(index: MinecraftVersionIndex):
+    assert strings(index) == [
+        "1.7.10",
+        "1.9",
+        "1.12.2",
+        "1.16",
+        "1.16.5",
+        "1.19.2",
+        "1.20",
+        "1.20.1",
+    ]
+    assert index.compare("1.9", "1.12.2") == -1
+    assert index.newest().versionString == "1.20"  # type: ignore
+    assert index.newest(approved=False).versionString == "1.20.1"  # type: ignore
+
+
+def test_ranges(index: MinecraftVersionIndex):
+    assert strings(index.between("1.16", "1.20")) == [
+        "1.16",
+        "1.16.5",
+        "1.19.2",
+        "1.20",
+        "1.20.1",
+    ]
+    assert strings(index.between("1.10", "1.17")) == ["1.12.2", "1.16", "1.16.5"]
+    assert strings(index.at_least("1.19.2")) == ["1.19.2", "1.20", "1.20.1"]
+    assert strings(index.between(high="1.9")) == ["1.7.10", "1.9"]
+    with pytest.raises(ValueError):
+        index.between("Forge")
+
+
+def test_file_compatibility(index: MinecraftVersionIndex):
+    file = File.from_dict(make_file(1, gameVersions=["Forge", "1.16.5", "1.17.1"]))
+    assert index.is_compatible(file, minimum="1.16")
+    assert index.is_compatible(file, minimum="1.17")
+    assert not index.is_compatible(file, minimum="1.18")
+    assert not index.is_compatible(file, maximum="1.12.2")
+    assert index.file_versions(file) == [version_key("1.16.5"), version_key("1.17.1")]
+
+    snapshot = File.from_dict(make_file(2, gameVersions=["1.20-Snapshot", "23w05a"]))
+    assert not index.is_compatible(snapshot, minimum="1.20")
+    assert index.file_versions(snapshot) == []
+
+
+@pytest.mark.asyncio
+async def test_load():
+    factory = FakeFactory(lambda *_: {"data": [game_version(1, "1.19.2")]})
+    index = await MinecraftVersionIndex(CurseAPI(factory)).load()
+    await index.load()
+    assert "1.19.2" in index and len(factory.calls) == 1